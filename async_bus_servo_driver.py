@@ -0,0 +1,203 @@
+import asyncio
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from bus_servo_driver import ServoTimeoutError
+from latency_model import LatencyModel
+from transport.async_serial import AsyncSerialTransport
+from protocol.serializer import PacketSerializer
+from protocol.deserializer import PacketDeserializer
+from protocol.protocol import ServoProtocol, ServoPacket, StatusReturnLevel
+from protocol.packet_decoder import PacketDecoder, ServoState
+
+
+class AsyncServoBusDriver:
+    """
+    asyncio counterpart of ``ServoBusDriver``.
+
+    Received bytes are fed to the deserializer straight from the event loop.
+    The bus is half-duplex, so transactions are serialised with an
+    ``asyncio.Lock``: any number of coroutines may call into the driver
+    concurrently and simply queue for the bus.
+
+    Calls made without an explicit timeout take their deadline and number of
+    attempts from ``latency_model``, as in ``ServoBusDriver``; round trips are
+    measured from the moment the request is sent, not from when the caller
+    started queueing for the bus.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int,
+        *,
+        transport: Optional[AsyncSerialTransport] = None,
+        protocol: Optional[ServoProtocol] = None,
+        serializer: Optional[PacketSerializer] = None,
+        deserializer: Optional[PacketDeserializer] = None,
+        status_return_level: StatusReturnLevel = StatusReturnLevel.ALL,
+        latency_model: Optional[LatencyModel] = None,
+    ):
+        self.transport = transport or AsyncSerialTransport(port, baudrate)
+        self.protocol = protocol or ServoProtocol()
+        self.serializer = serializer or PacketSerializer()
+        self.deserializer = deserializer or PacketDeserializer()
+        self._decoder = PacketDecoder()
+        self.status_return_level = status_return_level
+        line_rate = getattr(self.transport, "baudrate", None) or baudrate
+        self.latency_model = latency_model or LatencyModel(line_rate)
+
+        self._bus_lock = asyncio.Lock()
+        # (servo_id, payload size, future) of the transaction on the bus
+        self._waiter: Optional[Tuple[int, int, "asyncio.Future[ServoPacket]"]] = None
+
+    async def connect(self):
+        self.transport.set_receiver(self._on_data)
+        await self.transport.open()
+
+    async def disconnect(self):
+        await self.transport.close()
+        self.transport.set_receiver(None)
+
+    async def execute(
+        self, packet: ServoPacket, timeout: Optional[float] = None
+    ) -> Optional[ServoPacket]:
+        """
+        Send ``packet`` and wait for the servo's status frame.
+
+        With ``timeout=None`` the deadline and the number of attempts come
+        from ``latency_model``; an explicit timeout means a single attempt.
+        """
+        return await self._execute(packet, timeout)
+
+    async def _execute(
+        self,
+        packet: ServoPacket,
+        timeout: Optional[float],
+        *,
+        trusted: bool = False,
+    ) -> Optional[ServoPacket]:
+        if not self.protocol.expects_reply(packet, self.status_return_level):
+            async with self._bus_lock:
+                self._send(packet, trusted=trusted)
+            return None
+
+        model = self.latency_model
+        attempts = 1
+        if timeout is None:
+            attempts = model.attempts(packet.servo_id, packet.instruction)
+
+        for attempt in range(attempts):
+            try:
+                return await self._transact(packet, timeout, trusted=trusted)
+            except ServoTimeoutError:
+                model.stats.timeouts += 1
+                if attempt + 1 == attempts:
+                    raise
+                model.stats.retries += 1
+
+    async def _transact(
+        self, packet: ServoPacket, timeout: Optional[float], *, trusted: bool
+    ) -> ServoPacket:
+        overhead = self.protocol.STATUS_FRAME_OVERHEAD
+        size = self.protocol.response_length(packet) - overhead
+
+        async with self._bus_lock:
+            # Decided once the bus is ours, from the model's latest estimate.
+            limit = self._timeout_for(packet) if timeout is None else timeout
+            future = asyncio.get_running_loop().create_future()
+            self._waiter = (packet.servo_id, size, future)
+            try:
+                start = time.monotonic()
+                self._send(packet, trusted=trusted)
+                reply = await asyncio.wait_for(future, limit)
+            except asyncio.TimeoutError:
+                raise ServoTimeoutError("No response from servo") from None
+            finally:
+                self._waiter = None
+
+        self.latency_model.observe(packet.servo_id, time.monotonic() - start)
+        return reply
+
+    def _timeout_for(self, packet: ServoPacket) -> float:
+        return self.latency_model.timeout(
+            packet.servo_id,
+            self.protocol.request_length(packet),
+            self.protocol.response_length(packet),
+        )
+
+    def _send(self, packet: ServoPacket, *, trusted: bool = False):
+        self.transport.send(self.serializer.serialize(packet, trusted=trusted))
+
+    def _on_data(self, data: bytes):
+        for rx in self.deserializer.feed(data):
+            if self._waiter is None:
+                continue
+
+            servo_id, size, future = self._waiter
+            if rx.servo_id == servo_id and len(rx.params) == size and not future.done():
+                future.set_result(rx)
+
+    async def go_to_position(
+        self,
+        servo_id: int,
+        position: int,
+        *,
+        speed: int = 1000,
+        acc: int = 50,
+        timeout: Optional[float] = None,
+    ) -> Optional[ServoPacket]:
+        pkt = self.protocol.write_absolute_move(
+            servo_id,
+            position=position,
+            speed=speed,
+            acc=acc,
+        )
+        return await self._execute(pkt, timeout, trusted=True)
+
+    async def go_to_positions(self, targets: Dict[int, Tuple[int, int, int]]) -> None:
+        await self._execute(self.protocol.sync_write_absolute_move(targets), 0.0)
+
+    async def get_position(self, servo_id: int) -> int:
+        return await self._read_and_decode(
+            self.protocol.read_position(servo_id), self._decoder.position
+        )
+
+    async def get_speed(self, servo_id: int) -> int:
+        return await self._read_and_decode(
+            self.protocol.read_speed(servo_id), self._decoder.speed
+        )
+
+    async def get_temperature(self, servo_id: int) -> int:
+        return await self._read_and_decode(
+            self.protocol.read_temperature(servo_id), self._decoder.temperature
+        )
+
+    async def get_voltage(self, servo_id: int) -> float:
+        return await self._read_and_decode(
+            self.protocol.read_voltage(servo_id), self._decoder.voltage
+        )
+
+    async def get_load(self, servo_id: int) -> int:
+        return await self._read_and_decode(
+            self.protocol.read_load(servo_id), self._decoder.load
+        )
+
+    async def get_current(self, servo_id: int) -> int:
+        return await self._read_and_decode(
+            self.protocol.read_current(servo_id), self._decoder.current
+        )
+
+    async def read_state(self, servo_id: int) -> ServoState:
+        return await self._read_and_decode(
+            self.protocol.read_state(servo_id), self._decoder.state
+        )
+
+    async def _read_and_decode(
+        self,
+        request: ServoPacket,
+        decode_fn: Callable[[ServoPacket], object],
+        timeout: Optional[float] = None,
+    ):
+        packet = await self._execute(request, timeout, trusted=True)
+        return decode_fn(packet)
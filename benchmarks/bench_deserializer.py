@@ -0,0 +1,124 @@
+"""
+Compare PacketDeserializer throughput against the former per-byte state machine.
+
+    python benchmarks/bench_deserializer.py --frames 20000
+"""
+
+import argparse
+import enum
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from protocol.deserializer import PacketDeserializer  # noqa: E402
+from protocol.protocol import ServoPacket  # noqa: E402
+
+
+class _State(enum.Enum):
+    WAIT_HEADER_1 = enum.auto()
+    WAIT_HEADER_2 = enum.auto()
+    WAIT_ID = enum.auto()
+    WAIT_LENGTH = enum.auto()
+    WAIT_PAYLOAD = enum.auto()
+    WAIT_CHECKSUM = enum.auto()
+
+
+class ByteStateDeserializer:
+    """The per-byte ``match`` state machine PacketDeserializer used to run."""
+
+    def __init__(self):
+        self._state = _State.WAIT_HEADER_1
+        self._buffer = bytearray()
+        self._remaining = 0
+
+    def feed(self, data):
+        packets = []
+        for byte in data:
+            packet = self._process_byte(byte)
+            if packet is not None:
+                packets.append(packet)
+        return packets
+
+    def _process_byte(self, byte):
+        match self._state:
+            case _State.WAIT_HEADER_1:
+                if byte == 0xFF:
+                    self._buffer.clear()
+                    self._buffer.append(byte)
+                    self._state = _State.WAIT_HEADER_2
+            case _State.WAIT_HEADER_2:
+                if byte == 0xFF:
+                    self._buffer.append(byte)
+                    self._state = _State.WAIT_ID
+                else:
+                    self._state = _State.WAIT_HEADER_1
+            case _State.WAIT_ID:
+                self._buffer.append(byte)
+                self._state = _State.WAIT_LENGTH
+            case _State.WAIT_LENGTH:
+                if byte < 2 or byte > 64:
+                    self._reset()
+                else:
+                    self._buffer.append(byte)
+                    self._remaining = byte - 1
+                    self._state = _State.WAIT_PAYLOAD
+            case _State.WAIT_PAYLOAD:
+                self._buffer.append(byte)
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._state = _State.WAIT_CHECKSUM
+            case _State.WAIT_CHECKSUM:
+                self._buffer.append(byte)
+                frame = bytes(self._buffer)
+                self._reset()
+                if frame[-1] == (~sum(frame[2:-1])) & 0xFF:
+                    return ServoPacket(frame[2], frame[4], frame[5:-1])
+        return None
+
+    def _reset(self):
+        self._state = _State.WAIT_HEADER_1
+        self._buffer.clear()
+        self._remaining = 0
+
+
+def build_stream(frames: int) -> bytes:
+    stream = bytearray()
+    for i in range(frames):
+        body = bytes([i % 12 + 1, 17, 0x00]) + bytes(range(15))
+        stream += b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+    return bytes(stream)
+
+
+def measure(factory, stream: bytes, chunk: int, frames: int) -> float:
+    deserializer = factory()
+    start = time.perf_counter()
+    count = 0
+    for i in range(0, len(stream), chunk):
+        count += len(deserializer.feed(stream[i : i + chunk]))
+    elapsed = time.perf_counter() - start
+    assert count == frames, (count, frames)
+    return len(stream) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1, 16, 64, 4096])
+    args = parser.parse_args()
+
+    stream = build_stream(args.frames)
+    print(f"{args.frames} frames, {len(stream)} bytes")
+    print(f"{'chunk':>6} {'state machine':>16} {'scanner':>16} {'speedup':>8}")
+    for chunk in args.chunks:
+        legacy = measure(ByteStateDeserializer, stream, chunk, args.frames)
+        scanner = measure(PacketDeserializer, stream, chunk, args.frames)
+        print(
+            f"{chunk:>6} {legacy / 1e6:>12.2f} MB/s {scanner / 1e6:>12.2f} MB/s"
+            f" {scanner / legacy:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare SYNC WRITE against a per-servo ``go_to_position`` loop.
+
+Runs against a loopback transport that acknowledges every non-broadcast
+frame immediately, so wall time measures host-side cost only. Wire time is
+estimated from the bytes exchanged at the given baud rate (10 bits per byte).
+
+    python benchmarks/bench_sync_write.py --servos 12 --iterations 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bus_servo_driver import ServoBusDriver  # noqa: E402
+from protocol.protocol import DeviceID  # noqa: E402
+
+BITS_PER_BYTE = 10
+
+
+class LoopbackTransport:
+    def __init__(self):
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+        self._pending = bytearray()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, data: bytes):
+        self.tx_bytes += len(data)
+        servo_id = data[2]
+        if servo_id != DeviceID.BROADCAST:
+            body = bytes([servo_id, 2, 0x00])
+            self._pending += b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+
+    def receive(self, max_bytes: int = 64) -> bytes:
+        chunk = bytes(self._pending[:max_bytes])
+        del self._pending[:max_bytes]
+        self.rx_bytes += len(chunk)
+        return chunk
+
+    def receive_exact(self, size: int, timeout: float) -> bytes:
+        return self.receive(size)
+
+
+def run(name, fn, transport, iterations, baudrate):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+
+    wire_bytes = (transport.tx_bytes + transport.rx_bytes) / iterations
+    wire_ms = wire_bytes * BITS_PER_BYTE / baudrate * 1e3
+    host_us = elapsed / iterations * 1e6
+    print(
+        f"{name:<12} {wire_bytes:>8.0f} B/cycle {wire_ms:>8.3f} ms wire"
+        f" {host_us:>10.1f} us host"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servos", type=int, default=12)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--baudrate", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    targets = {servo_id: (2048, 1000, 50) for servo_id in range(1, args.servos + 1)}
+
+    loop_transport = LoopbackTransport()
+    loop_driver = ServoBusDriver("loopback", args.baudrate, transport=loop_transport)
+
+    def per_servo():
+        for servo_id, (position, speed, acc) in targets.items():
+            loop_driver.go_to_position(servo_id, position, speed=speed, acc=acc)
+
+    sync_transport = LoopbackTransport()
+    sync_driver = ServoBusDriver("loopback", args.baudrate, transport=sync_transport)
+
+    def sync():
+        sync_driver.go_to_positions(targets)
+
+    print(f"{args.servos} servos @ {args.baudrate} baud, {args.iterations} cycles")
+    run("per-servo", per_servo, loop_transport, args.iterations, args.baudrate)
+    run("sync-write", sync, sync_transport, args.iterations, args.baudrate)
+
+
+if __name__ == "__main__":
+    main()
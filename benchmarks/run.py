@@ -0,0 +1,350 @@
+"""
+Benchmark suite for the protocol stack and ServoBusDriver.
+
+Each benchmark is run ``--repeat`` times for at least ``--min-time`` seconds
+and the best rate is reported. ``--json`` writes machine-readable results so
+runs can be compared across releases.
+
+    python benchmarks/run.py --json bench_output.json
+    python benchmarks/run.py --filter deserialize
+    python benchmarks/run.py --compare bench_output.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bus_servo_driver import ServoBusDriver  # noqa: E402
+from bus_servo_pool import ServoBusPool  # noqa: E402
+from protocol.batch_decoder import BatchDecoder  # noqa: E402
+from protocol.deserializer import PacketDeserializer  # noqa: E402
+from protocol.packet_decoder import PacketDecoder  # noqa: E402
+from protocol.protocol import ServoPacket, ServoProtocol  # noqa: E402
+from protocol.registers import ReadPlanner  # noqa: E402
+from protocol.serializer import PacketSerializer  # noqa: E402
+from transport.capture import CaptureReader, CaptureWriter, Direction  # noqa: E402
+from transport.simulator import SimulatedTransport  # noqa: E402
+
+# A benchmark body runs one batch and returns how many operations it did.
+Batch = Callable[[], int]
+
+BENCHMARKS: Dict[str, Callable[[], Batch]] = {}
+
+
+def benchmark(name: str, unit: str = "ops"):
+    def register(factory: Callable[[], Batch]):
+        factory.unit = unit
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+def status_frame(servo_id: int, params: bytes) -> bytes:
+    body = bytes([servo_id, len(params) + 2, 0]) + params
+    return b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+
+
+STATE_PARAMS = bytes([0x00, 0x08, 0x10, 0x80, 0x20, 0, 121, 35, 0, 0, 1, 0, 0, 5, 0])
+TELEMETRY_STREAM = b"".join(status_frame(i % 12 + 1, STATE_PARAMS) for i in range(1000))
+
+
+@benchmark("serialize/read_position/uncached", "frames")
+def _serialize_uncached() -> Batch:
+    serializer = PacketSerializer(cache_size=0)
+    packets = [ServoProtocol().read_position(i % 12 + 1) for i in range(1000)]
+
+    def run():
+        for packet in packets:
+            serializer.serialize(packet)
+        return len(packets)
+
+    return run
+
+
+@benchmark("serialize/read_position/cached", "frames")
+def _serialize_cached() -> Batch:
+    serializer = PacketSerializer()
+    packets = [ServoProtocol().read_position(i % 12 + 1) for i in range(1000)]
+
+    def run():
+        for packet in packets:
+            serializer.serialize(packet)
+        return len(packets)
+
+    return run
+
+
+@benchmark("serialize/absolute_move/trusted", "frames")
+def _serialize_trusted() -> Batch:
+    serializer = PacketSerializer(cache_size=0)
+    protocol = ServoProtocol()
+    packets = [
+        protocol.write_absolute_move(i % 12 + 1, i % 4096, speed=1000, acc=50)
+        for i in range(1000)
+    ]
+
+    def run():
+        for packet in packets:
+            serializer.serialize(packet, trusted=True)
+        return len(packets)
+
+    return run
+
+
+def _deserialize(chunk: int) -> Callable[[], Batch]:
+    def factory() -> Batch:
+        stream = TELEMETRY_STREAM
+        chunks = [stream[i : i + chunk] for i in range(0, len(stream), chunk)]
+
+        def run():
+            deserializer = PacketDeserializer()
+            count = 0
+            for data in chunks:
+                count += len(deserializer.feed(data))
+            return count
+
+        return run
+
+    return factory
+
+
+for _chunk in (1, 16, 64, 4096):
+    benchmark(f"deserialize/chunk={_chunk}", "frames")(_deserialize(_chunk))
+
+
+@benchmark("decode/position", "packets")
+def _decode_position() -> Batch:
+    packets = [ServoPacket(1, 0, bytes([i & 0xFF, 0x08])) for i in range(1000)]
+    decode = PacketDecoder.position
+
+    def run():
+        for packet in packets:
+            decode(packet)
+        return len(packets)
+
+    return run
+
+
+@benchmark("decode/state", "packets")
+def _decode_state() -> Batch:
+    packets = PacketDeserializer().feed(TELEMETRY_STREAM)
+    decode = PacketDecoder.state
+
+    def run():
+        for packet in packets:
+            decode(packet)
+        return len(packets)
+
+    return run
+
+
+@benchmark("decode/positions/batch", "packets")
+def _decode_positions_batch() -> Batch:
+    packets = [ServoPacket(1, 0, bytes([i & 0xFF, 0x08])) for i in range(1000)]
+    decode = BatchDecoder.positions
+
+    def run():
+        return len(decode(packets))
+
+    return run
+
+
+@benchmark("decode/states/batch", "packets")
+def _decode_states_batch() -> Batch:
+    packets = PacketDeserializer().feed(TELEMETRY_STREAM)
+    decode = BatchDecoder.states
+
+    def run():
+        return len(decode(packets))
+
+    return run
+
+
+@benchmark("decode/states/buffer", "packets")
+def _decode_states_buffer() -> Batch:
+    buffer = STATE_PARAMS * 1000
+    decode = BatchDecoder.states
+
+    def run():
+        return len(decode(buffer))
+
+    return run
+
+
+@benchmark("decode/planner_range", "packets")
+def _decode_planner() -> Batch:
+    (read_range,) = ReadPlanner().plan(["position", "speed", "load", "current"])
+    params = [bytes(read_range.size) for _ in range(1000)]
+
+    def run():
+        for data in params:
+            read_range.decode(data)
+        return len(params)
+
+    return run
+
+
+def _capture_file(chunk: int) -> str:
+    """Capture of TELEMETRY_STREAM as RX chunks of ``chunk`` bytes, 10x over."""
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-capture-"), "bus.cap")
+    writer = CaptureWriter(path)
+    for _ in range(10):
+        for i in range(0, len(TELEMETRY_STREAM), chunk):
+            writer.write(Direction.RX, TELEMETRY_STREAM[i : i + chunk])
+    writer.close()
+    return path
+
+
+@benchmark("replay/packets/chunk=21", "frames")
+def _replay_packets() -> Batch:
+    path = _capture_file(21)
+
+    def run():
+        with CaptureReader(path) as reader:
+            return sum(1 for _ in reader.packets())
+
+    return run
+
+
+@benchmark("replay/packet_batches/chunk=21", "frames")
+def _replay_batches() -> Batch:
+    path = _capture_file(21)
+
+    def run():
+        with CaptureReader(path) as reader:
+            return sum(len(batch) for batch in reader.packet_batches())
+
+    return run
+
+
+def _driver(realtime: bool) -> ServoBusDriver:
+    transport = SimulatedTransport(range(1, 13), realtime=realtime)
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+@benchmark("driver/get_position/host", "transactions")
+def _driver_host() -> Batch:
+    driver = _driver(realtime=False)
+
+    def run():
+        for servo_id in range(1, 13):
+            driver.get_position(servo_id)
+        return 12
+
+    return run
+
+
+@benchmark("driver/get_position/1Mbaud", "transactions")
+def _driver_wire() -> Batch:
+    driver = _driver(realtime=True)
+
+    def run():
+        for servo_id in range(1, 13):
+            driver.get_position(servo_id)
+        return 12
+
+    return run
+
+
+@benchmark("driver/sync_read_position/1Mbaud", "servo_reads")
+def _driver_sync_read() -> Batch:
+    driver = _driver(realtime=True)
+    ids = list(range(1, 13))
+
+    def run():
+        driver.sync_read(ids, 56, 2)
+        return len(ids)
+
+    return run
+
+
+def _pool(buses: int) -> Callable[[], Batch]:
+    def factory() -> Batch:
+        drivers = {}
+        registry = {}
+        for bus in range(buses):
+            ids = range(bus * 20 + 1, bus * 20 + 13)
+            transport = SimulatedTransport(ids, realtime=True)
+            drivers[f"bus{bus}"] = ServoBusDriver(
+                f"bus{bus}", transport.baudrate, transport=transport
+            )
+            registry.update({servo_id: f"bus{bus}" for servo_id in ids})
+        pool = ServoBusPool(drivers, registry)
+        ids = list(registry)
+
+        def run():
+            pool.read_states(ids)
+            return len(ids)
+
+        return run
+
+    return factory
+
+
+for _buses in (1, 2, 4):
+    benchmark(f"pool/read_state/buses={_buses}", "servo_reads")(_pool(_buses))
+
+
+def measure(batch: Batch, min_time: float, repeat: int) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        ops = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            ops += batch()
+            elapsed = time.perf_counter() - start
+        best = max(best, ops / elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filter", default="", help="substring of benchmark names")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = {}
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = {r["name"]: r["rate"] for r in json.load(fp)["results"]}
+
+    results: List[dict] = []
+    for name, factory in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        rate = measure(factory(), args.min_time, args.repeat)
+        results.append({"name": name, "rate": rate, "unit": f"{factory.unit}/s"})
+        line = f"{name:<40} {rate:>14,.0f} {factory.unit}/s"
+        if name in baseline:
+            line += f"  {rate / baseline[name]:>6.2f}x"
+        print(line)
+
+    if args.json:
+        report = {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.json, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+
+if __name__ == "__main__":
+    main()
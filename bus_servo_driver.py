@@ -1,12 +1,34 @@
+from collections import defaultdict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Deque, Dict, Iterable, Optional, List, Tuple, Union
+import logging
+import threading
 import time
 
-from transport.serial import SerialTransport
+from transport.serial import AUTOBAUD_ORDER, SerialTransport
 from protocol.serializer import PacketSerializer
 from protocol.deserializer import PacketDeserializer
-from protocol.protocol import ServoProtocol, ServoPacket
-from protocol.packet_decoder import PacketDecoder
+from protocol.protocol import (
+    DeviceID,
+    Instruction,
+    ServoProtocol,
+    ServoPacket,
+    StatusReturnLevel,
+)
+from protocol.packet_decoder import PacketDecoder, ServoState
+from protocol.registers import ReadPlanner
+from register_shadow import RegisterShadow
+from instrumentation import Instrumentation, TransactionTrace
+from latency_model import LatencyModel
+from device_registry import DEVICE_FIELDS, DeviceInfo, DeviceRegistry
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Extra wait on a reader future past its own deadline before giving up on it:
+# a backstop in case the reader stalls without failing the future.
+READER_GRACE = 1.0
 
 
 class ServoTimeoutError(Exception):
@@ -24,6 +46,32 @@ class ServoStatus:
     params: List[int]
 
 
+@dataclass(frozen=True)
+class SyncReadResult:
+    """Status packets collected by a SYNC READ, keyed by servo id."""
+
+    packets: Dict[int, ServoPacket]
+    missing: Tuple[int, ...]
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+    def __getitem__(self, servo_id: int) -> ServoPacket:
+        try:
+            return self.packets[servo_id]
+        except KeyError:
+            raise ServoTimeoutError(f"No response from servo {servo_id}") from None
+
+
+@dataclass(frozen=True)
+class _PendingResponse:
+    size: int
+    deadline: float
+    future: "Future[ServoPacket]"
+    trace: Optional[TransactionTrace] = None
+
+
 class ServoBusDriver:
     def __init__(
         self,
@@ -34,36 +82,696 @@ class ServoBusDriver:
         protocol: Optional[ServoProtocol] = None,
         serializer: Optional[PacketSerializer] = None,
         deserializer: Optional[PacketDeserializer] = None,
+        planner: Optional[ReadPlanner] = None,
+        status_return_level: StatusReturnLevel = StatusReturnLevel.ALL,
+        shadow: Optional[RegisterShadow] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        latency_model: Optional[LatencyModel] = None,
     ):
         self.transport = transport or SerialTransport(port=port, baudrate=baudrate)
         self.protocol = protocol or ServoProtocol()
         self.serializer = serializer or PacketSerializer()
         self.deserializer = deserializer or PacketDeserializer()
+        self.planner = planner or ReadPlanner()
+        # Mirror of the servos' STATUS_RETURN_LEVEL: which requests get a reply.
+        self.status_return_level = status_return_level
+        # Optional register mirror: serves cached reads, drops redundant writes.
+        self.shadow = shadow
+        # Optional tracing; None keeps the hot paths free of timestamping.
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.bind(self.deserializer.stats)
+        # Derives timeouts and retries for calls made without an explicit timeout.
+        # An injected transport may run at another rate than ``baudrate``.
+        line_rate = getattr(self.transport, "baudrate", None) or baudrate
+        self.latency_model = latency_model or LatencyModel(line_rate)
         self._decoder = PacketDecoder()
 
+        # Guards _pending and the transport's write side once the reader runs.
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Deque[_PendingResponse]] = defaultdict(deque)
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+        # Set when the reader exits on a transport error; cleared by restarting.
+        self._reader_error: Optional[BaseException] = None
+        self._rx_started_ns = 0
+
     def connect(self):
         self.transport.open()
 
     def disconnect(self):
+        self.stop_reader()
         self.transport.close()
 
-    def execute(self, packet: ServoPacket, timeout: float):
-        raw = self.serializer.serialize(packet)
-        self.transport.send(raw)
+    @property
+    def reader_running(self) -> bool:
+        return self._reader is not None
 
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            data = self.transport.receive(64)
-            if not data:
+    def start_reader(self):
+        """
+        Hand the receive side of the transport to a background thread.
+
+        While the reader runs, responses are dispatched to the futures returned
+        by ``submit`` and every blocking call (``execute``, ``get_*``,
+        ``sync_read`` ...) goes through it, so several threads may share the
+        bus safely.
+        """
+        if self._reader is not None:
+            return
+
+        self._reader_error = None
+        self._reader_stop.clear()
+        self._reader = threading.Thread(
+            target=self._reader_loop, name="servo-bus-reader", daemon=True
+        )
+        self._reader.start()
+
+    def stop_reader(self):
+        self._reader_error = None
+        reader = self._reader
+        if reader is None:
+            return
+
+        self._reader_stop.set()
+        reader.join()
+        self._reader = None
+
+        self._fail_pending(None)
+
+    def _use_reader(self) -> bool:
+        """Whether calls go through the reader; raises if it died on an error."""
+        if self._reader is not None:
+            return True
+        if self._reader_error is not None:
+            raise RuntimeError(
+                "Background reader stopped on a transport error"
+            ) from self._reader_error
+        return False
+
+    def _fail_pending(self, exc: Optional[BaseException]):
+        with self._lock:
+            abandoned = [entry for queue in self._pending.values() for entry in queue]
+            self._pending.clear()
+
+        for entry in abandoned:
+            self._finish_failed(entry)
+            if exc is None:
+                entry.future.cancel()
+            else:
+                entry.future.set_exception(exc)
+
+    def submit(
+        self,
+        packet: ServoPacket,
+        timeout: Optional[float] = None,
+        *,
+        trusted: bool = False,
+    ) -> "Future[ServoPacket]":
+        """
+        Send ``packet`` and return a future resolved with the servo's response.
+
+        Responses are matched by servo id and expected payload size in request
+        order. The future fails with ``ServoTimeoutError`` after ``timeout``
+        (by default, the latency model's timeout for this servo).
+        Requests that get no reply (broadcast, or writes under
+        ``StatusReturnLevel.READ_ONLY``) resolve to ``None`` once sent.
+        Requires ``start_reader``.
+        """
+        if not self._use_reader():
+            raise RuntimeError("Background reader is not running")
+
+        if not self._expects_reply(packet):
+            with self._lock:
+                self._send(packet, trusted=trusted)
+            done: "Future[ServoPacket]" = Future()
+            done.set_result(None)
+            return done
+
+        overhead = self.protocol.STATUS_FRAME_OVERHEAD
+        size = self.protocol.response_length(packet) - overhead
+        if timeout is None:
+            timeout = self._timeout_for(packet)
+        future: "Future[ServoPacket]" = Future()
+        trace = self._begin_trace(packet)
+        with self._lock:
+            # The reader may have died since the check above.
+            if not self._use_reader():
+                raise RuntimeError("Background reader is not running")
+            self._pending[packet.servo_id].append(
+                _PendingResponse(size, time.monotonic() + timeout, future, trace)
+            )
+            self._send(packet, trusted=trusted, trace=trace)
+        return future
+
+    def _reader_loop(self):
+        while not self._reader_stop.is_set():
+            try:
+                data = self.transport.receive(64)
+            except Exception as exc:
+                _LOGGER.exception("Servo bus reader stopped on transport error")
+                with self._lock:
+                    # Later calls raise instead of queueing behind a dead reader.
+                    self._reader_error = exc
+                    self._reader = None
+                self._fail_pending(exc)
+                break
+
+            if data and self.instrumentation is not None:
+                self._trace_rx(data)
+            packets = self.deserializer.feed(data) if data else []
+            resolved = []
+            expired = []
+            with self._lock:
+                for rx in packets:
+                    entry = self._match_pending(rx)
+                    if entry is None:
+                        _LOGGER.debug(
+                            "Dropping unsolicited packet from servo %d", rx.servo_id
+                        )
+                    else:
+                        resolved.append((entry, rx))
+                expired = self._expire_pending(time.monotonic())
+
+            # Resolve outside the lock: callbacks may submit new requests.
+            for entry, rx in resolved:
+                if entry.trace is not None:
+                    entry.trace.first_byte_ns = self._rx_started_ns
+                    self.instrumentation.finish(entry.trace)
+                entry.future.set_result(rx)
+            for entry in expired:
+                self._finish_failed(entry)
+                entry.future.set_exception(ServoTimeoutError("No response from servo"))
+
+    def _match_pending(self, rx: ServoPacket) -> Optional[_PendingResponse]:
+        queue = self._pending.get(rx.servo_id)
+        if not queue:
+            return None
+
+        for entry in queue:
+            if entry.size == len(rx.params):
+                queue.remove(entry)
+                return entry
+        return None
+
+    def _expire_pending(self, now: float) -> List[_PendingResponse]:
+        # Deadlines are not ordered within a queue: a short request may wait
+        # behind a long one for the same servo.
+        expired = []
+        for queue in self._pending.values():
+            for entry in [entry for entry in queue if entry.deadline <= now]:
+                queue.remove(entry)
+                expired.append(entry)
+        return expired
+
+    def _wait(self, future: "Future[ServoPacket]", timeout: float) -> ServoPacket:
+        try:
+            return future.result(max(timeout, 0.0) + READER_GRACE)
+        except FutureTimeoutError:
+            # The reader never expired the entry (e.g. it is stuck in receive):
+            # drop it ourselves so its trace is closed and the queue stays short.
+            self._abandon(future)
+            raise ServoTimeoutError("No response from servo") from None
+
+    def _abandon(self, future: "Future[ServoPacket]"):
+        entry = None
+        with self._lock:
+            for queue in self._pending.values():
+                entry = next((e for e in queue if e.future is future), None)
+                if entry is not None:
+                    queue.remove(entry)
+                    break
+        if entry is not None:
+            self._finish_failed(entry)
+            entry.future.cancel()
+
+    def _finish_failed(self, entry: _PendingResponse):
+        if entry.trace is not None:
+            self.instrumentation.finish(entry.trace, ok=False)
+
+    def execute(
+        self,
+        packet: ServoPacket,
+        timeout: Optional[float] = None,
+        *,
+        wait_reply: Optional[bool] = None,
+    ) -> Optional[ServoPacket]:
+        """
+        Send ``packet`` and wait for the servo's status frame.
+
+        Returns ``None`` without waiting when no reply is expected: broadcast
+        packets, writes under ``StatusReturnLevel.READ_ONLY``, or
+        ``wait_reply=False``.
+
+        With ``timeout=None`` the deadline and the number of attempts come
+        from ``latency_model``; an explicit timeout means a single attempt.
+        """
+        return self._execute(packet, timeout, wait_reply=wait_reply)
+
+    def _expects_reply(self, packet: ServoPacket) -> bool:
+        return self.protocol.expects_reply(packet, self.status_return_level)
+
+    def _send(
+        self,
+        packet: ServoPacket,
+        *,
+        trusted: bool = False,
+        trace: Optional[TransactionTrace] = None,
+    ):
+        if self.instrumentation is None:
+            self.transport.send(self.serializer.serialize(packet, trusted=trusted))
+            return
+
+        serialize_ns = time.monotonic_ns()
+        frame = self.serializer.serialize(packet, trusted=trusted)
+        self.transport.send(frame)
+        if trace is not None:
+            trace.serialize_ns = serialize_ns
+            trace.send_ns = time.monotonic_ns()
+        self.instrumentation.counters.bytes_out += len(frame)
+
+    def _begin_trace(self, packet: ServoPacket) -> Optional[TransactionTrace]:
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.begin(packet)
+
+    def _trace_rx(self, data: bytes):
+        # Stamp the first byte of a reply: the chunk that starts a new frame.
+        if not self.deserializer.pending:
+            self._rx_started_ns = time.monotonic_ns()
+        self.instrumentation.counters.bytes_in += len(data)
+
+    def _execute(
+        self,
+        packet: ServoPacket,
+        timeout: Optional[float],
+        *,
+        trusted: bool = False,
+        wait_reply: Optional[bool] = None,
+    ) -> Optional[ServoPacket]:
+        # trusted: packet was built by self.protocol, skip param validation
+        if wait_reply is None:
+            wait_reply = self._expects_reply(packet)
+
+        if self.shadow is not None:
+            hit, reply = self._shadow_lookup(packet, wait_reply)
+            if hit:
+                return reply
+
+        if wait_reply:
+            reply = self._request(packet, timeout, trusted=trusted)
+        else:
+            reply = self._transact(packet, 0.0, trusted=trusted, wait_reply=False)
+
+        if self.shadow is not None:
+            self._shadow_record(packet, reply)
+        return reply
+
+    def _request(
+        self, packet: ServoPacket, timeout: Optional[float], *, trusted: bool
+    ) -> ServoPacket:
+        model = self.latency_model
+        attempts = 1
+        if timeout is None:
+            attempts = model.attempts(packet.servo_id, packet.instruction)
+
+        for attempt in range(attempts):
+            limit = self._timeout_for(packet) if timeout is None else timeout
+            start = time.monotonic()
+            try:
+                reply = self._transact(packet, limit, trusted=trusted, wait_reply=True)
+            except ServoTimeoutError:
+                model.stats.timeouts += 1
+                if attempt + 1 == attempts:
+                    raise
+                model.stats.retries += 1
                 continue
 
-            packets = self.deserializer.feed(data)
-            for rx in packets:
-                if rx.servo_id == packet.servo_id:
+            model.observe(packet.servo_id, time.monotonic() - start)
+            return reply
+
+    def _timeout_for(self, packet: ServoPacket) -> float:
+        return self.latency_model.timeout(
+            packet.servo_id,
+            self.protocol.request_length(packet),
+            self.protocol.response_length(packet),
+        )
+
+    def _transact(
+        self,
+        packet: ServoPacket,
+        timeout: float,
+        *,
+        trusted: bool,
+        wait_reply: bool,
+    ) -> Optional[ServoPacket]:
+        if not wait_reply:
+            trace = self._begin_trace(packet)
+            if self._use_reader():
+                with self._lock:
+                    self._send(packet, trusted=trusted, trace=trace)
+            else:
+                self._send(packet, trusted=trusted, trace=trace)
+            if trace is not None:
+                self.instrumentation.finish(trace)
+            return None
+
+        if self._use_reader():
+            future = self.submit(packet, timeout, trusted=trusted)
+            return self._wait(future, timeout)
+
+        trace = self._begin_trace(packet)
+        self._send(packet, trusted=trusted, trace=trace)
+
+        expected = self.protocol.response_length(packet)
+        size = expected - self.protocol.STATUS_FRAME_OVERHEAD
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for rx in self._receive_packets(expected, deadline):
+                if rx.servo_id == packet.servo_id and len(rx.params) == size:
+                    if trace is not None:
+                        trace.first_byte_ns = self._rx_started_ns
+                        self.instrumentation.finish(trace)
                     return rx
 
+        if trace is not None:
+            self.instrumentation.finish(trace, ok=False)
         raise ServoTimeoutError("No response from servo")
 
+    def _shadow_lookup(
+        self, packet: ServoPacket, wait_reply: bool
+    ) -> Tuple[bool, Optional[ServoPacket]]:
+        servo_id = packet.servo_id
+        params = bytes(packet.params)
+        if servo_id == DeviceID.BROADCAST or not params:
+            return False, None
+
+        if packet.instruction == Instruction.READ:
+            data = self.shadow.read(servo_id, params[0], params[1])
+            if data is not None:
+                return True, ServoPacket(servo_id, 0, data)
+        elif packet.instruction == Instruction.WRITE:
+            if self.shadow.is_redundant_write(servo_id, params[0], params[1:]):
+                return True, ServoPacket(servo_id, 0, b"") if wait_reply else None
+
+        return False, None
+
+    def _shadow_record(self, packet: ServoPacket, reply: Optional[ServoPacket]):
+        params = bytes(packet.params)
+        instruction = packet.instruction
+
+        if instruction == Instruction.SYNC_WRITE:
+            address, size = params[0], params[1]
+            for i in range(2, len(params), size + 1):
+                self.shadow.invalidate(params[i], address, size)
+        elif packet.servo_id == DeviceID.BROADCAST:
+            if instruction in (Instruction.WRITE, Instruction.REG_WRITE):
+                self.shadow.invalidate()
+        elif instruction == Instruction.READ and reply is not None:
+            self.shadow.update(packet.servo_id, params[0], reply.params)
+        elif instruction == Instruction.WRITE:
+            if reply is not None and reply.instruction == 0:
+                self.shadow.update(packet.servo_id, params[0], params[1:])
+            else:
+                # Not acknowledged: the servo's value is unknown.
+                self.shadow.invalidate(packet.servo_id, params[0], len(params) - 1)
+        elif instruction == Instruction.REG_WRITE:
+            self.shadow.invalidate(packet.servo_id, params[0], len(params) - 1)
+
+    def sync_read(
+        self,
+        servo_ids: Iterable[int],
+        register: int,
+        size: int,
+        *,
+        timeout: Optional[float] = None,
+    ) -> SyncReadResult:
+        """
+        Read ``size`` bytes at ``register`` from many servos with one request.
+
+        Every addressed servo answers with its own status frame. Servos that do
+        not answer with a payload of ``size`` bytes before ``timeout`` are
+        reported in ``SyncReadResult.missing`` instead of raising.
+        """
+        ids = list(dict.fromkeys(servo_ids))
+        request = self.protocol.sync_read(ids, register, size)
+        if timeout is None:
+            timeout = self.latency_model.sync_timeout(
+                ids,
+                self.protocol.request_length(request),
+                self.protocol.STATUS_FRAME_OVERHEAD + size,
+            )
+
+        if self._use_reader():
+            return self._sync_read_via_reader(ids, request, size, timeout)
+
+        self._send(request, trusted=True)
+
+        pending = set(ids)
+        packets: Dict[int, ServoPacket] = {}
+
+        frame_length = self.protocol.STATUS_FRAME_OVERHEAD + size
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            expected = frame_length * len(pending)
+            for rx in self._receive_packets(expected, deadline):
+                if rx.servo_id in pending and len(rx.params) == size:
+                    packets[rx.servo_id] = rx
+                    pending.discard(rx.servo_id)
+
+        missing = tuple(servo_id for servo_id in ids if servo_id in pending)
+        return self._record_sync_read(SyncReadResult(packets, missing), register)
+
+    def _sync_read_via_reader(
+        self, ids: List[int], request: ServoPacket, size: int, timeout: float
+    ) -> SyncReadResult:
+        deadline = time.monotonic() + timeout
+        futures: Dict[int, "Future[ServoPacket]"] = {}
+        with self._lock:
+            if not self._use_reader():
+                raise RuntimeError("Background reader is not running")
+            for servo_id in ids:
+                future: "Future[ServoPacket]" = Future()
+                self._pending[servo_id].append(_PendingResponse(size, deadline, future))
+                futures[servo_id] = future
+            self._send(request, trusted=True)
+
+        packets: Dict[int, ServoPacket] = {}
+        for servo_id, future in futures.items():
+            try:
+                packets[servo_id] = self._wait(future, deadline - time.monotonic())
+            except ServoTimeoutError:
+                pass
+
+        missing = tuple(servo_id for servo_id in ids if servo_id not in packets)
+        result = SyncReadResult(packets, missing)
+        return self._record_sync_read(result, request.params[0])
+
+    def _record_sync_read(
+        self, result: SyncReadResult, register: int
+    ) -> SyncReadResult:
+        if self.instrumentation is not None:
+            self.instrumentation.counters.timeouts += len(result.missing)
+        if self.shadow is not None:
+            for servo_id, packet in result.packets.items():
+                self.shadow.update(servo_id, register, packet.params)
+        return result
+
+    def _receive_packets(self, expected: int, deadline: float) -> List[ServoPacket]:
+        """
+        Block for the bytes still missing from ``expected`` response bytes.
+
+        Bytes already buffered by the deserializer count towards
+        ``expected``; at least one byte is always requested so a stream
+        desynchronised by noise keeps making progress.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return []
+
+        size = max(1, expected - self.deserializer.pending)
+        data = self.transport.receive_exact(size, remaining)
+        if not data:
+            return []
+        if self.instrumentation is not None:
+            self._trace_rx(data)
+        return self.deserializer.feed(data)
+
+    def ping_many(
+        self,
+        servo_ids: Iterable[int],
+        *,
+        guard: Optional[float] = None,
+        drain: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Ping many ids back to back and return those that answered.
+
+        Pings are spaced by one reply slot (request and status frame on the
+        wire plus the return delay, plus ``guard``) instead of waiting a full
+        timeout each: replies are collected as they arrive and the host
+        latency is paid once at the end, not once per id. ``drain`` is how
+        long to keep listening after the last ping; by default the latency
+        model's ``drain_time``, which covers the USB adapter's latency timer.
+        """
+        ids = list(dict.fromkeys(servo_ids))
+        model = self.latency_model
+        ping_len = self.protocol.request_length(self.protocol.ping(0))
+        status_len = self.protocol.STATUS_FRAME_OVERHEAD
+        if guard is None:
+            guard = model.wire_time(4, 0)  # four byte times
+        slot = model.expected(ping_len, status_len) - model.host_latency + guard
+        if drain is None:
+            drain = model.drain_time
+
+        if self._use_reader():
+            return self._ping_many_via_reader(ids, slot + drain, slot)
+
+        pending = set(ids)
+        found = set()
+
+        def collect(packets: List[ServoPacket]):
+            for rx in packets:
+                if rx.servo_id in pending and not len(rx.params):
+                    pending.discard(rx.servo_id)
+                    found.add(rx.servo_id)
+
+        next_send = time.monotonic()
+        for servo_id in ids:
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._send(self.protocol.ping(servo_id), trusted=True)
+            next_send = time.monotonic() + slot
+            data = self.transport.receive_nowait()
+            if data:
+                collect(self.deserializer.feed(data))
+
+        deadline = next_send + drain
+        while pending and time.monotonic() < deadline:
+            collect(self._receive_packets(status_len, deadline))
+
+        return [servo_id for servo_id in ids if servo_id in found]
+
+    def _ping_many_via_reader(
+        self, ids: List[int], timeout: float, slot: float
+    ) -> List[int]:
+        futures = []
+        next_send = time.monotonic()
+        for servo_id in ids:
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(self.submit(self.protocol.ping(servo_id), timeout))
+            next_send = time.monotonic() + slot
+
+        found = []
+        for servo_id, future in zip(ids, futures):
+            try:
+                self._wait(future, timeout)
+            except ServoTimeoutError:
+                continue
+            found.append(servo_id)
+        return found
+
+    def discover(
+        self,
+        servo_ids: Iterable[int] = range(DeviceID.MAX_ID + 1),
+        *,
+        use_sync_read: bool = True,
+    ) -> DeviceRegistry:
+        """
+        Enumerate the servos on the bus and read their identity registers.
+
+        Present ids are found with ``ping_many``; model, firmware and key
+        EEPROM settings are then read with one SYNC READ per 64 servos.
+        Servos that do not answer the SYNC READ (older SCS firmware) fall
+        back to a plain READ. All timeouts come from ``latency_model``, so
+        they cover the USB adapter's latency as well as wire time.
+        """
+        present = self.ping_many(servo_ids)
+        (info_range,) = self.planner.plan(DEVICE_FIELDS)
+
+        fields: Dict[int, Dict[str, Union[int, float]]] = {}
+        if use_sync_read:
+            for start in range(0, len(present), 64):
+                chunk = present[start : start + 64]
+                result = self.sync_read(chunk, info_range.address, info_range.size)
+                for servo_id, packet in result.packets.items():
+                    fields[servo_id] = info_range.decode(packet.params)
+
+        for servo_id in present:
+            if servo_id in fields:
+                continue
+            request = self.protocol.read(
+                servo_id, info_range.address, info_range.size
+            )
+            try:
+                packet = self._execute(request, None, trusted=True)
+            except ServoTimeoutError:
+                _LOGGER.warning("Servo %d answered PING but not READ", servo_id)
+                continue
+            fields[servo_id] = info_range.decode(packet.params)
+
+        return DeviceRegistry(
+            (DeviceInfo.from_fields(i, fields[i]) for i in present if i in fields),
+            baudrate=self.latency_model.baudrate,
+        )
+
+    def load_or_discover(self, path: str) -> DeviceRegistry:
+        """
+        Reuse the registry saved at ``path`` if the bus still matches it.
+
+        Only the known ids are re-read; a full ``discover()`` (saved back to
+        ``path``) runs when the file is missing or any servo changed.
+        """
+        saved = DeviceRegistry.load(path)
+        if saved is not None and saved.baudrate == self.latency_model.baudrate:
+            if self.discover(saved.servo_ids) == saved:
+                return saved
+            _LOGGER.info("Bus topology changed since %s was saved", path)
+
+        registry = self.discover()
+        registry.save(path)
+        return registry
+
+    def set_baudrate(self, baudrate: int):
+        """Switch the bus to ``baudrate`` without reopening the port."""
+        self.transport.set_baudrate(baudrate)
+        self.deserializer.reset()
+        self.latency_model.set_baudrate(baudrate)
+
+    def detect_baudrates(
+        self, servo_ids: Iterable[int], *, rates: Iterable[int] = AUTOBAUD_ORDER
+    ) -> Dict[int, int]:
+        """
+        Find the line rate of each servo in ``servo_ids``.
+
+        Walks ``rates`` in order, switching the port in place and probing the
+        ids not found yet with ``ping_many`` (6-byte pings, slots sized from
+        wire time), and stops as soon as every servo has answered. Returns
+        ``{servo_id: baudrate}``; servos that never answered are left out.
+
+        Afterwards the bus stays at the detected rate when all servos share
+        one, otherwise it goes back to the rate it started at.
+        """
+        remaining = list(dict.fromkeys(servo_ids))
+        original = self.transport.baudrate
+        found: Dict[int, int] = {}
+
+        for rate in map(int, rates):
+            if not remaining:
+                break
+            self.set_baudrate(rate)
+            for servo_id in self.ping_many(remaining):
+                found[servo_id] = rate
+            remaining = [servo_id for servo_id in remaining if servo_id not in found]
+
+        detected = set(found.values())
+        target = detected.pop() if len(detected) == 1 else original
+        if self.transport.baudrate != target:
+            self.set_baudrate(target)
+        return found
+
     def go_to_position(
         self,
         servo_id: int,
@@ -71,18 +779,73 @@ class ServoBusDriver:
         *,
         speed: int = 1000,
         acc: int = 50,
-        timeout: float = 0.2,
-    ):
-        pkt = self.protocol.move_absolute(
+        timeout: Optional[float] = None,
+        wait_reply: Optional[bool] = None,
+    ) -> Optional[ServoPacket]:
+        """
+        Move one servo. ``wait_reply=False`` only sends the setpoint, which
+        halves bus time when streaming; ``None`` follows the driver's
+        ``status_return_level``.
+        """
+        pkt = self.protocol.write_absolute_move(
             servo_id,
             position=position,
             speed=speed,
             acc=acc,
         )
-        return self.execute(pkt, timeout)
+        return self._execute(pkt, timeout, trusted=True, wait_reply=wait_reply)
+
+    def go_to_positions(self, targets: Dict[int, Tuple[int, int, int]]) -> None:
+        """
+        Move many servos with a single broadcast SYNC WRITE frame.
+
+        ``targets`` maps servo id to ``(position, speed, acc)``. Broadcast
+        frames are never answered, so no response is awaited.
+        """
+        pkt = self.protocol.sync_write_absolute_move(targets)
+        self._execute(pkt, 0.0, trusted=True)
+
+    def stage_positions(
+        self,
+        targets: Dict[int, Tuple[int, int, int]],
+        *,
+        wait_ack: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Pre-load goals with REG_WRITE; nothing moves until ``action()``.
+
+        ``targets`` maps servo id to ``(position, speed, acc)``. With
+        ``wait_ack=False`` frames are sent back to back without reading the
+        acknowledgements; only use it on servos configured not to answer
+        writes (``StatusReturnLevel.READ_ONLY``), otherwise their replies
+        collide on the half-duplex bus.
+        """
+        for servo_id, (position, speed, acc) in targets.items():
+            pkt = self.protocol.reg_write_absolute_move(
+                servo_id, position, speed=speed, acc=acc
+            )
+            self._execute(
+                pkt, timeout, trusted=True, wait_reply=None if wait_ack else False
+            )
+
+    def action(self) -> None:
+        """Broadcast ACTION: every staged servo starts within one frame time."""
+        self._execute(self.protocol.action(), 0.0, trusted=True)
+
+    def go_to_positions_staged(
+        self,
+        targets: Dict[int, Tuple[int, int, int]],
+        *,
+        wait_ack: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Coordinated multi-joint move: ``stage_positions`` then ``action``."""
+        self.stage_positions(targets, wait_ack=wait_ack, timeout=timeout)
+        self.action()
 
     def go_continues(
-        self, servo_id: int, *, speed: int, acc: int, timeout: float = 0.2
+        self, servo_id: int, *, speed: int, acc: int, timeout: Optional[float] = None
     ):
         pkt = self.protocol
 
@@ -121,6 +884,29 @@ class ServoBusDriver:
             decode_fn=self._decoder.current,
         )
 
-    def _read_and_decode(self, request, decode_fn, timeout: float = 0.2):
-        packet = self.execute(request, timeout)
+    def read_state(self, servo_id: int) -> ServoState:
+        """Read all present values (position .. current) in a single frame."""
+        return self._read_and_decode(
+            request=self.protocol.read_state(servo_id),
+            decode_fn=self._decoder.state,
+        )
+
+    def read_fields(
+        self, servo_id: int, fields: Iterable[str], *, timeout: Optional[float] = None
+    ) -> Dict[str, Union[int, float]]:
+        """
+        Read arbitrary named registers (see ``protocol.registers.REGISTER_TABLE``).
+
+        Nearby registers are coalesced by the planner so only the minimum
+        number of READ transactions is issued.
+        """
+        values: Dict[str, Union[int, float]] = {}
+        for read_range in self.planner.plan(fields):
+            request = self.protocol.read(servo_id, read_range.address, read_range.size)
+            packet = self._execute(request, timeout, trusted=True)
+            values.update(read_range.decode(packet.params))
+        return values
+
+    def _read_and_decode(self, request, decode_fn, timeout: Optional[float] = None):
+        packet = self._execute(request, timeout, trusted=True)
         return decode_fn(packet)
@@ -0,0 +1,167 @@
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+from bus_servo_driver import ServoBusDriver, SyncReadResult
+from protocol.packet_decoder import ServoState
+from protocol.protocol import ServoPacket
+
+T = TypeVar("T")
+
+
+class ServoBusPool:
+    """
+    Several ``ServoBusDriver`` instances (one per serial port) behind one API.
+
+    Servo ids are routed to buses through ``registry`` (servo id -> bus name).
+    Every bus gets its own single worker thread, so transactions on one bus
+    stay strictly sequential while different buses run in parallel: a batched
+    read or write that spans N ports takes roughly as long as the slowest
+    port instead of the sum of all of them. The serial reads and the
+    simulator waits release the GIL, so threads are enough here.
+
+    Do not call a pooled driver directly while the pool is in use; go through
+    ``run`` so the call lands on that bus's worker.
+    """
+
+    def __init__(
+        self,
+        drivers: Mapping[str, ServoBusDriver],
+        registry: Optional[Mapping[int, str]] = None,
+    ):
+        if not drivers:
+            raise ValueError("ServoBusPool needs at least one driver")
+
+        self.drivers: Dict[str, ServoBusDriver] = dict(drivers)
+        self.registry: Dict[int, str] = {}
+        for servo_id, bus in (registry or {}).items():
+            self.assign(servo_id, bus)
+
+        self._workers: Dict[str, ThreadPoolExecutor] = {
+            bus: ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"servo-bus-{bus}"
+            )
+            for bus in self.drivers
+        }
+
+    def connect(self):
+        self._wait([self.run(bus, d.connect) for bus, d in self.drivers.items()])
+
+    def disconnect(self):
+        self._wait([self.run(bus, d.disconnect) for bus, d in self.drivers.items()])
+
+    def close(self):
+        """Disconnect every bus and stop the worker threads."""
+        try:
+            self.disconnect()
+        finally:
+            for worker in self._workers.values():
+                worker.shutdown(wait=True)
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def assign(self, servo_id: int, bus: str):
+        if bus not in self.drivers:
+            raise ValueError(f"Unknown bus: {bus}")
+        self.registry[servo_id] = bus
+
+    def bus_for(self, servo_id: int) -> str:
+        try:
+            return self.registry[servo_id]
+        except KeyError:
+            raise KeyError(f"Servo {servo_id} is not assigned to a bus") from None
+
+    def driver_for(self, servo_id: int) -> ServoBusDriver:
+        return self.drivers[self.bus_for(servo_id)]
+
+    def run(self, bus: str, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """Schedule ``fn(*args, **kwargs)`` on the worker that owns ``bus``."""
+        return self._workers[bus].submit(fn, *args, **kwargs)
+
+    def split(self, servo_ids: Iterable[int]) -> Dict[str, List[int]]:
+        """Group ``servo_ids`` by bus, keeping their order within each bus."""
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for servo_id in dict.fromkeys(servo_ids):
+            groups[self.bus_for(servo_id)].append(servo_id)
+        return dict(groups)
+
+    def go_to_position(self, servo_id: int, position: int, **kwargs):
+        bus = self.bus_for(servo_id)
+        move = self.drivers[bus].go_to_position
+        return self.run(bus, move, servo_id, position, **kwargs).result()
+
+    def go_to_positions(self, targets: Dict[int, Tuple[int, int, int]]) -> None:
+        """One SYNC WRITE per bus, all buses written concurrently."""
+        per_bus: Dict[str, Dict[int, Tuple[int, int, int]]] = defaultdict(dict)
+        for servo_id, target in targets.items():
+            per_bus[self.bus_for(servo_id)][servo_id] = target
+
+        self._wait(
+            [
+                self.run(bus, self.drivers[bus].go_to_positions, bus_targets)
+                for bus, bus_targets in per_bus.items()
+            ]
+        )
+
+    def sync_read(
+        self,
+        servo_ids: Iterable[int],
+        register: int,
+        size: int,
+        *,
+        timeout: float = 0.2,
+    ) -> SyncReadResult:
+        """SYNC READ on every bus concurrently, merged into one result."""
+        ids = list(dict.fromkeys(servo_ids))
+        futures = [
+            self.run(
+                bus,
+                self.drivers[bus].sync_read,
+                bus_ids,
+                register,
+                size,
+                timeout=timeout,
+            )
+            for bus, bus_ids in self.split(ids).items()
+        ]
+
+        packets: Dict[int, ServoPacket] = {}
+        for result in self._wait(futures):
+            packets.update(result.packets)
+
+        missing = tuple(servo_id for servo_id in ids if servo_id not in packets)
+        return SyncReadResult(packets, missing)
+
+    def read_states(self, servo_ids: Iterable[int]) -> Dict[int, ServoState]:
+        """``read_state`` for every servo, buses polled concurrently."""
+
+        def read_bus(driver: ServoBusDriver, bus_ids: List[int]):
+            return {servo_id: driver.read_state(servo_id) for servo_id in bus_ids}
+
+        states: Dict[int, ServoState] = {}
+        futures = [
+            self.run(bus, read_bus, self.drivers[bus], bus_ids)
+            for bus, bus_ids in self.split(servo_ids).items()
+        ]
+        for bus_states in self._wait(futures):
+            states.update(bus_states)
+        return states
+
+    @staticmethod
+    def _wait(futures: List["Future[T]"]) -> List[T]:
+        # Let every bus finish before raising so no worker is left mid-frame.
+        results = []
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except BaseException as exc:
+                error = error or exc
+        if error is not None:
+            raise error
+        return results
@@ -0,0 +1,103 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+# Registers read for every discovered servo; they share one 13-byte READ.
+DEVICE_FIELDS = (
+    "firmware_major",
+    "firmware_minor",
+    "model",
+    "baud_rate",
+    "return_delay",
+    "status_return_level",
+    "min_angle_limit",
+    "max_angle_limit",
+)
+
+REGISTRY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    """Identity and key EEPROM settings of one servo found on the bus."""
+
+    servo_id: int
+    model: int
+    firmware_major: int
+    firmware_minor: int
+    baud_rate: int
+    return_delay: int
+    status_return_level: int
+    min_angle_limit: int
+    max_angle_limit: int
+
+    @classmethod
+    def from_fields(
+        cls, servo_id: int, fields: Mapping[str, Union[int, float]]
+    ) -> "DeviceInfo":
+        return cls(servo_id, **{name: int(fields[name]) for name in DEVICE_FIELDS})
+
+
+class DeviceRegistry:
+    """
+    Servos known to be on a bus, persisted as JSON between runs.
+
+    ``ServoBusDriver.load_or_discover`` reloads it at startup and only checks
+    the known ids instead of scanning the whole id range. A servo added at a
+    new id is not noticed until the next full ``discover()``.
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[DeviceInfo] = (),
+        *,
+        baudrate: Optional[int] = None,
+    ):
+        self.devices: Dict[int, DeviceInfo] = {
+            device.servo_id: device for device in devices
+        }
+        self.baudrate = baudrate
+
+    def __contains__(self, servo_id: int) -> bool:
+        return servo_id in self.devices
+
+    def __getitem__(self, servo_id: int) -> DeviceInfo:
+        return self.devices[servo_id]
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DeviceRegistry):
+            return NotImplemented
+        return self.devices == other.devices and self.baudrate == other.baudrate
+
+    @property
+    def servo_ids(self) -> List[int]:
+        return sorted(self.devices)
+
+    def save(self, path: str):
+        data = {
+            "version": REGISTRY_VERSION,
+            "baudrate": self.baudrate,
+            "devices": [asdict(self.devices[i]) for i in self.servo_ids],
+        }
+        # Write then rename so a crash never leaves a half-written registry.
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump(data, fp, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["DeviceRegistry"]:
+        """The registry stored at ``path``, or ``None`` if missing or unreadable."""
+        try:
+            with open(path) as fp:
+                data = json.load(fp)
+            if data.get("version") != REGISTRY_VERSION:
+                return None
+            devices = [DeviceInfo(**device) for device in data["devices"]]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return cls(devices, baudrate=data.get("baudrate"))
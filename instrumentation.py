@@ -0,0 +1,152 @@
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from protocol.deserializer import DeserializerStats
+from protocol.protocol import ServoPacket
+
+
+@dataclass(slots=True)
+class TransactionTrace:
+    """
+    ``time.monotonic_ns()`` stamps of one request/response on the bus.
+
+    ``first_byte_ns`` is when the first chunk of the reply reached the host
+    (zero if nothing arrived); ``complete_ns`` is when the reply was matched,
+    the request timed out, or, for requests without a reply, the send time.
+    """
+
+    servo_id: int
+    instruction: int
+    serialize_ns: int = 0
+    send_ns: int = 0
+    first_byte_ns: int = 0
+    complete_ns: int = 0
+    ok: bool = True
+
+    @property
+    def latency_ns(self) -> int:
+        return self.complete_ns - self.serialize_ns
+
+
+@dataclass
+class BusCounters:
+    transactions: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    timeouts: int = 0
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram (bucket ``b`` holds < 2**b microseconds)."""
+
+    BUCKETS = 32
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int):
+        self.counts[min((ns // 1000).bit_length(), self.BUCKETS - 1)] += 1
+        if not self.count or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Upper bound of the bucket holding quantile ``q`` (0..1), in ns."""
+        if not self.count:
+            return 0
+
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min((1 << bucket) * 1000, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ns": self.mean_ns,
+            "min_ns": self.min_ns,
+            "p50_ns": self.percentile(0.5),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.max_ns,
+        }
+
+
+class Instrumentation:
+    """
+    Opt-in transaction tracing for ``ServoBusDriver``.
+
+    Pass an instance as ``ServoBusDriver(instrumentation=...)``. The driver
+    then stamps every transaction, keeps one ``LatencyHistogram`` per
+    ``(servo_id, instruction)`` and counts bytes and timeouts. Checksum
+    failures and resyncs come from the driver's ``PacketDeserializer``.
+
+    ``exporter`` is called with every finished ``TransactionTrace``, on the
+    thread that finished it; keep it cheap or hand off to a queue. With no
+    instrumentation the driver pays a single ``is None`` check per call.
+    """
+
+    def __init__(
+        self, exporter: Optional[Callable[[TransactionTrace], None]] = None
+    ):
+        self.exporter = exporter
+        self.counters = BusCounters()
+        self.histograms: Dict[Tuple[int, int], LatencyHistogram] = {}
+        self._deserializer_stats: Optional[DeserializerStats] = None
+        self._lock = threading.Lock()
+
+    def bind(self, deserializer_stats: DeserializerStats):
+        self._deserializer_stats = deserializer_stats
+
+    def begin(self, packet: ServoPacket) -> TransactionTrace:
+        return TransactionTrace(packet.servo_id, packet.instruction)
+
+    def finish(self, trace: TransactionTrace, *, ok: bool = True):
+        trace.complete_ns = time.monotonic_ns()
+        trace.ok = ok
+        key = (trace.servo_id, trace.instruction)
+        with self._lock:
+            self.counters.transactions += 1
+            if not ok:
+                self.counters.timeouts += 1
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(trace.latency_ns)
+
+        if self.exporter is not None:
+            self.exporter(trace)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Counters plus a summary of every histogram, as plain data."""
+        with self._lock:
+            counters = asdict(self.counters)
+            latencies: List[Dict[str, object]] = [
+                {"servo_id": servo_id, "instruction": instruction, **h.summary()}
+                for (servo_id, instruction), h in sorted(self.histograms.items())
+            ]
+
+        stats = self._deserializer_stats
+        counters["checksum_failures"] = stats.bad_checksums if stats else 0
+        counters["resyncs"] = stats.resyncs if stats else 0
+        return {"counters": counters, "latency": latencies}
+
+    def reset(self):
+        with self._lock:
+            self.counters = BusCounters()
+            self.histograms.clear()
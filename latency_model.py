@@ -0,0 +1,176 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable
+
+from protocol.protocol import Instruction
+
+# 1 start bit + 8 data bits + 1 stop bit
+BITS_PER_BYTE = 10
+# SCS/STS factory RETURN_DELAY of 250 x 2 us.
+DEFAULT_RETURN_DELAY = 0.0005
+# Default latency timer of FTDI-style USB-serial adapters: a short reply can
+# sit in the adapter this long before it is handed to the host.
+USB_LATENCY_TIMER = 0.016
+
+# Requests that can be repeated without side effects.
+IDEMPOTENT_INSTRUCTIONS = frozenset({Instruction.PING, Instruction.READ})
+
+
+@dataclass
+class LatencyStats:
+    observations: int = 0
+    timeouts: int = 0
+    retries: int = 0
+
+
+class LatencyModel:
+    """
+    Expected reply time per transaction, learned per servo.
+
+    The floor is physics: request and reply bytes at ``baudrate`` plus the
+    servo's ``return_delay`` and a ``host_latency`` allowance for the USB
+    adapter and OS scheduling. Once a servo has ``min_samples`` observed
+    round trips, its timeout is the ``quantile`` of the last ``window``
+    observations times ``margin``, but never below the wire-time floor.
+    Until then the timeout is the floor times ``margin`` plus ``usb_latency``,
+    the adapter's worst-case buffering delay, which observed round trips
+    already include. ``usb_latency`` also bounds how long to keep listening
+    after a burst of requests (see ``drain_time``).
+
+    Every timeout is clamped to ``[min_timeout, max_timeout]``. Idempotent
+    requests (PING, READ) are retried ``retries`` times on timeout.
+    """
+
+    def __init__(
+        self,
+        baudrate: int,
+        *,
+        return_delay: float = DEFAULT_RETURN_DELAY,
+        host_latency: float = 0.002,
+        usb_latency: float = USB_LATENCY_TIMER,
+        quantile: float = 0.99,
+        margin: float = 2.0,
+        window: int = 64,
+        min_samples: int = 8,
+        min_timeout: float = 0.001,
+        max_timeout: float = 0.2,
+        retries: int = 1,
+    ):
+        if baudrate <= 0:
+            raise ValueError("baudrate must be > 0")
+        if not 0.0 < quantile <= 1.0:
+            raise ValueError("quantile must be in (0, 1]")
+        if not 0.0 < min_timeout <= max_timeout:
+            raise ValueError("need 0 < min_timeout <= max_timeout")
+        if retries < 0:
+            raise ValueError("retries must be >= 0")
+
+        self.baudrate = baudrate
+        self.return_delay = return_delay
+        self.host_latency = host_latency
+        self.usb_latency = usb_latency
+        self.quantile = quantile
+        self.margin = margin
+        self.window = window
+        self.min_samples = min_samples
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.retries = retries
+        self.stats = LatencyStats()
+
+        self._lock = threading.Lock()
+        self._samples: Dict[int, Deque[float]] = {}
+        # Cached quantile per servo, refreshed every few observations.
+        self._observed: Dict[int, float] = {}
+        self._fresh: Dict[int, int] = {}
+
+    def wire_time(self, request_len: int, response_len: int) -> float:
+        """Seconds the request and its reply occupy the bus."""
+        return (request_len + response_len) * BITS_PER_BYTE / self.baudrate
+
+    def expected(self, request_len: int, response_len: int, replies: int = 1) -> float:
+        """Best-case round trip for ``replies`` status frames of ``response_len``."""
+        wire = self.wire_time(request_len, response_len * replies)
+        return wire + replies * self.return_delay + self.host_latency
+
+    @property
+    def drain_time(self) -> float:
+        """How long the last reply of a burst may take to reach the host."""
+        return self.host_latency + self.usb_latency
+
+    def timeout(self, servo_id: int, request_len: int, response_len: int) -> float:
+        floor = self.expected(request_len, response_len)
+        observed = self._observed.get(servo_id)
+        if observed is None:
+            return self._cold(floor)
+        return self._clamp(max(floor, observed) * self.margin)
+
+    def sync_timeout(
+        self, servo_ids: Iterable[int], request_len: int, response_len: int
+    ) -> float:
+        """Timeout for a SYNC READ answered by every servo in turn."""
+        ids = list(servo_ids)
+        floor = self.expected(request_len, response_len, replies=len(ids))
+        if any(servo_id not in self._observed for servo_id in ids):
+            return self._cold(floor)
+
+        slowest = max((self._observed[servo_id] for servo_id in ids), default=0.0)
+        # The slowest servo's jitter on top of the whole chain's wire time.
+        return self._clamp((floor + slowest) * self.margin)
+
+    def attempts(self, servo_id: int, instruction: int) -> int:
+        """
+        How many times to send a request before giving up.
+
+        Servos without observations (possibly absent) are not retried, so a
+        scan of empty ids costs one cold timeout each.
+        """
+        if instruction in IDEMPOTENT_INSTRUCTIONS and servo_id in self._observed:
+            return self.retries + 1
+        return 1
+
+    def observe(self, servo_id: int, rtt: float):
+        with self._lock:
+            self.stats.observations += 1
+            samples = self._samples.get(servo_id)
+            if samples is None:
+                samples = self._samples[servo_id] = deque(maxlen=self.window)
+            samples.append(rtt)
+
+            # Sorting the window every call would cost more than the bus does.
+            fresh = self._fresh.get(servo_id, 0) + 1
+            if len(samples) >= self.min_samples and (
+                fresh >= self.min_samples or servo_id not in self._observed
+            ):
+                ordered = sorted(samples)
+                index = min(int(self.quantile * len(ordered)), len(ordered) - 1)
+                self._observed[servo_id] = ordered[index]
+                fresh = 0
+            self._fresh[servo_id] = fresh
+
+    def observed(self, servo_id: int) -> float:
+        """Current round-trip quantile for ``servo_id`` (0 until warmed up)."""
+        return self._observed.get(servo_id, 0.0)
+
+    def set_baudrate(self, baudrate: int):
+        """Follow a line rate change; round trips seen at the old rate are dropped."""
+        if baudrate <= 0:
+            raise ValueError("baudrate must be > 0")
+        with self._lock:
+            self.baudrate = baudrate
+            self._samples.clear()
+            self._observed.clear()
+            self._fresh.clear()
+
+    def forget(self, servo_id: int):
+        with self._lock:
+            self._samples.pop(servo_id, None)
+            self._observed.pop(servo_id, None)
+            self._fresh.pop(servo_id, None)
+
+    def _cold(self, floor: float) -> float:
+        return self._clamp(floor * self.margin + self.usb_latency)
+
+    def _clamp(self, timeout: float) -> float:
+        return min(max(timeout, self.min_timeout), self.max_timeout)
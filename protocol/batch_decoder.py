@@ -0,0 +1,128 @@
+from typing import TYPE_CHECKING, Sequence, Union
+
+import numpy as np
+
+from protocol.packet_decoder import PacketDecoder
+
+if TYPE_CHECKING:
+    from protocol.protocol import ServoPacket
+
+# Many packets, or their params already laid end to end in one buffer.
+PacketBatch = Union[Sequence["ServoPacket"], bytes, bytearray, memoryview]
+
+
+class BatchDecoder:
+    """
+    Vectorised counterpart of ``PacketDecoder``.
+
+    Each method decodes a whole batch into a NumPy array in one pass; it
+    accepts a sequence of packets or a contiguous buffer of fixed-size
+    payloads. Kept apart from ``PacketDecoder`` so the driver itself does not
+    need NumPy.
+    """
+
+    STATE_SIZE = PacketDecoder.STATE_SIZE
+
+    # Raw layout of the read_state block, for np.frombuffer.
+    _STATE_RAW_DTYPE = np.dtype(
+        {
+            "names": [
+                "position",
+                "speed",
+                "load",
+                "voltage",
+                "temperature",
+                "moving",
+                "current",
+            ],
+            "formats": ["<u2", "<u2", "<u2", "u1", "u1", "u1", "<u2"],
+            "offsets": [
+                PacketDecoder._STATE_POSITION,
+                PacketDecoder._STATE_SPEED,
+                PacketDecoder._STATE_LOAD,
+                PacketDecoder._STATE_VOLTAGE,
+                PacketDecoder._STATE_TEMPERATURE,
+                PacketDecoder._STATE_MOVING,
+                PacketDecoder._STATE_CURRENT,
+            ],
+            "itemsize": STATE_SIZE,
+        }
+    )
+    STATE_DTYPE = np.dtype(
+        [
+            ("position", "<u2"),
+            ("speed", "<i2"),
+            ("load", "<i2"),
+            ("voltage", "<f4"),
+            ("temperature", "u1"),
+            ("moving", "?"),
+            ("current", "<i2"),
+        ]
+    )
+
+    @staticmethod
+    def positions(batch: PacketBatch) -> np.ndarray:
+        return np.frombuffer(BatchDecoder._buffer(batch, 2), "<u2").astype(np.uint16)
+
+    @staticmethod
+    def speeds(batch: PacketBatch) -> np.ndarray:
+        raw = np.frombuffer(BatchDecoder._buffer(batch, 2), "<u2")
+        return BatchDecoder.sign_magnitude(raw)
+
+    @staticmethod
+    def currents(batch: PacketBatch) -> np.ndarray:
+        return BatchDecoder.speeds(batch)
+
+    @staticmethod
+    def loads(batch: PacketBatch) -> np.ndarray:
+        return BatchDecoder.speeds(batch)
+
+    @staticmethod
+    def voltages(batch: PacketBatch) -> np.ndarray:
+        raw = np.frombuffer(BatchDecoder._buffer(batch, 1), np.uint8)
+        return raw / np.float32(10.0)
+
+    @staticmethod
+    def temperatures(batch: PacketBatch) -> np.ndarray:
+        return np.frombuffer(BatchDecoder._buffer(batch, 1), np.uint8).copy()
+
+    @staticmethod
+    def states(batch: PacketBatch) -> np.ndarray:
+        """Decode many ``read_state`` payloads into a ``STATE_DTYPE`` array."""
+        buffer = BatchDecoder._buffer(batch, BatchDecoder.STATE_SIZE)
+        raw = np.frombuffer(buffer, BatchDecoder._STATE_RAW_DTYPE)
+        sign_magnitude = BatchDecoder.sign_magnitude
+
+        out = np.empty(len(raw), dtype=BatchDecoder.STATE_DTYPE)
+        out["position"] = raw["position"]
+        out["speed"] = sign_magnitude(raw["speed"])
+        out["load"] = sign_magnitude(raw["load"])
+        out["voltage"] = raw["voltage"] / np.float32(10.0)
+        out["temperature"] = raw["temperature"]
+        out["moving"] = raw["moving"] != 0
+        out["current"] = sign_magnitude(raw["current"])
+        return out
+
+    @staticmethod
+    def sign_magnitude(raw: np.ndarray) -> np.ndarray:
+        """Vectorised ``_s16_at``: bit 15 is the sign, bits 0-14 the magnitude."""
+        magnitude = (raw & 0x7FFF).astype(np.int16)
+        return np.where(raw & 0x8000, -magnitude, magnitude)
+
+    @staticmethod
+    def _buffer(batch: PacketBatch, size: int) -> Union[bytes, bytearray, memoryview]:
+        # All payloads back to back, so NumPy can decode them in one call.
+        if isinstance(batch, (bytes, bytearray, memoryview)):
+            if len(batch) % size:
+                raise ValueError(
+                    f"Invalid buffer length: {len(batch)} is not a multiple of {size}"
+                )
+            return batch
+
+        params = [packet.params for packet in batch]
+        for payload in params:
+            if len(payload) != size:
+                raise ValueError(
+                    f"Invalid payload length: expected {size}, got {len(payload)}"
+                )
+        return b"".join(params)
@@ -1,6 +1,7 @@
 import logging
 import enum
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List
 
 from .protocol import ServoPacket
 
@@ -23,112 +24,136 @@ class FrameIndex(enum.IntEnum):
     PARAMS_START = INSTRUCTION + 1
 
 
-class DeserializerState(enum.Enum):
-    WAIT_HEADER_1 = enum.auto()
-    WAIT_HEADER_2 = enum.auto()
-    WAIT_ID = enum.auto()
-    WAIT_LENGTH = enum.auto()
-    WAIT_PAYLOAD = enum.auto()
-    WAIT_CHECKSUM = enum.auto()
+@dataclass
+class DeserializerStats:
+    dropped_bytes: int = 0
+    bad_checksums: int = 0
+    bad_lengths: int = 0
+    # Times the scanner lost frame alignment and had to hunt for a header.
+    resyncs: int = 0
 
 
 class PacketDeserializer:
-
+    """
+    Streaming frame scanner.
+
+    Bytes are accumulated across ``feed()`` calls and scanned a chunk at a
+    time: headers are located with ``bytearray.find`` and complete frames are
+    sliced out whole, so partial frames simply wait for the next chunk.
+
+    A rejected candidate frame (bad length or checksum) only discards its first
+    header byte; scanning resumes right after it, so a genuine frame whose
+    header sat inside the rejected bytes is still found. Likewise, a candidate
+    still waiting for bytes is abandoned as noise as soon as a complete, valid
+    frame shows up after its header, so a stray header claiming a long frame
+    cannot hold back the genuine reply behind it. The price is that a long
+    frame whose own params contain a complete, checksum-valid frame is lost.
+    """
+
+    HEADER = b"\xff\xff"
     HEADER_BYTE = 0xFF
 
     MAX_FRAME_LENGTH = 64
     MAX_PARAMS_LENGTH = 60
 
-    def __init__(self):
-        self._state = DeserializerState.WAIT_HEADER_1
+    # Plain ints: IntEnum attribute access is measurably slower in the scan loop.
+    _LENGTH = int(FrameIndex.LENGTH)
+
+    def __init__(self, *, max_frame_length: int = MAX_FRAME_LENGTH):
+        self.max_frame_length = max_frame_length
         self._buffer = bytearray()
-        self._remaining_payload = 0
+        self.stats = DeserializerStats()
 
     def feed(self, data: bytes) -> List["ServoPacket"]:
         packets: List["ServoPacket"] = []
 
-        for byte in data:
-            packet = self._process_byte(byte)
-            if packet is not None:
-                packets.append(packet)
-
+        buffer = self._buffer
+        buffer += data
+        size = len(buffer)
+        pos = 0
+        accepted = 0
+        aligned = True
+
+        while True:
+            start = buffer.find(self.HEADER, pos)
+            if start < 0:
+                # A trailing 0xFF may be the first half of a split header.
+                end = size - 1 if size and buffer[-1] == self.HEADER_BYTE else size
+                if end > pos and aligned:
+                    self.stats.resyncs += 1
+                pos = end
+                break
+
+            if start > pos and aligned:
+                self.stats.resyncs += 1
+                aligned = False
+
+            if start + self._LENGTH >= size:
+                pos = start
+                break
+
+            length = buffer[start + self._LENGTH]
+            if length < 2 or length > self.max_frame_length:
+                _LOGGER.debug("Rejecting frame with invalid length %d", length)
+                self.stats.bad_lengths += 1
+                if aligned:
+                    self.stats.resyncs += 1
+                    aligned = False
+                pos = start + 1
+                continue
+
+            end = start + self._LENGTH + 1 + length
+            if end > size:
+                if not self._frame_follows(buffer, start + 1, size):
+                    pos = start
+                    break
+                _LOGGER.debug("Rejecting incomplete frame before a valid frame")
+                self.stats.bad_lengths += 1
+                if aligned:
+                    self.stats.resyncs += 1
+                    aligned = False
+                pos = start + 1
+                continue
+
+            frame = bytes(buffer[start:end])
+            if not self._validate_checksum(frame):
+                _LOGGER.debug("Rejecting frame with invalid checksum")
+                self.stats.bad_checksums += 1
+                if aligned:
+                    self.stats.resyncs += 1
+                    aligned = False
+                pos = start + 1
+                continue
+
+            packets.append(self._build_packet(frame))
+            accepted += end - start
+            aligned = True
+            pos = end
+
+        self.stats.dropped_bytes += pos - accepted
+        del buffer[:pos]
         return packets
 
-    def _process_byte(self, byte: int) -> Optional["ServoPacket"]:
-        match self._state:
-            case DeserializerState.WAIT_HEADER_1:
-                return self._handle_wait_header_1(byte)
-            case DeserializerState.WAIT_HEADER_2:
-                return self._handle_wait_header_2(byte)
-            case DeserializerState.WAIT_ID:
-                return self._handle_wait_id(byte)
-            case DeserializerState.WAIT_LENGTH:
-                return self._handle_wait_length(byte)
-            case DeserializerState.WAIT_PAYLOAD:
-                return self._handle_wait_payload(byte)
-            case DeserializerState.WAIT_CHECKSUM:
-                return self._handle_wait_checksum(byte)
-
-        self._reset()
-        return None
-
-    def _handle_wait_header_1(self, byte: int) -> None:
-        if byte == self.HEADER_BYTE:
-            self._buffer.clear()
-            self._buffer.append(byte)
-            self._state = DeserializerState.WAIT_HEADER_2
-        return None
-
-    def _handle_wait_header_2(self, byte: int) -> None:
-        if byte == self.HEADER_BYTE:
-            self._buffer.append(byte)
-            self._state = DeserializerState.WAIT_ID
-        else:
-            self._state = DeserializerState.WAIT_HEADER_1
-        return None
-
-    def _handle_wait_id(self, byte: int) -> None:
-        self._buffer.append(byte)
-        self._state = DeserializerState.WAIT_LENGTH
-        return None
-
-    def _handle_wait_length(self, byte: int) -> None:
-        if byte < 2 or byte > self.MAX_FRAME_LENGTH:
-            self._reset()
-            return None
-
-        self._buffer.append(byte)
-        self._remaining_payload = byte - 1  # instruction + params
-        self._state = DeserializerState.WAIT_PAYLOAD
-        return None
-
-    def _handle_wait_payload(self, byte: int) -> None:
-        self._buffer.append(byte)
-        self._remaining_payload -= 1
-
-        if self._remaining_payload < 0:
-            self._reset()
-            return None
-
-        if self._remaining_payload == 0:
-            self._state = DeserializerState.WAIT_CHECKSUM
-        return None
-
-    def _handle_wait_checksum(self, byte: int) -> Optional["ServoPacket"]:
-        self._buffer.append(byte)
-
-        frame = bytes(self._buffer)
-        self._reset()
-
-        if not self._validate_checksum(frame):
-            return None
-
-        return self._build_packet(frame)
-
-    def _reset(self):
-        self._state = DeserializerState.WAIT_HEADER_1
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet consumed as a complete frame."""
+        return len(self._buffer)
+
+    def reset(self):
         self._buffer.clear()
-        self._remaining_payload = 0
+
+    def _frame_follows(self, buffer: bytearray, pos: int, size: int) -> bool:
+        """Whether a complete frame with a valid checksum starts at or after pos."""
+        while True:
+            start = buffer.find(self.HEADER, pos, size)
+            if start < 0 or start + self._LENGTH >= size:
+                return False
+            length = buffer[start + self._LENGTH]
+            end = start + self._LENGTH + 1 + length
+            if 2 <= length <= self.max_frame_length and end <= size:
+                if self._validate_checksum(buffer[start:end]):
+                    return True
+            pos = start + 1
 
     @staticmethod
     def _validate_checksum(frame: bytes) -> bool:
@@ -142,5 +167,5 @@ class PacketDeserializer:
         return ServoPacket(
             servo_id=frame[2],
             instruction=frame[4],
-            params=list(frame[5:-1]),
+            params=memoryview(frame)[5:-1],
         )
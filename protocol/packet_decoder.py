@@ -1,14 +1,44 @@
-from typing import TYPE_CHECKING
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from protocol.protocol import ServoPacket
 
 
+@dataclass(frozen=True, slots=True)
+class ServoState:
+    """Snapshot of the PRESENT_POSITION_L..PRESENT_CURRENT_H register block."""
+
+    position: int
+    speed: int
+    load: int
+    voltage: float
+    temperature: int
+    moving: bool
+    current: int
+
+
 class PacketDecoder:
     """
     Decode ServoPacket payload into typed values.
+
+    See ``protocol.batch_decoder.BatchDecoder`` to decode many packets at once
+    into NumPy arrays.
     """
 
+    # Offsets inside the block read by ServoProtocol.read_state (starts at 56).
+    STATE_SIZE = 15
+
+    _U16 = struct.Struct("<H")
+    _STATE_POSITION = 0
+    _STATE_SPEED = 2
+    _STATE_LOAD = 4
+    _STATE_VOLTAGE = 6
+    _STATE_TEMPERATURE = 7
+    _STATE_MOVING = 10
+    _STATE_CURRENT = 13
+
     @staticmethod
     def u8(packet: "ServoPacket") -> int:
         PacketDecoder._require_len(packet, 1)
@@ -17,14 +47,12 @@ class PacketDecoder:
     @staticmethod
     def u16(packet: "ServoPacket") -> int:
         PacketDecoder._require_len(packet, 2)
-        return packet.params[0] | (packet.params[1] << 8)
+        return PacketDecoder._u16_at(packet.params, 0)
 
     @staticmethod
     def s16(packet: "ServoPacket") -> int:
-        raw = PacketDecoder.u16(packet)
-        if raw & 0x8000:
-            return -(raw & 0x7FFF)
-        return raw
+        PacketDecoder._require_len(packet, 2)
+        return PacketDecoder._s16_at(packet.params, 0)
 
     @staticmethod
     def position(packet: "ServoPacket") -> int:
@@ -50,6 +78,31 @@ class PacketDecoder:
     def temperature(packet: "ServoPacket") -> int:
         return PacketDecoder.u8(packet)
 
+    @staticmethod
+    def state(packet: "ServoPacket") -> ServoState:
+        PacketDecoder._require_len(packet, PacketDecoder.STATE_SIZE)
+        params = packet.params
+        return ServoState(
+            position=PacketDecoder._u16_at(params, PacketDecoder._STATE_POSITION),
+            speed=PacketDecoder._s16_at(params, PacketDecoder._STATE_SPEED),
+            load=PacketDecoder._s16_at(params, PacketDecoder._STATE_LOAD),
+            voltage=params[PacketDecoder._STATE_VOLTAGE] / 10.0,
+            temperature=params[PacketDecoder._STATE_TEMPERATURE],
+            moving=bool(params[PacketDecoder._STATE_MOVING]),
+            current=PacketDecoder._s16_at(params, PacketDecoder._STATE_CURRENT),
+        )
+
+    @staticmethod
+    def _u16_at(params: Union[bytes, memoryview], offset: int) -> int:
+        return PacketDecoder._U16.unpack_from(params, offset)[0]
+
+    @staticmethod
+    def _s16_at(params: Union[bytes, memoryview], offset: int) -> int:
+        raw = PacketDecoder._u16_at(params, offset)
+        if raw & 0x8000:
+            return -(raw & 0x7FFF)
+        return raw
+
     @staticmethod
     def _require_len(packet: "ServoPacket", expected: int):
         if len(packet.params) != expected:
@@ -1,13 +1,26 @@
 import enum
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterable, List, Tuple, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, repr=False)
 class ServoPacket:
+    """
+    Immutable servo frame.
+
+    ``params`` is bytes for outgoing packets and a read-only memoryview into
+    the received frame for decoded responses, so no per-byte copy is made.
+    """
+
     servo_id: int
     instruction: int
-    params: List[int]
+    params: Union[bytes, memoryview]
+
+    def __repr__(self) -> str:
+        return (
+            f"ServoPacket(servo_id={self.servo_id}, instruction={self.instruction}, "
+            f"params={bytes(self.params).hex(' ')!r})"
+        )
 
 
 class Instruction(enum.IntEnum):
@@ -16,12 +29,28 @@ class Instruction(enum.IntEnum):
     WRITE = 3
     REG_WRITE = 4
     ACTION = 5
+    SYNC_READ = 0x82
+    SYNC_WRITE = 0x83
+
+
+class DeviceID(enum.IntEnum):
+    MAX_ID = 252
+    BROADCAST = 254
+
+
+class StatusReturnLevel(enum.IntEnum):
+    """Values of the servo's STATUS_RETURN_LEVEL register."""
+
+    READ_ONLY = 0  # only PING and READ are answered
+    ALL = 1
 
 
 class SCSRegister(enum.IntEnum):
     # -------------------------
     # EPROM (read-only)
     # -------------------------
+    FIRMWARE_MAJOR = 0
+    FIRMWARE_MINOR = 1
     MODEL_L = 3
     MODEL_H = 4
 
@@ -29,6 +58,8 @@ class SCSRegister(enum.IntEnum):
     # EPROM (read/write)
     ID = 5
     BAUD_RATE = 6
+    RETURN_DELAY = 7
+    STATUS_RETURN_LEVEL = 8
     MIN_ANGLE_LIMIT_L = 9
     MIN_ANGLE_LIMIT_H = 10
     MAX_ANGLE_LIMIT_L = 11
@@ -64,7 +95,22 @@ class SCSRegister(enum.IntEnum):
     PRESENT_CURRENT_H = 70
 
 
+# Values of the BAUD_RATE register and the line rate each one selects.
+BAUD_RATE_CODES = {
+    0: 1_000_000,
+    1: 500_000,
+    2: 250_000,
+    3: 128_000,
+    4: 115_200,
+    5: 76_800,
+    6: 57_600,
+    7: 38_400,
+}
+
+
 class ServoProtocol:
+    # header (2) + id + length + error + checksum
+    STATUS_FRAME_OVERHEAD = 6
 
     def read_position(self, servo_id: int) -> ServoPacket:
         return self.read(
@@ -108,6 +154,13 @@ class ServoProtocol:
             2,
         )
 
+    def read_state(self, servo_id: int) -> ServoPacket:
+        return self.read(
+            servo_id,
+            SCSRegister.PRESENT_POSITION_L,
+            SCSRegister.PRESENT_CURRENT_H - SCSRegister.PRESENT_POSITION_L + 1,
+        )
+
     def write_absolute_move(
         self,
         servo_id: int,
@@ -116,23 +169,42 @@ class ServoProtocol:
         speed: int,
         acc: int,
     ) -> ServoPacket:
-        if not (0 <= position <= 4095):
-            raise ValueError("Position must be in range 0..4095")
-
-        params = [
-            acc & 0xFF,
-            position & 0xFF,
-            (position >> 8) & 0xFF,
-            0x00,
-            0x00,
-            speed & 0xFF,
-            (speed >> 8) & 0xFF,
-        ]
-
         return self.write(
             servo_id,
             SCSRegister.GOAL_ACC,
-            params,
+            self._absolute_move_params(position, speed=speed, acc=acc),
+        )
+
+    def reg_write_absolute_move(
+        self,
+        servo_id: int,
+        position: int,
+        *,
+        speed: int,
+        acc: int,
+    ) -> ServoPacket:
+        """Stage an absolute move; it starts on the next ACTION."""
+        return self.reg_write(
+            servo_id,
+            SCSRegister.GOAL_ACC,
+            self._absolute_move_params(position, speed=speed, acc=acc),
+        )
+
+    def sync_write_absolute_move(
+        self,
+        targets: Dict[int, Tuple[int, int, int]],
+    ) -> ServoPacket:
+        """
+        Build one broadcast SYNC WRITE frame moving many servos at once.
+
+        ``targets`` maps servo id to ``(position, speed, acc)``.
+        """
+        return self.sync_write(
+            SCSRegister.GOAL_ACC,
+            {
+                servo_id: self._absolute_move_params(position, speed=speed, acc=acc)
+                for servo_id, (position, speed, acc) in targets.items()
+            },
         )
 
     def write_continues_move(
@@ -159,12 +231,53 @@ class ServoProtocol:
             params,
         )
 
+    @staticmethod
+    def _absolute_move_params(position: int, *, speed: int, acc: int) -> List[int]:
+        if not (0 <= position <= 4095):
+            raise ValueError("Position must be in range 0..4095")
+
+        return [
+            acc & 0xFF,
+            position & 0xFF,
+            (position >> 8) & 0xFF,
+            0x00,
+            0x00,
+            speed & 0xFF,
+            (speed >> 8) & 0xFF,
+        ]
+
+    @classmethod
+    def expects_reply(
+        cls,
+        packet: ServoPacket,
+        level: StatusReturnLevel = StatusReturnLevel.ALL,
+    ) -> bool:
+        """Whether the addressed servo sends a status frame for ``packet``."""
+        if packet.servo_id == DeviceID.BROADCAST:
+            return False
+        if level == StatusReturnLevel.READ_ONLY:
+            return packet.instruction in (Instruction.PING, Instruction.READ)
+        return True
+
+    @classmethod
+    def request_length(cls, packet: ServoPacket) -> int:
+        """Number of bytes ``packet`` occupies on the wire once serialized."""
+        # Instruction frames share the status frame layout.
+        return cls.STATUS_FRAME_OVERHEAD + len(packet.params)
+
+    @classmethod
+    def response_length(cls, packet: ServoPacket) -> int:
+        """Number of bytes in the status frame a servo sends back for ``packet``."""
+        if packet.instruction == Instruction.READ:
+            return cls.STATUS_FRAME_OVERHEAD + packet.params[1]
+        return cls.STATUS_FRAME_OVERHEAD
+
     @classmethod
     def ping(cls, servo_id: int) -> ServoPacket:
         return ServoPacket(
             servo_id=servo_id,
             instruction=int(Instruction.PING),
-            params=[],
+            params=b"",
         )
 
     @classmethod
@@ -172,7 +285,7 @@ class ServoProtocol:
         return ServoPacket(
             servo_id=servo_id,
             instruction=int(Instruction.READ),
-            params=[address & 0xFF, size & 0xFF],
+            params=bytes((address & 0xFF, size & 0xFF)),
         )
 
     @classmethod
@@ -180,5 +293,60 @@ class ServoProtocol:
         return ServoPacket(
             servo_id=servo_id,
             instruction=int(Instruction.WRITE),
-            params=[address & 0xFF] + [b & 0xFF for b in data],
+            params=bytes([address & 0xFF] + [b & 0xFF for b in data]),
+        )
+
+    @classmethod
+    def reg_write(cls, servo_id: int, address: int, data: List[int]) -> ServoPacket:
+        return ServoPacket(
+            servo_id=servo_id,
+            instruction=int(Instruction.REG_WRITE),
+            params=bytes([address & 0xFF] + [b & 0xFF for b in data]),
+        )
+
+    @classmethod
+    def action(cls, servo_id: int = DeviceID.BROADCAST) -> ServoPacket:
+        return ServoPacket(
+            servo_id=int(servo_id),
+            instruction=int(Instruction.ACTION),
+            params=b"",
+        )
+
+    @classmethod
+    def sync_write(cls, address: int, data: Dict[int, List[int]]) -> ServoPacket:
+        if not data:
+            raise ValueError("SYNC WRITE requires at least one servo")
+
+        sizes = {len(d) for d in data.values()}
+        if len(sizes) != 1:
+            raise ValueError("SYNC WRITE data must have the same length for every servo")
+        size = sizes.pop()
+
+        params = bytearray((address & 0xFF, size & 0xFF))
+        for servo_id, d in data.items():
+            if not (0 <= servo_id <= DeviceID.MAX_ID):
+                raise ValueError(f"Invalid servo id for SYNC WRITE: {servo_id}")
+            params.append(servo_id)
+            params.extend(b & 0xFF for b in d)
+
+        return ServoPacket(
+            servo_id=int(DeviceID.BROADCAST),
+            instruction=int(Instruction.SYNC_WRITE),
+            params=bytes(params),
+        )
+
+    @classmethod
+    def sync_read(cls, servo_ids: Iterable[int], address: int, size: int) -> ServoPacket:
+        ids = list(servo_ids)
+        if not ids:
+            raise ValueError("SYNC READ requires at least one servo")
+
+        for servo_id in ids:
+            if not (0 <= servo_id <= DeviceID.MAX_ID):
+                raise ValueError(f"Invalid servo id for SYNC READ: {servo_id}")
+
+        return ServoPacket(
+            servo_id=int(DeviceID.BROADCAST),
+            instruction=int(Instruction.SYNC_READ),
+            params=bytes([address & 0xFF, size & 0xFF] + ids),
         )
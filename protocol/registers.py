@@ -0,0 +1,184 @@
+import enum
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .protocol import SCSRegister
+
+
+class MemoryArea(enum.Enum):
+    EEPROM = enum.auto()
+    SRAM = enum.auto()
+
+
+@dataclass(frozen=True)
+class RegisterSpec:
+    """
+    Declarative description of one logical register.
+
+    Multi-byte registers are little-endian. Signed registers use the servo's
+    sign-magnitude encoding (top bit is the sign). The decoded value is
+    ``raw / scale``, e.g. voltage is reported in 0.1 V units so ``scale=10``.
+    """
+
+    name: str
+    address: int
+    size: int
+    area: MemoryArea
+    read_only: bool
+    signed: bool = False
+    scale: int = 1
+
+    @property
+    def end(self) -> int:
+        return self.address + self.size
+
+    def decode(
+        self, data: Union[bytes, memoryview], offset: int = 0
+    ) -> Union[int, float]:
+        raw = int.from_bytes(data[offset : offset + self.size], "little")
+
+        if self.signed:
+            sign_bit = 1 << (8 * self.size - 1)
+            if raw & sign_bit:
+                raw = -(raw & (sign_bit - 1))
+
+        if self.scale != 1:
+            return raw / self.scale
+        return raw
+
+
+def _spec(name, register, size, area, read_only, **kwargs) -> RegisterSpec:
+    return RegisterSpec(name, int(register), size, area, read_only, **kwargs)
+
+
+_EEPROM = MemoryArea.EEPROM
+_SRAM = MemoryArea.SRAM
+
+REGISTER_TABLE: Dict[str, RegisterSpec] = {
+    spec.name: spec
+    for spec in (
+        # EPROM (read-only)
+        _spec("firmware_major", SCSRegister.FIRMWARE_MAJOR, 1, _EEPROM, True),
+        _spec("firmware_minor", SCSRegister.FIRMWARE_MINOR, 1, _EEPROM, True),
+        _spec("model", SCSRegister.MODEL_L, 2, _EEPROM, True),
+        # EPROM (read/write)
+        _spec("id", SCSRegister.ID, 1, _EEPROM, False),
+        _spec("baud_rate", SCSRegister.BAUD_RATE, 1, _EEPROM, False),
+        _spec("return_delay", SCSRegister.RETURN_DELAY, 1, _EEPROM, False),
+        _spec(
+            "status_return_level",
+            SCSRegister.STATUS_RETURN_LEVEL,
+            1,
+            _EEPROM,
+            False,
+        ),
+        _spec("min_angle_limit", SCSRegister.MIN_ANGLE_LIMIT_L, 2, _EEPROM, False),
+        _spec("max_angle_limit", SCSRegister.MAX_ANGLE_LIMIT_L, 2, _EEPROM, False),
+        _spec("cw_dead", SCSRegister.CW_DEAD, 1, _EEPROM, False),
+        _spec("ccw_dead", SCSRegister.CCW_DEAD, 1, _EEPROM, False),
+        _spec("offset", SCSRegister.OFS_L, 2, _EEPROM, False, signed=True),
+        _spec("mode", SCSRegister.CONTINUE_MODE, 1, _EEPROM, False),
+        # SRAM (read/write)
+        _spec("torque_enable", SCSRegister.TORQUE_ENABLE, 1, _SRAM, False),
+        _spec("goal_acc", SCSRegister.GOAL_ACC, 1, _SRAM, False),
+        _spec("goal_position", SCSRegister.GOAL_POSITION_L, 2, _SRAM, False),
+        _spec("goal_time", SCSRegister.GOAL_TIME_L, 2, _SRAM, False),
+        _spec("goal_speed", SCSRegister.GOAL_SPEED_L, 2, _SRAM, False),
+        _spec("lock", SCSRegister.LOCK, 1, _SRAM, False),
+        # SRAM (read-only)
+        _spec("position", SCSRegister.PRESENT_POSITION_L, 2, _SRAM, True),
+        _spec("speed", SCSRegister.PRESENT_SPEED_L, 2, _SRAM, True, signed=True),
+        _spec("load", SCSRegister.PRESENT_LOAD_L, 2, _SRAM, True, signed=True),
+        _spec("voltage", SCSRegister.PRESENT_VOLTAGE, 1, _SRAM, True, scale=10),
+        _spec("temperature", SCSRegister.PRESENT_TEMPERATURE, 1, _SRAM, True),
+        _spec("moving", SCSRegister.MOVING, 1, _SRAM, True),
+        _spec("current", SCSRegister.PRESENT_CURRENT_L, 2, _SRAM, True, signed=True),
+    )
+}
+
+
+@dataclass(frozen=True)
+class ReadRange:
+    """One READ transaction covering one or more registers."""
+
+    address: int
+    size: int
+    fields: Tuple[RegisterSpec, ...]
+
+    def decode(
+        self, params: Union[bytes, memoryview]
+    ) -> Dict[str, Union[int, float]]:
+        if len(params) != self.size:
+            raise ValueError(
+                f"Invalid payload length: expected {self.size}, got {len(params)}"
+            )
+        return {
+            spec.name: spec.decode(params, spec.address - self.address)
+            for spec in self.fields
+        }
+
+
+class ReadPlanner:
+    """
+    Coalesce requested registers into the fewest READ ranges.
+
+    Registers separated by at most ``max_gap`` unused bytes are merged into a
+    single range as long as it stays within ``max_size`` bytes. Reading a few
+    filler bytes is far cheaper than the header, checksum and return delay of
+    an extra transaction.
+    """
+
+    DEFAULT_MAX_GAP = 8
+    DEFAULT_MAX_SIZE = 60
+
+    def __init__(
+        self,
+        table: Dict[str, RegisterSpec] = REGISTER_TABLE,
+        *,
+        max_gap: int = DEFAULT_MAX_GAP,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if max_gap < 0:
+            raise ValueError("max_gap must be >= 0")
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self._table = table
+        self._max_gap = max_gap
+        self._max_size = max_size
+
+    def spec(self, name: str) -> RegisterSpec:
+        try:
+            return self._table[name]
+        except KeyError:
+            raise KeyError(f"Unknown register: {name}") from None
+
+    def plan(self, names: Iterable[str]) -> List[ReadRange]:
+        specs = sorted(
+            {self.spec(name) for name in names},
+            key=lambda spec: spec.address,
+        )
+
+        ranges: List[ReadRange] = []
+        group: List[RegisterSpec] = []
+        start = end = 0
+
+        for spec in specs:
+            if (
+                group
+                and spec.address - end <= self._max_gap
+                and max(end, spec.end) - start <= self._max_size
+            ):
+                group.append(spec)
+                end = max(end, spec.end)
+                continue
+
+            if group:
+                ranges.append(ReadRange(start, end - start, tuple(group)))
+            group = [spec]
+            start, end = spec.address, spec.end
+
+        if group:
+            ranges.append(ReadRange(start, end - start, tuple(group)))
+
+        return ranges
@@ -1,4 +1,10 @@
-from typing import TYPE_CHECKING, List
+import functools
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .protocol import Instruction
 
 if TYPE_CHECKING:
     from .protocol import ServoPacket
@@ -8,51 +14,104 @@ class ServoSerializationError(Exception):
     pass
 
 
+@dataclass
+class SerializerStats:
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
 class PacketSerializer:
     HEADER = b"\xff\xff"
 
     MAX_FRAME_LENGTH = 64
     MAX_PARAMS_LENGTH = 60
 
-    def serialize(self, packet: "ServoPacket") -> bytes:
-        self._validate_packet(packet)
-
-        frame = bytearray()
-
-        self._append_header(frame)
-        self._append_servo_id(frame, packet.servo_id)
-        self._append_length(frame, packet)
-        self._append_instruction(frame, packet.instruction)
-        self._append_params(frame, packet.params)
-        self._append_checksum(frame)
-
-        return bytes(frame)
-
-    def _append_header(self, frame: bytearray):
-        frame += self.HEADER
-
-    def _append_servo_id(self, frame: bytearray, servo_id: int):
-        frame.append(servo_id & 0xFF)
-
-    def _append_length(self, frame: bytearray, packet: "ServoPacket"):
+    # SYNC frames address many servos and may use the full LENGTH byte.
+    SYNC_INSTRUCTIONS = frozenset({Instruction.SYNC_READ, Instruction.SYNC_WRITE})
+    MAX_SYNC_FRAME_LENGTH = 0xFF
+    MAX_SYNC_PARAMS_LENGTH = MAX_SYNC_FRAME_LENGTH - 2
+
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        if cache_size < 0:
+            raise ValueError("cache_size must be >= 0")
+
+        self._cache: "OrderedDict[Tuple[int, int, bytes], bytes]" = OrderedDict()
+        self._cache_size = cache_size
+        self.stats = SerializerStats()
+
+    def serialize(self, packet: "ServoPacket", *, trusted: bool = False) -> bytes:
+        """
+        Serialize ``packet`` into a wire frame.
+
+        Frames are memoised in a bounded LRU cache keyed by
+        ``(servo_id, instruction, params)``; SYNC frames change every tick and
+        are not cached. ``trusted=True`` skips the per-parameter validation
+        for packets built by ``ServoProtocol``; out-of-range header fields are
+        still rejected by ``struct``. Untrusted packets are validated even on
+        a cache hit.
+        """
+        if not trusted:
+            self._validate_packet(packet)
+
+        key = self._cache_key(packet)
+        if key is not None:
+            frame = self._cache.get(key)
+            if frame is not None:
+                self._cache.move_to_end(key)
+                self.stats.cache_hits += 1
+                return frame
+            self.stats.cache_misses += 1
+
+        frame = self._build_frame(packet)
+
+        if key is not None:
+            self._cache[key] = frame
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return frame
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _cache_key(self, packet: "ServoPacket") -> Optional[Tuple[int, int, bytes]]:
+        if not self._cache_size or not isinstance(packet.params, bytes):
+            return None
+        if packet.instruction in self.SYNC_INSTRUCTIONS:
+            return None
+        return packet.servo_id, packet.instruction, packet.params
+
+    def _build_frame(self, packet: "ServoPacket") -> bytes:
+        params = bytes(packet.params)
         length = self._calculate_length(packet)
-        frame.append(length)
+        checksum = (
+            ~(packet.servo_id + length + packet.instruction + sum(params))
+        ) & 0xFF
+
+        try:
+            return self._layout(len(params)).pack(
+                self.HEADER,
+                packet.servo_id,
+                length,
+                packet.instruction,
+                params,
+                checksum,
+            )
+        except struct.error as exc:
+            raise ServoSerializationError(f"Cannot serialize packet: {exc}") from exc
 
-    def _append_instruction(self, frame: bytearray, instruction: int):
-        frame.append(instruction & 0xFF)
-
-    def _append_params(self, frame: bytearray, params: List[int]):
-        for p in params:
-            frame.append(p & 0xFF)
-
-    def _append_checksum(self, frame: bytearray):
-        checksum = self._calculate_checksum(frame[2:])
-        frame.append(checksum)
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _layout(params_length: int) -> struct.Struct:
+        # header, id, length, instruction, params, checksum
+        return struct.Struct(f"<2sBBB{params_length}sB")
 
     def _validate_packet(self, packet: "ServoPacket"):
         self._validate_servo_id(packet.servo_id)
         self._validate_instruction(packet.instruction)
-        self._validate_params(packet.params)
+        self._validate_params(packet.params, packet.instruction)
         self._validate_length(packet)
 
     def _validate_servo_id(self, servo_id: int):
@@ -63,10 +122,18 @@ class PacketSerializer:
         if not (0 <= instruction <= 0xFF):
             raise ServoSerializationError("Invalid instruction")
 
-    def _validate_params(self, params: List[int]):
-        if len(params) > self.MAX_PARAMS_LENGTH:
+    def _validate_params(self, params: List[int], instruction: int):
+        if instruction in self.SYNC_INSTRUCTIONS:
+            max_params = self.MAX_SYNC_PARAMS_LENGTH
+        else:
+            max_params = self.MAX_PARAMS_LENGTH
+
+        if len(params) > max_params:
             raise ServoSerializationError("Too many params")
 
+        if isinstance(params, (bytes, memoryview)):
+            return
+
         for p in params:
             if not (0 <= p <= 0xFF):
                 raise ServoSerializationError("Param out of range")
@@ -77,13 +144,14 @@ class PacketSerializer:
         if length < 2:
             raise ServoSerializationError("Frame too short")
 
-        if length > self.MAX_FRAME_LENGTH:
+        if packet.instruction in self.SYNC_INSTRUCTIONS:
+            max_length = self.MAX_SYNC_FRAME_LENGTH
+        else:
+            max_length = self.MAX_FRAME_LENGTH
+
+        if length > max_length:
             raise ServoSerializationError("Frame too long")
 
     def _calculate_length(self, packet: "ServoPacket") -> int:
         # instruction + params + checksum
         return 1 + len(packet.params) + 1
-
-    @staticmethod
-    def _calculate_checksum(data: bytes) -> int:
-        return (~sum(data)) & 0xFF
@@ -0,0 +1,129 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from protocol.protocol import SCSRegister
+
+# Registers below TORQUE_ENABLE live in EEPROM and only change when written.
+EEPROM_END = int(SCSRegister.TORQUE_ENABLE)
+REGISTER_FILE_SIZE = 256
+
+
+@dataclass
+class ShadowStats:
+    read_hits: int = 0
+    read_misses: int = 0
+    writes_suppressed: int = 0
+    writes_forwarded: int = 0
+
+
+class RegisterShadow:
+    """
+    Per-servo mirror of the register map.
+
+    Each byte remembers the value last read from, or acknowledged as written
+    to, the servo and when that happened. EEPROM bytes, and the SRAM byte
+    addresses listed in ``static_addresses`` (settings only the host changes,
+    such as GOAL_ACC or LOCK), never go stale; other SRAM bytes are served
+    from the shadow for ``sram_ttl`` seconds. ``sram_ttl=0`` disables caching
+    of those reads while still suppressing redundant writes.
+
+    Safe to share between the caller thread and the driver's reader thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        sram_ttl: float = 0.0,
+        static_addresses: Iterable[int] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if sram_ttl < 0:
+            raise ValueError("sram_ttl must be >= 0")
+        static = set(static_addresses)
+        if any(not 0 <= address < REGISTER_FILE_SIZE for address in static):
+            raise ValueError(f"static addresses must be in 0..{REGISTER_FILE_SIZE - 1}")
+
+        self.sram_ttl = sram_ttl
+        # Per byte: True if a cached value never goes stale.
+        self._static = [
+            address < EEPROM_END or address in static
+            for address in range(REGISTER_FILE_SIZE)
+        ]
+        self.stats = ShadowStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: Dict[int, bytearray] = {}
+        # Time each byte became known; None when unknown.
+        self._stamps: Dict[int, List[Optional[float]]] = {}
+
+    def read(self, servo_id: int, address: int, size: int) -> Optional[bytes]:
+        """Cached bytes for a READ, or ``None`` if any byte is unknown or stale."""
+        with self._lock:
+            return self._read(servo_id, address, size)
+
+    def _read(self, servo_id: int, address: int, size: int) -> Optional[bytes]:
+        stamps = self._stamps.get(servo_id)
+        if stamps is None or address + size > REGISTER_FILE_SIZE:
+            self.stats.read_misses += 1
+            return None
+
+        now = self._clock()
+        static = self._static
+        for offset in range(address, address + size):
+            stamp = stamps[offset]
+            if stamp is None or (
+                not static[offset] and now - stamp > self.sram_ttl
+            ):
+                self.stats.read_misses += 1
+                return None
+
+        self.stats.read_hits += 1
+        return bytes(self._values[servo_id][address : address + size])
+
+    def is_redundant_write(self, servo_id: int, address: int, data: bytes) -> bool:
+        """True when every byte of a WRITE matches the last acknowledged value."""
+        end = address + len(data)
+        with self._lock:
+            stamps = self._stamps.get(servo_id)
+            redundant = (
+                stamps is not None
+                and end <= REGISTER_FILE_SIZE
+                and all(stamp is not None for stamp in stamps[address:end])
+                and self._values[servo_id][address:end] == data
+            )
+
+            if redundant:
+                self.stats.writes_suppressed += 1
+            else:
+                self.stats.writes_forwarded += 1
+        return redundant
+
+    def update(self, servo_id: int, address: int, data: bytes):
+        end = min(address + len(data), REGISTER_FILE_SIZE)
+        now = self._clock()
+        with self._lock:
+            if servo_id not in self._values:
+                self._values[servo_id] = bytearray(REGISTER_FILE_SIZE)
+                self._stamps[servo_id] = [None] * REGISTER_FILE_SIZE
+
+            self._values[servo_id][address:end] = data[: end - address]
+            self._stamps[servo_id][address:end] = [now] * (end - address)
+
+    def invalidate(
+        self,
+        servo_id: Optional[int] = None,
+        address: int = 0,
+        size: int = REGISTER_FILE_SIZE,
+    ):
+        with self._lock:
+            if servo_id is None:
+                self._values.clear()
+                self._stamps.clear()
+                return
+
+            stamps = self._stamps.get(servo_id)
+            if stamps is not None:
+                end = min(address + size, REGISTER_FILE_SIZE)
+                stamps[address:end] = [None] * (end - address)
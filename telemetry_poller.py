@@ -0,0 +1,232 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from bus_servo_driver import ServoBusDriver, ServoTimeoutError
+from protocol.registers import ReadRange, RegisterSpec
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FIELDS = ("position", "speed", "load", "voltage", "temperature", "current")
+
+
+@dataclass
+class PollerStats:
+    polls: int = 0
+    overruns: int = 0
+    missing: int = 0
+    achieved_rate: float = 0.0
+
+
+def telemetry_dtype(specs: Sequence[RegisterSpec]) -> np.dtype:
+    """Structured dtype with a timestamp, servo id and one column per register."""
+    columns = [("timestamp", "<f8"), ("servo_id", "u1")]
+    for spec in specs:
+        if spec.scale != 1:
+            columns.append((spec.name, "<f4"))
+        else:
+            kind = "i" if spec.signed else "u"
+            columns.append((spec.name, f"<{kind}{spec.size}"))
+    return np.dtype(columns)
+
+
+class TelemetryPoller:
+    """
+    Poll a set of servos/registers at a fixed rate on a background thread.
+
+    Each poll reads the requested registers with the driver's read planner
+    (one SYNC READ per coalesced range, or one READ per servo and range) and
+    appends one row per servo to a preallocated NumPy ring buffer.
+
+    Every row is stored twice, ``capacity`` rows apart, so the most recent
+    ``n <= capacity`` rows are always contiguous and ``latest(n)`` can return
+    a view instead of a copy. Views alias the ring: copy them if they must
+    outlive the next ``capacity`` rows.
+    """
+
+    def __init__(
+        self,
+        driver: ServoBusDriver,
+        servo_ids: Iterable[int],
+        fields: Iterable[str] = DEFAULT_FIELDS,
+        *,
+        rate: float = 100.0,
+        capacity: int = 10_000,
+        use_sync_read: bool = True,
+        timeout: float = 0.05,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.driver = driver
+        self.servo_ids = list(dict.fromkeys(servo_ids))
+        self.period = 1.0 / rate
+        self.capacity = capacity
+        self.use_sync_read = use_sync_read
+        self.timeout = timeout
+        self.stats = PollerStats()
+
+        self._ranges: List[ReadRange] = driver.planner.plan(fields)
+        specs = [spec for read_range in self._ranges for spec in read_range.fields]
+        self.dtype = telemetry_dtype(specs)
+        self._names = [spec.name for spec in specs]
+
+        self._ring = np.zeros(2 * capacity, dtype=self.dtype)
+        self._written = 0  # total rows ever written
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        with self._cond:
+            self._cond.notify_all()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def total_rows(self) -> int:
+        return self._written
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """Zero-copy view of the newest ``n`` rows (all buffered rows by default)."""
+        with self._cond:
+            available = min(self._written, self.capacity)
+            n = available if n is None else min(n, available)
+            end = self._written % self.capacity + self.capacity
+            return self._ring[end - n : end]
+
+    def samples(self, timeout: Optional[float] = None) -> Iterator[np.ndarray]:
+        """
+        Yield batches of rows as they are polled, oldest first.
+
+        Each batch is a copy. If the consumer falls more than ``capacity`` rows
+        behind, the oldest rows are skipped. Stops when the poller stops or no
+        row arrives within ``timeout``.
+        """
+        seen = self._written
+        while True:
+            with self._cond:
+                if self._written == seen and not self._stop.is_set():
+                    self._cond.wait(timeout)
+                written = self._written
+                if written == seen:
+                    return
+                # Copy by absolute row index while the poller cannot append.
+                start = max(seen, written - self.capacity)
+                begin = start % self.capacity
+                batch = self._ring[begin : begin + written - start].copy()
+
+            seen = written
+            yield batch
+
+    def poll_once(self) -> int:
+        """Run one poll synchronously; returns the number of rows written."""
+        now = time.time()
+        values = self._read()
+
+        rows = []
+        for servo_id in self.servo_ids:
+            fields = values.get(servo_id)
+            if fields is None:
+                self.stats.missing += 1
+                continue
+            rows.append((now, servo_id, *(fields[name] for name in self._names)))
+
+        self._append(rows)
+        self.stats.polls += 1
+        return len(rows)
+
+    def _read(self) -> Dict[int, Dict[str, float]]:
+        values: Dict[int, Dict[str, float]] = {}
+        missing = set()
+
+        for read_range in self._ranges:
+            if self.use_sync_read:
+                result = self.driver.sync_read(
+                    self.servo_ids,
+                    read_range.address,
+                    read_range.size,
+                    timeout=self.timeout,
+                )
+                missing.update(result.missing)
+                for servo_id, packet in result.packets.items():
+                    values.setdefault(servo_id, {}).update(
+                        read_range.decode(packet.params)
+                    )
+                continue
+
+            for servo_id in self.servo_ids:
+                request = self.driver.protocol.read(
+                    servo_id, read_range.address, read_range.size
+                )
+                try:
+                    packet = self.driver.execute(request, self.timeout)
+                except ServoTimeoutError:
+                    missing.add(servo_id)
+                    continue
+                values.setdefault(servo_id, {}).update(read_range.decode(packet.params))
+
+        for servo_id in missing:
+            values.pop(servo_id, None)
+        return values
+
+    def _append(self, rows: List[tuple]):
+        if not rows:
+            return
+
+        with self._cond:
+            for row in rows:
+                index = self._written % self.capacity
+                self._ring[index] = row
+                self._ring[index + self.capacity] = row
+                self._written += 1
+            self._cond.notify_all()
+
+    def _run(self):
+        start = time.monotonic()
+        next_tick = start
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:
+                # Keep polling: one failed transaction must not end telemetry.
+                _LOGGER.exception("Telemetry poll failed")
+                self.stats.missing += len(self.servo_ids)
+
+            next_tick += self.period
+            now = time.monotonic()
+            if now > next_tick:
+                # Missed the slot: count it and realign instead of bursting.
+                self.stats.overruns += 1
+                next_tick = now
+            else:
+                self._stop.wait(next_tick - now)
+
+            elapsed = time.monotonic() - start
+            if elapsed > 0:
+                self.stats.achieved_rate = self.stats.polls / elapsed
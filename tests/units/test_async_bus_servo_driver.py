@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from async_bus_servo_driver import AsyncServoBusDriver
+from bus_servo_driver import ServoTimeoutError
+
+
+class FakeAsyncTransport:
+    """Answers READ requests with the servo id as position, from the event loop."""
+
+    def __init__(self, silent=()):
+        self.sent = []
+        self.silent = set(silent)
+        self._receiver = None
+
+    def set_receiver(self, receiver):
+        self._receiver = receiver
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def send(self, data: bytes):
+        self.sent.append(data)
+        servo_id = data[2]
+        if data[4] != 0x02 or servo_id in self.silent:
+            return
+        body = bytes([servo_id, 4, 0, servo_id, 0])
+        frame = b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+        loop = asyncio.get_running_loop()
+        # Deliver in two chunks to exercise streaming across callbacks.
+        loop.call_soon(self._receiver, frame[:3])
+        loop.call_soon(self._receiver, frame[3:])
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_requests_share_one_bus():
+    async def scenario():
+        driver = AsyncServoBusDriver("fake", 1_000_000, transport=FakeAsyncTransport())
+        await driver.connect()
+        ids = list(range(1, 201))
+        results = await asyncio.gather(*(driver.get_position(i) for i in ids))
+        await driver.disconnect()
+        return ids, results
+
+    ids, results = run(scenario())
+
+    assert results == ids
+
+
+def test_timeout_raises_servo_timeout_error():
+    async def scenario():
+        transport = FakeAsyncTransport(silent={3})
+        driver = AsyncServoBusDriver("fake", 1_000_000, transport=transport)
+        await driver.connect()
+        with pytest.raises(ServoTimeoutError):
+            await driver._read_and_decode(
+                driver.protocol.read_position(3), driver._decoder.position, 0.01
+            )
+        # The bus is released after a timeout.
+        assert await driver.get_position(4) == 4
+
+    run(scenario())
+
+
+def test_default_timeout_comes_from_the_latency_model(monkeypatch):
+    async def scenario():
+        transport = FakeAsyncTransport(silent={3})
+        driver = AsyncServoBusDriver("fake", 1_000_000, transport=transport)
+        await driver.connect()
+        limits = []
+        wait_for = asyncio.wait_for
+
+        async def spy(future, timeout):
+            limits.append(timeout)
+            return await wait_for(future, timeout)
+
+        monkeypatch.setattr(asyncio, "wait_for", spy)
+        expected = driver._timeout_for(driver.protocol.read_position(3))
+        with pytest.raises(ServoTimeoutError):
+            await driver.get_position(3)
+        return driver, limits, expected
+
+    driver, limits, expected = run(scenario())
+
+    # A cold servo gets one attempt on the model's wire-time based timeout.
+    assert limits == [expected]
+    assert expected < driver.latency_model.max_timeout / 4
+    assert driver.latency_model.stats.timeouts == 1
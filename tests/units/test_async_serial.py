@@ -0,0 +1,58 @@
+import asyncio
+import socket
+
+from transport.async_serial import AsyncSerialTransport
+
+
+class ChokedTransport:
+    """SerialTransport stand-in whose TX buffer takes a few bytes per write."""
+
+    def __init__(self, accept: int):
+        self.accept = accept
+        self.written = bytearray()
+        self.calls = 0
+        self._sock, self._peer = socket.socketpair()
+
+    def open(self):
+        pass
+
+    def close(self):
+        self._sock.close()
+        self._peer.close()
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def receive_nowait(self, max_bytes: int = 4096) -> bytes:
+        return b""
+
+    def send_nowait(self, data: bytes) -> int:
+        self.calls += 1
+        chunk = bytes(data[: self.accept])
+        self.written += chunk
+        return len(chunk)
+
+
+def test_send_never_blocks_and_flushes_in_order():
+    async def scenario():
+        port = ChokedTransport(accept=4)
+        transport = AsyncSerialTransport("fake", transport=port)
+        await transport.open()
+
+        transport.send(b"0123456789")
+        transport.send(b"abc")
+        # Only what the port took immediately; the rest waits for writability.
+        assert bytes(port.written) == b"0123"
+        assert transport.pending_output == 9
+
+        for _ in range(10):
+            if not transport.pending_output:
+                break
+            await asyncio.sleep(0)
+
+        await transport.close()
+        return port
+
+    port = asyncio.run(scenario())
+
+    assert bytes(port.written) == b"0123456789abc"
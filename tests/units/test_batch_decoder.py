@@ -0,0 +1,84 @@
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from protocol.batch_decoder import BatchDecoder
+from protocol.packet_decoder import PacketDecoder
+from protocol.protocol import ServoPacket
+
+
+def packets_of(size: int, count: int = 200, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        ServoPacket(1, 0, bytes(rng.randrange(256) for _ in range(size)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "batch_fn, scalar_fn, size",
+    [
+        (BatchDecoder.positions, PacketDecoder.position, 2),
+        (BatchDecoder.speeds, PacketDecoder.speed, 2),
+        (BatchDecoder.loads, PacketDecoder.load, 2),
+        (BatchDecoder.currents, PacketDecoder.current, 2),
+        (BatchDecoder.voltages, PacketDecoder.voltage, 1),
+        (BatchDecoder.temperatures, PacketDecoder.temperature, 1),
+    ],
+)
+def test_batch_matches_scalar_path(batch_fn, scalar_fn, size):
+    packets = packets_of(size)
+
+    expected = [scalar_fn(packet) for packet in packets]
+
+    assert batch_fn(packets) == pytest.approx(expected)
+    buffer = b"".join(packet.params for packet in packets)
+    assert batch_fn(buffer) == pytest.approx(expected)
+
+
+def test_states_match_scalar_state():
+    packets = packets_of(BatchDecoder.STATE_SIZE)
+
+    states = BatchDecoder.states(packets)
+
+    assert states.dtype == BatchDecoder.STATE_DTYPE
+    for row, packet in zip(states, packets):
+        state = PacketDecoder.state(packet)
+        assert row["position"] == state.position
+        assert row["speed"] == state.speed
+        assert row["load"] == state.load
+        assert row["voltage"] == pytest.approx(state.voltage)
+        assert row["temperature"] == state.temperature
+        assert row["moving"] == state.moving
+        assert row["current"] == state.current
+
+
+def test_sign_magnitude_is_not_twos_complement():
+    raw = np.array([0x0000, 0x0005, 0x8005, 0x8000, 0xFFFF], dtype="<u2")
+
+    assert BatchDecoder.sign_magnitude(raw).tolist() == [0, 5, -5, 0, -0x7FFF]
+
+
+def test_batch_rejects_wrong_sizes():
+    mixed = [ServoPacket(1, 0, b"\x00\x01"), ServoPacket(1, 0, b"\x00")]
+
+    with pytest.raises(ValueError):
+        BatchDecoder.positions(mixed)
+    with pytest.raises(ValueError):
+        BatchDecoder.positions(b"\x00\x01\x02")
+
+
+def test_empty_batch():
+    assert BatchDecoder.positions([]).shape == (0,)
+    assert BatchDecoder.states(b"").shape == (0,)
+
+
+def test_driver_imports_without_numpy():
+    # numpy is optional: only the batch decoder, poller and trajectories use it.
+    code = "import sys; sys.modules['numpy'] = None; import bus_servo_driver"
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
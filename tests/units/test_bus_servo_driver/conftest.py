@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+
+class FakeTransport:
+    """In-memory transport recording sent frames and replaying queued replies."""
+
+    def __init__(self):
+        self.sent = []
+        self.replies = bytearray()
+        self.requested = []
+        self.responder = None
+        self._lock = threading.Lock()
+
+    def queue_status(self, servo_id: int, params=(), error: int = 0):
+        body = bytes([servo_id, len(params) + 2, error, *params])
+        with self._lock:
+            self.replies += b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, data: bytes):
+        self.sent.append(bytes(data))
+        if self.responder is not None:
+            self.responder(self, bytes(data))
+
+    def receive(self, max_bytes: int = 64) -> bytes:
+        with self._lock:
+            chunk = bytes(self.replies[:max_bytes])
+            del self.replies[:max_bytes]
+        if not chunk:
+            time.sleep(0.0005)
+        return chunk
+
+    def receive_exact(self, size: int, timeout: float) -> bytes:
+        self.requested.append(size)
+        return self.receive(size)
+
+
+@pytest.fixture
+def fake_transport():
+    return FakeTransport()
+
+
+@pytest.fixture
+def driver(fake_transport):
+    from bus_servo_driver import ServoBusDriver
+
+    driver = ServoBusDriver("COM14", 1_000_000, transport=fake_transport)
+    yield driver
+    driver.stop_reader()
@@ -0,0 +1,93 @@
+import pytest
+
+from bus_servo_driver import ServoBusDriver, ServoTimeoutError
+from transport.simulator import SimulatedTransport
+
+
+def position_reply(transport, frame):
+    transport.queue_status(frame[2], [0x00, 0x08])
+
+
+def test_model_follows_the_transport_baudrate():
+    sim = SimulatedTransport([1], baudrate=115_200, realtime=False)
+
+    driver = ServoBusDriver("sim", 1_000_000, transport=sim)
+
+    assert driver.latency_model.baudrate == 115_200
+
+
+def record_timeouts(driver, monkeypatch):
+    """Collect the timeout each reply-waiting transaction is given."""
+    limits = []
+    transact = driver._transact
+
+    def spy(packet, timeout, **kwargs):
+        if kwargs["wait_reply"]:
+            limits.append(timeout)
+        return transact(packet, timeout, **kwargs)
+
+    monkeypatch.setattr(driver, "_transact", spy)
+    return limits
+
+
+def read_position_timeout(driver, servo_id):
+    return driver._timeout_for(driver.protocol.read_position(servo_id))
+
+
+def test_cold_servo_times_out_on_wire_time(driver, monkeypatch):
+    limits = record_timeouts(driver, monkeypatch)
+    expected = read_position_timeout(driver, 1)
+
+    with pytest.raises(ServoTimeoutError):
+        driver.get_position(1)
+
+    # A single attempt, bounded by wire time rather than the ceiling.
+    assert limits == [expected]
+    assert expected < driver.latency_model.max_timeout / 4
+
+
+def test_default_timeout_shrinks_once_servo_is_warm(
+    driver, fake_transport, monkeypatch
+):
+    fake_transport.responder = position_reply
+    for _ in range(driver.latency_model.min_samples):
+        driver.get_position(1)
+
+    fake_transport.responder = None
+    warm = read_position_timeout(driver, 1)
+    limits = record_timeouts(driver, monkeypatch)
+    with pytest.raises(ServoTimeoutError):
+        driver.get_position(1)
+
+    # Reads are retried once before giving up, each on the learned timeout.
+    assert limits == [warm, warm]
+    assert warm < driver.latency_model.max_timeout / 2
+    assert len(fake_transport.sent) == driver.latency_model.min_samples + 2
+    assert driver.latency_model.stats.retries == 1
+
+
+def test_retry_recovers_a_lost_reply(driver, fake_transport):
+    fake_transport.responder = position_reply
+    for _ in range(driver.latency_model.min_samples):
+        driver.get_position(1)
+
+    sent = len(fake_transport.sent)
+    fake_transport.responder = lambda transport, frame: setattr(
+        transport, "responder", position_reply
+    )
+
+    assert driver.get_position(1) == 2048
+    assert len(fake_transport.sent) == sent + 2
+
+
+def test_explicit_timeout_is_a_single_attempt(driver, fake_transport):
+    fake_transport.responder = position_reply
+    for _ in range(driver.latency_model.min_samples):
+        driver.get_position(1)
+    fake_transport.responder = None
+    sent = len(fake_transport.sent)
+
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.read_position(1), 0.005)
+
+    assert len(fake_transport.sent) == sent + 1
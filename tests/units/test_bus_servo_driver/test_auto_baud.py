@@ -0,0 +1,35 @@
+from bus_servo_driver import ServoBusDriver
+from transport.simulator import SimulatedTransport, VirtualServo
+
+
+def make_driver(servos):
+    transport = SimulatedTransport(servos, realtime=False)
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+def test_detects_a_rate_per_servo_and_restores_the_bus():
+    driver = make_driver(
+        [
+            1,
+            VirtualServo(2, baudrate=115_200),
+            VirtualServo(3, baudrate=57_600),
+        ]
+    )
+
+    rates = driver.detect_baudrates([1, 2, 3, 4])
+
+    assert rates == {1: 1_000_000, 2: 115_200, 3: 57_600}
+    assert driver.transport.baudrate == 1_000_000
+    assert driver.latency_model.baudrate == 1_000_000
+
+
+def test_stays_at_the_shared_rate_and_stops_early():
+    driver = make_driver([VirtualServo(i, baudrate=500_000) for i in (1, 2)])
+
+    rates = driver.detect_baudrates([1, 2], rates=[1_000_000, 500_000, 9600])
+
+    assert rates == {1: 500_000, 2: 500_000}
+    assert driver.transport.baudrate == 500_000
+    # 1 Mbaud and 500 kbaud probed; 9600 never tried.
+    assert driver.transport.stats.requests == 4
+    assert driver.get_position(1) == 2048
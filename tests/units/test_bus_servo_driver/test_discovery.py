@@ -0,0 +1,96 @@
+from bus_servo_driver import ServoBusDriver
+from device_registry import DeviceRegistry
+from protocol.protocol import Instruction
+from transport.simulator import SimulatedTransport, VirtualServo
+
+
+class NoSyncReadTransport(SimulatedTransport):
+    """Servos with firmware that ignores SYNC READ."""
+
+    def _handle(self, request):
+        if request.instruction == Instruction.SYNC_READ:
+            return []
+        return super()._handle(request)
+
+
+def make_driver(transport):
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+def test_ping_many_finds_present_ids():
+    sim = SimulatedTransport([3, 7, 19], realtime=False)
+
+    assert make_driver(sim).ping_many(range(20)) == [3, 7, 19]
+    assert sim.stats.requests == 20
+
+
+def test_ping_many_waits_out_adapter_latency():
+    # Every reply reaches the host 10 ms late, as through a USB adapter.
+    sim = SimulatedTransport([3, 7, 252], realtime=False, host_latency=0.01)
+
+    assert make_driver(sim).ping_many(range(253)) == [3, 7, 252]
+
+
+def test_discover_waits_out_adapter_latency():
+    sim = SimulatedTransport([3, 7, 12], realtime=True, host_latency=0.016)
+
+    registry = make_driver(sim).discover(range(20))
+
+    assert registry.servo_ids == [3, 7, 12]
+
+
+def test_discover_fallback_read_waits_out_adapter_latency():
+    sim = NoSyncReadTransport([3, 7], realtime=True, host_latency=0.016)
+
+    registry = make_driver(sim).discover(range(10))
+
+    assert registry.servo_ids == [3, 7]
+
+
+def test_ping_many_through_reader():
+    sim = SimulatedTransport([3, 7], realtime=False)
+    driver = make_driver(sim)
+    driver.start_reader()
+    try:
+        assert driver.ping_many(range(10)) == [3, 7]
+    finally:
+        driver.stop_reader()
+
+
+def test_discover_reads_identity_with_one_sync_read():
+    sim = SimulatedTransport([VirtualServo(2, model=777), 9], realtime=False)
+
+    registry = make_driver(sim).discover(range(12))
+
+    assert registry.servo_ids == [2, 9]
+    assert registry[2].model == 777
+    assert registry[9].max_angle_limit == 4095
+    assert sim.stats.requests == 12 + 1
+
+
+def test_discover_falls_back_to_read_without_sync_read():
+    sim = NoSyncReadTransport([VirtualServo(2, model=777), 9], realtime=False)
+
+    registry = make_driver(sim).discover(range(12))
+
+    assert registry.servo_ids == [2, 9]
+    assert registry[2].model == 777
+
+
+def test_load_or_discover_skips_full_scan_when_unchanged(tmp_path):
+    path = str(tmp_path / "bus.json")
+    sim = SimulatedTransport([1, 4], realtime=False)
+    driver = make_driver(sim)
+
+    first = driver.load_or_discover(path)
+    full_scan = sim.stats.requests
+    second = driver.load_or_discover(path)
+
+    assert second == first == DeviceRegistry.load(path)
+    # Two pings and one SYNC READ instead of 253 pings.
+    assert sim.stats.requests - full_scan == 3
+
+    sim.servos[4].write_u16(3, 999)  # different model at a known id
+    third = driver.load_or_discover(path)
+    assert third[4].model == 999
+    assert DeviceRegistry.load(path)[4].model == 999
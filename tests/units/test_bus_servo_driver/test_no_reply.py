@@ -0,0 +1,34 @@
+from protocol.protocol import DeviceID, StatusReturnLevel
+
+
+def test_broadcast_execute_does_not_wait(driver, fake_transport):
+    reply = driver.execute(driver.protocol.ping(DeviceID.BROADCAST), timeout=10)
+
+    assert reply is None
+    assert len(fake_transport.sent) == 1
+    assert fake_transport.requested == []
+
+
+def test_per_call_fire_and_forget(driver, fake_transport):
+    assert driver.go_to_position(1, 1000, wait_reply=False) is None
+
+    assert len(fake_transport.sent) == 1
+    assert fake_transport.requested == []
+
+
+def test_read_only_status_level_skips_write_acks(driver, fake_transport):
+    driver.status_return_level = StatusReturnLevel.READ_ONLY
+    fake_transport.queue_status(1, [0x00, 0x04])
+
+    assert driver.go_to_position(1, 1024) is None
+    assert driver.get_position(1) == 1024
+    assert fake_transport.requested == [8]
+
+
+def test_submit_without_reply_resolves_immediately(driver, fake_transport):
+    driver.start_reader()
+
+    future = driver.submit(driver.protocol.action())
+
+    assert future.result(timeout=0) is None
+    assert len(fake_transport.sent) == 1
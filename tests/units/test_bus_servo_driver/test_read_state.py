@@ -0,0 +1,52 @@
+import dataclasses
+
+import pytest
+
+from protocol.packet_decoder import ServoState
+
+
+def test_read_state_uses_single_block_read(driver, fake_transport):
+    fake_transport.queue_status(
+        1,
+        [0x00, 0x08, 0x10, 0x80, 0x20, 0x00, 121, 35, 0, 0, 1, 0, 0, 0x05, 0x00],
+    )
+
+    state = driver.read_state(1)
+
+    assert len(fake_transport.sent) == 1
+    assert fake_transport.sent[0][5:-1] == bytes([56, 15])
+    assert state == ServoState(
+        position=2048,
+        speed=-16,
+        load=32,
+        voltage=12.1,
+        temperature=35,
+        moving=True,
+        current=5,
+    )
+
+
+def test_servo_state_is_immutable():
+    state = ServoState(0, 0, 0, 0.0, 0, False, 0)
+
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        state.position = 1
+
+
+def test_read_fields_coalesces_requests(driver, fake_transport):
+    fake_transport.queue_status(1, [0x00, 0x08, 0x10, 0x00])
+
+    values = driver.read_fields(1, ["speed", "position"])
+
+    assert len(fake_transport.sent) == 1
+    assert values == {"position": 2048, "speed": 16}
+
+
+def test_execute_requests_exact_response_length(driver, fake_transport):
+    fake_transport.replies += b"\x00\xff"
+    fake_transport.queue_status(1, [0x00, 0x08])
+
+    assert driver.get_position(1) == 2048
+    # 8-byte status frame requested at once, then the tail displaced by noise.
+    assert fake_transport.requested == [8, 2]
@@ -0,0 +1,99 @@
+import concurrent.futures
+
+import pytest
+
+from bus_servo_driver import ServoTimeoutError
+
+
+def echo_position(transport, frame):
+    servo_id = frame[2]
+    if frame[4] == 0x02:
+        transport.queue_status(servo_id, [servo_id, 0x00])
+    elif frame[4] == 0x82:
+        for sid in frame[7:-1]:
+            transport.queue_status(sid, [sid, 0x00])
+
+
+def test_submit_requires_reader(driver):
+    with pytest.raises(RuntimeError):
+        driver.submit(driver.protocol.ping(1))
+
+
+def test_submit_resolves_future(driver, fake_transport):
+    fake_transport.responder = echo_position
+    driver.start_reader()
+
+    future = driver.submit(driver.protocol.read_position(7))
+
+    assert driver._decoder.position(future.result(timeout=1)) == 7
+
+
+def test_submit_times_out(driver):
+    driver.start_reader()
+
+    future = driver.submit(driver.protocol.ping(1), timeout=0.01)
+
+    with pytest.raises(ServoTimeoutError):
+        future.result(timeout=1)
+
+
+def test_threads_share_the_bus(driver, fake_transport):
+    fake_transport.responder = echo_position
+    driver.start_reader()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(driver.get_position, range(1, 33)))
+
+    assert results == list(range(1, 33))
+
+
+def test_sync_read_through_reader(driver, fake_transport):
+    fake_transport.responder = echo_position
+    driver.start_reader()
+
+    result = driver.sync_read([1, 2, 3], 56, 2)
+
+    assert result.complete
+    assert driver._decoder.position(result[3]) == 3
+
+
+def test_stop_reader_cancels_pending(driver):
+    driver.start_reader()
+    future = driver.submit(driver.protocol.ping(1), timeout=10)
+
+    driver.stop_reader()
+
+    assert future.cancelled()
+
+
+def test_reader_death_fails_pending_and_later_calls(driver, fake_transport):
+    driver.start_reader()
+    future = driver.submit(driver.protocol.ping(1), timeout=10)
+
+    def broken(max_bytes: int = 64) -> bytes:
+        raise OSError("port unplugged")
+
+    fake_transport.receive = broken
+
+    with pytest.raises(OSError):
+        future.result(timeout=1)
+    assert not driver.reader_running
+    with pytest.raises(RuntimeError):
+        driver.get_position(1)
+    with pytest.raises(RuntimeError):
+        driver.submit(driver.protocol.ping(1))
+
+    del fake_transport.receive
+    fake_transport.responder = echo_position
+    driver.start_reader()
+    assert driver.get_position(4) == 4
+
+
+def test_short_request_expires_behind_long_one(driver):
+    driver.start_reader()
+    slow = driver.submit(driver.protocol.ping(1), timeout=10)
+    fast = driver.submit(driver.protocol.ping(1), timeout=0.01)
+
+    with pytest.raises(ServoTimeoutError):
+        fast.result(timeout=1)
+    assert not slow.done()
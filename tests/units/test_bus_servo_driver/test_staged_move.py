@@ -0,0 +1,36 @@
+import pytest
+
+from protocol.protocol import DeviceID, Instruction
+from transport.simulator import SimulatedTransport
+
+
+@pytest.fixture
+def sim_driver():
+    from bus_servo_driver import ServoBusDriver
+
+    transport = SimulatedTransport([1, 2, 3], realtime=False)
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+def test_staged_goals_apply_only_on_action(sim_driver):
+    targets = {1: (100, 1000, 50), 2: (200, 1000, 50), 3: (300, 1000, 50)}
+
+    sim_driver.stage_positions(targets)
+    assert [sim_driver.get_position(i) for i in (1, 2, 3)] == [2048] * 3
+
+    sim_driver.action()
+    assert [sim_driver.get_position(i) for i in (1, 2, 3)] == [100, 200, 300]
+
+
+def test_staged_move_frames(driver, fake_transport):
+    targets = {1: (100, 1000, 50), 2: (200, 1000, 50)}
+
+    driver.go_to_positions_staged(targets, wait_ack=False)
+
+    assert [frame[4] for frame in fake_transport.sent] == [
+        Instruction.REG_WRITE,
+        Instruction.REG_WRITE,
+        Instruction.ACTION,
+    ]
+    assert fake_transport.sent[-1][2] == DeviceID.BROADCAST
+    assert fake_transport.requested == []
@@ -0,0 +1,36 @@
+import pytest
+
+from bus_servo_driver import ServoTimeoutError
+from protocol.protocol import DeviceID, Instruction, SCSRegister
+
+
+def test_sync_read_request_frame(driver, fake_transport):
+    driver.sync_read([1, 2, 3], SCSRegister.PRESENT_POSITION_L, 2, timeout=0)
+
+    frame = fake_transport.sent[0]
+    assert frame[2] == DeviceID.BROADCAST
+    assert frame[4] == Instruction.SYNC_READ
+    assert frame[5:-1] == bytes([56, 2, 1, 2, 3])
+
+
+def test_sync_read_collects_all_replies(driver, fake_transport):
+    fake_transport.queue_status(2, [0x34, 0x12])
+    fake_transport.queue_status(1, [0x00, 0x08])
+
+    result = driver.sync_read([1, 2], SCSRegister.PRESENT_POSITION_L, 2)
+
+    assert result.complete
+    assert driver._decoder.position(result[1]) == 0x0800
+    assert driver._decoder.position(result[2]) == 0x1234
+
+
+def test_sync_read_reports_missing_servos(driver, fake_transport):
+    fake_transport.queue_status(1, [0x00, 0x08])
+    fake_transport.queue_status(3, [0x00])
+
+    result = driver.sync_read([1, 2, 3], SCSRegister.PRESENT_POSITION_L, 2, timeout=0.01)
+
+    assert not result.complete
+    assert result.missing == (2, 3)
+    with pytest.raises(ServoTimeoutError):
+        result[2]
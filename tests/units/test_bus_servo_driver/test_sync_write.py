@@ -0,0 +1,39 @@
+import pytest
+
+from protocol.protocol import DeviceID, Instruction, ServoProtocol
+from protocol.serializer import PacketSerializer
+
+
+def test_sync_write_packet_layout():
+    packet = ServoProtocol.sync_write(42, {1: [0x10, 0x20], 2: [0x30, 0x40]})
+
+    assert packet.servo_id == DeviceID.BROADCAST
+    assert packet.instruction == Instruction.SYNC_WRITE
+    assert packet.params == bytes([42, 2, 1, 0x10, 0x20, 2, 0x30, 0x40])
+
+
+def test_sync_write_rejects_uneven_data():
+    with pytest.raises(ValueError):
+        ServoProtocol.sync_write(42, {1: [0x10], 2: [0x30, 0x40]})
+
+
+def test_sync_write_frame_may_exceed_regular_length():
+    targets = {servo_id: (2048, 1000, 50) for servo_id in range(1, 13)}
+    packet = ServoProtocol().sync_write_absolute_move(targets)
+
+    frame = PacketSerializer().serialize(packet)
+
+    assert frame[:5] == bytes([0xFF, 0xFF, 0xFE, 2 + 12 * 8 + 2, 0x83])
+    assert frame[-1] == (~sum(frame[2:-1])) & 0xFF
+
+
+def test_go_to_positions_sends_single_frame_without_waiting(driver, fake_transport):
+    driver.go_to_positions({1: (0, 1000, 50), 2: (4095, 2400, 100)})
+
+    assert len(fake_transport.sent) == 1
+    frame = fake_transport.sent[0]
+    assert frame[2] == DeviceID.BROADCAST
+    assert frame[4] == Instruction.SYNC_WRITE
+    assert frame[5:7] == bytes([41, 7])
+    assert frame[7:15] == bytes([1, 50, 0x00, 0x00, 0, 0, 0xE8, 0x03])
+    assert frame[15:23] == bytes([2, 100, 0xFF, 0x0F, 0, 0, 0x60, 0x09])
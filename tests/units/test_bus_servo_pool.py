@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from bus_servo_driver import ServoBusDriver
+from bus_servo_pool import ServoBusPool
+from transport.simulator import SimulatedTransport
+
+
+def make_pool(realtime: bool = False, **buses):
+    drivers = {}
+    registry = {}
+    for name, ids in buses.items():
+        transport = SimulatedTransport(ids, realtime=realtime)
+        drivers[name] = ServoBusDriver(name, transport.baudrate, transport=transport)
+        registry.update({servo_id: name for servo_id in ids})
+    return ServoBusPool(drivers, registry)
+
+
+def test_routes_servo_ids_to_their_bus():
+    with make_pool(a=[1, 2], b=[3]) as pool:
+        pool.go_to_position(3, 1000)
+
+        assert pool.bus_for(1) == "a"
+        assert pool.driver_for(3).transport.servos[3].read_u16(42) == 1000
+        assert pool.split([3, 1, 2]) == {"b": [3], "a": [1, 2]}
+        with pytest.raises(KeyError):
+            pool.bus_for(9)
+
+
+def test_sync_write_and_read_span_buses():
+    ids = [1, 2, 3, 4]
+    with make_pool(a=[1, 2], b=[3, 4]) as pool:
+        pool.go_to_positions({servo_id: (servo_id * 100, 0, 0) for servo_id in ids})
+        pool.assign(5, "b")  # registered, but nothing answers
+        result = pool.sync_read(ids + [5], 56, 2, timeout=0.01)
+
+    assert result.missing == (5,)
+    assert {sid: bytes(p.params) for sid, p in result.packets.items()} == {
+        1: (100).to_bytes(2, "little"),
+        2: (200).to_bytes(2, "little"),
+        3: (300).to_bytes(2, "little"),
+        4: (400).to_bytes(2, "little"),
+    }
+    for name in ("a", "b"):
+        assert pool.drivers[name].transport.stats.requests == 2
+
+
+def test_unknown_bus_rejected():
+    with pytest.raises(ValueError):
+        make_pool(a=[1]).assign(2, "missing")
+
+
+class RendezvousTransport(SimulatedTransport):
+    """Blocks its first send until every bus sharing ``barrier`` sends too."""
+
+    def __init__(self, servos, barrier: threading.Barrier):
+        super().__init__(servos, realtime=False)
+        self.barrier = barrier
+
+    def send(self, data: bytes):
+        if self.barrier is not None:
+            barrier, self.barrier = self.barrier, None
+            barrier.wait()  # BrokenBarrierError if the other bus never sends
+        super().send(data)
+
+
+def test_buses_run_concurrently():
+    # Each bus's first request waits for the other's: serialised buses would
+    # break the barrier instead of completing.
+    barrier = threading.Barrier(2, timeout=5)
+    transports = {
+        "a": RendezvousTransport([1, 2], barrier),
+        "b": RendezvousTransport([3, 4], barrier),
+    }
+    drivers = {
+        name: ServoBusDriver(name, transport.baudrate, transport=transport)
+        for name, transport in transports.items()
+    }
+    with ServoBusPool(drivers, {1: "a", 2: "a", 3: "b", 4: "b"}) as pool:
+        states = pool.read_states([1, 2, 3, 4])
+
+    assert len(states) == 4
+    assert not barrier.broken
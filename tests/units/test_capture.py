@@ -0,0 +1,156 @@
+import asyncio
+import socket
+
+import pytest
+
+from bus_servo_driver import ServoBusDriver
+from protocol.deserializer import PacketDeserializer
+from protocol.packet_decoder import PacketDecoder
+from protocol.protocol import Instruction
+from transport.capture import (
+    CaptureFormatError,
+    CaptureReader,
+    CaptureTransport,
+    CaptureWriter,
+    Direction,
+)
+from transport.async_serial import AsyncSerialTransport
+from transport.simulator import SimulatedTransport
+
+
+@pytest.fixture
+def capture_path(tmp_path):
+    path = str(tmp_path / "bus.cap")
+    sim = SimulatedTransport([1, 2], realtime=False)
+    transport = CaptureTransport(sim, path)
+    driver = ServoBusDriver("sim", sim.baudrate, transport=transport)
+
+    driver.go_to_position(1, 1000)
+    driver.read_state(1)
+    driver.read_state(2)
+    transport.close()
+    return path
+
+
+def test_records_are_direction_tagged_and_ordered(capture_path):
+    with CaptureReader(capture_path) as reader:
+        records = [
+            (record.timestamp_ns, record.direction, bytes(record.data))
+            for record in reader.records()
+        ]
+
+    stamps = [stamp for stamp, _, _ in records]
+    directions = [direction for _, direction, _ in records]
+    assert stamps == sorted(stamps)
+    assert directions[:2] == [Direction.TX, Direction.RX]
+    assert records[0][2][:5] == b"\xff\xff\x01\x0a\x03"
+
+
+def test_replay_decodes_captured_traffic(capture_path):
+    with CaptureReader(capture_path) as reader:
+        requests = [packet for _, packet in reader.packets(Direction.TX)]
+        replies = [packet for _, packet in reader.packets()]
+        (batch,) = reader.packet_batches()
+
+        assert [p.instruction for p in requests] == [
+            Instruction.WRITE,
+            Instruction.READ,
+            Instruction.READ,
+        ]
+        assert [p.servo_id for p in replies] == [1, 1, 2]
+        assert PacketDecoder.state(replies[1]).position == 1000
+        assert [p.servo_id for p in batch] == [1, 1, 2]
+
+
+def test_truncated_tail_record_is_ignored(tmp_path):
+    path = str(tmp_path / "cut.cap")
+    writer = CaptureWriter(path)
+    writer.write(Direction.RX, b"\xff\xff\x01\x02\x00\xfc")
+    writer.write(Direction.RX, b"\xff\xff\x02\x02\x00\xfb")
+    writer.close()
+    with open(path, "r+b") as fp:
+        fp.truncate(fp.seek(0, 2) - 3)
+
+    with CaptureReader(path) as reader:
+        assert [p.servo_id for _, p in reader.packets()] == [1]
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "junk.cap"
+    path.write_bytes(b"not a capture file")
+
+    with pytest.raises(CaptureFormatError):
+        CaptureReader(str(path))
+
+
+def test_replay_keeps_long_sync_frames(tmp_path):
+    path = str(tmp_path / "sync.cap")
+    ids = list(range(1, 13))
+    sim = SimulatedTransport(ids, realtime=False)
+    transport = CaptureTransport(sim, path)
+    driver = ServoBusDriver("sim", sim.baudrate, transport=transport)
+
+    driver.go_to_positions({servo_id: (servo_id * 10, 0, 0) for servo_id in ids})
+    driver.get_position(1)
+    transport.close()
+
+    with CaptureReader(path) as reader:
+        requests = [packet for _, packet in reader.packets(Direction.TX)]
+        (batch,) = reader.packet_batches(Direction.TX)
+
+        assert [p.instruction for p in requests] == [
+            Instruction.SYNC_WRITE,
+            Instruction.READ,
+        ]
+        assert len(requests[0].params) > PacketDeserializer.MAX_FRAME_LENGTH
+        assert [p.instruction for p in batch] == [p.instruction for p in requests]
+
+
+class ChokedPort:
+    """Serial stand-in whose TX buffer takes at most ``accept`` bytes a write."""
+
+    def __init__(self, accept: int):
+        self.accept = accept
+        self._sock, self._peer = socket.socketpair()
+
+    def open(self):
+        pass
+
+    def close(self):
+        self._sock.close()
+        self._peer.close()
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def receive_nowait(self, max_bytes: int = 4096) -> bytes:
+        return b""
+
+    def send_nowait(self, data: bytes) -> int:
+        return min(len(data), self.accept)
+
+
+def test_async_writes_are_captured_as_accepted(tmp_path):
+    path = str(tmp_path / "async.cap")
+    port = ChokedPort(accept=4)
+
+    async def scenario():
+        transport = AsyncSerialTransport("fake", transport=CaptureTransport(port, path))
+        await transport.open()
+        transport.send(b"\xff\xff\x01\x02\x01\xfb")
+        while transport.pending_output:
+            await asyncio.sleep(0)
+        await transport.close()
+
+    asyncio.run(scenario())
+
+    with CaptureReader(path) as reader:
+        chunks = [
+            bytes(record.data)
+            for record in reader.records()
+            if record.direction == Direction.TX
+        ]
+        (ping,) = [packet for _, packet in reader.packets(Direction.TX)]
+
+    assert chunks == [b"\xff\xff\x01\x02", b"\x01\xfb"]
+    assert ping.instruction == Instruction.PING
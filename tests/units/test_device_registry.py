@@ -0,0 +1,28 @@
+from device_registry import DeviceInfo, DeviceRegistry
+
+
+def device(servo_id: int, model: int = 777) -> DeviceInfo:
+    return DeviceInfo(servo_id, model, 3, 6, 0, 250, 1, 0, 4095)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "bus.json")
+    registry = DeviceRegistry([device(4), device(1)], baudrate=1_000_000)
+
+    registry.save(path)
+    loaded = DeviceRegistry.load(path)
+
+    assert loaded == registry
+    assert loaded.servo_ids == [1, 4]
+    assert loaded[4].return_delay == 250
+
+
+def test_load_ignores_missing_or_corrupt_files(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    stale = tmp_path / "stale.json"
+    stale.write_text('{"version": 0, "devices": []}')
+
+    assert DeviceRegistry.load(str(tmp_path / "missing.json")) is None
+    assert DeviceRegistry.load(str(corrupt)) is None
+    assert DeviceRegistry.load(str(stale)) is None
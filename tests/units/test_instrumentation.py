@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+import bus_servo_driver
+from bus_servo_driver import ServoBusDriver, ServoTimeoutError
+from instrumentation import Instrumentation, LatencyHistogram
+from protocol.protocol import Instruction
+from transport.simulator import SimulatedTransport
+
+
+@pytest.fixture
+def traces():
+    return []
+
+
+@pytest.fixture
+def driver(traces):
+    transport = SimulatedTransport([1, 2], realtime=False)
+    driver = ServoBusDriver(
+        "sim",
+        transport.baudrate,
+        transport=transport,
+        instrumentation=Instrumentation(exporter=traces.append),
+    )
+    yield driver
+    driver.stop_reader()
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    histogram = LatencyHistogram()
+    for us in (100, 100, 100, 900):
+        histogram.record(us * 1000)
+
+    assert histogram.count == 4
+    assert histogram.mean_ns == 300_000
+    assert histogram.percentile(0.5) == 128_000
+    assert histogram.percentile(0.99) == 900_000
+    assert histogram.min_ns == 100_000
+
+
+@pytest.mark.parametrize("reader", [False, True])
+def test_read_is_traced_and_counted(driver, traces, reader):
+    if reader:
+        driver.start_reader()
+
+    driver.get_position(1)
+
+    (trace,) = traces
+    assert trace.ok
+    assert (trace.servo_id, trace.instruction) == (1, Instruction.READ)
+    assert trace.serialize_ns <= trace.send_ns <= trace.first_byte_ns
+    assert trace.first_byte_ns <= trace.complete_ns
+
+    snapshot = driver.instrumentation.snapshot()
+    assert snapshot["counters"]["transactions"] == 1
+    assert snapshot["counters"]["bytes_out"] == 8
+    assert snapshot["counters"]["bytes_in"] == 8
+    assert snapshot["latency"][0]["count"] == 1
+
+
+def test_timeouts_and_sync_read_misses_are_counted(driver, traces):
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.read_position(9), 0.01)
+    driver.sync_read([1, 2, 9], 56, 2, timeout=0.01)
+
+    assert not traces[0].ok
+    assert driver.instrumentation.counters.timeouts == 2
+
+
+def test_reader_timeout_finishes_the_trace(driver, traces, monkeypatch):
+    release = threading.Event()
+    receive = driver.transport.receive
+
+    def stuck(max_bytes):
+        # The reader never gets to expire the request itself.
+        release.wait()
+        return receive(max_bytes)
+
+    monkeypatch.setattr(driver.transport, "receive", stuck)
+    monkeypatch.setattr(bus_servo_driver, "READER_GRACE", 0.0)
+    driver.start_reader()
+    try:
+        with pytest.raises(ServoTimeoutError):
+            driver.execute(driver.protocol.read_position(1), 0.01)
+    finally:
+        release.set()
+
+    (trace,) = traces
+    assert not trace.ok
+    assert driver.instrumentation.counters.timeouts == 1
+    assert not any(driver._pending.values())
+
+
+def test_checksum_failures_and_resyncs_come_from_deserializer(driver):
+    driver.deserializer.feed(b"\x00\xff\xff\x01\x02\x00\x00")
+
+    counters = driver.instrumentation.snapshot()["counters"]
+    assert counters["checksum_failures"] == 1
+    assert counters["resyncs"] == 1
+
+
+def test_disabled_by_default():
+    transport = SimulatedTransport([1], realtime=False)
+    driver = ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+    assert driver.instrumentation is None
+    assert driver.get_position(1) == 2048
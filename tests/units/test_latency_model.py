@@ -0,0 +1,69 @@
+import pytest
+
+from latency_model import LatencyModel
+from protocol.protocol import Instruction
+
+
+def warm(model: LatencyModel, servo_id: int, rtt: float):
+    for _ in range(model.min_samples):
+        model.observe(servo_id, rtt)
+
+
+def test_expected_round_trip_from_wire_time():
+    model = LatencyModel(1_000_000, return_delay=0.0005, host_latency=0.001)
+
+    # 8 + 8 bytes at 10 bits/byte, one return delay, host allowance.
+    assert model.expected(8, 8) == pytest.approx(160e-6 + 0.0005 + 0.001)
+    assert model.expected(8, 8, replies=3) == pytest.approx(
+        (8 + 24) * 10e-6 + 3 * 0.0005 + 0.001
+    )
+
+
+def test_cold_servo_uses_wire_time_and_no_retries():
+    model = LatencyModel(
+        1_000_000, return_delay=0.0005, host_latency=0.001, usb_latency=0.016
+    )
+
+    floor = 160e-6 + 0.0005 + 0.001
+    assert model.timeout(1, 8, 8) == pytest.approx(floor * model.margin + 0.016)
+    assert model.timeout(1, 8, 8) < model.max_timeout
+    assert model.attempts(1, Instruction.READ) == 1
+
+
+def test_warm_servo_timeout_follows_observed_quantile():
+    model = LatencyModel(1_000_000, host_latency=0.0, return_delay=0.0, margin=2.0)
+
+    warm(model, 1, 0.004)
+
+    assert model.observed(1) == pytest.approx(0.004)
+    assert model.timeout(1, 8, 8) == pytest.approx(0.008)
+    assert model.attempts(1, Instruction.READ) == model.retries + 1
+    assert model.attempts(1, Instruction.WRITE) == 1
+
+
+def test_timeout_is_never_below_wire_time_or_min_timeout():
+    model = LatencyModel(9600, host_latency=0.0, return_delay=0.0, margin=1.0)
+    warm(model, 1, 1e-6)
+
+    assert model.timeout(1, 8, 8) == pytest.approx(16 * 10 / 9600)
+
+    fast = LatencyModel(1_000_000, host_latency=0.0, return_delay=0.0)
+    warm(fast, 1, 1e-6)
+    assert fast.timeout(1, 8, 8) == fast.min_timeout
+
+
+def test_sync_timeout_stays_cold_until_every_servo_is_warm():
+    model = LatencyModel(
+        1_000_000,
+        host_latency=0.0,
+        return_delay=0.0,
+        usb_latency=0.0,
+        margin=1.0,
+        min_timeout=1e-4,
+    )
+    warm(model, 1, 0.002)
+
+    assert model.sync_timeout([1, 2], 10, 8) == pytest.approx(26e-5)
+
+    warm(model, 2, 0.003)
+    assert model.sync_timeout([1, 2], 10, 8) == pytest.approx(26e-5 + 0.003)
@@ -15,7 +15,7 @@ def test_minimum_valid_frame():
     assert len(packets) == 1
     assert packets[0].servo_id == 1
     assert packets[0].instruction == 0x00
-    assert packets[0].params == []
+    assert packets[0].params == b""
 
 
 def test_valid_frame_with_parameters():
@@ -61,3 +61,109 @@ def test_empty_buffer():
 def test_edge_case_frame_length_zero():
     """Test for valid frame with a LENGTH field of 0."""
     pass
+
+
+def test_frame_split_across_feeds():
+    frame = b"\xff\xff\x01\x04\x00\x00\x08\xf2"
+    deserializer = PacketDeserializer()
+
+    packets = []
+    for i in range(len(frame)):
+        packets += deserializer.feed(frame[i : i + 1])
+
+    assert len(packets) == 1
+    assert packets[0].servo_id == 1
+    assert packets[0].params == b"\x00\x08"
+
+
+def test_many_frames_in_one_chunk_with_noise():
+    frame_1 = b"\xff\xff\x01\x02\x00\xfc"
+    frame_2 = b"\xff\xff\x02\x04\x00\x00\x08\xf1"
+    deserializer = PacketDeserializer()
+
+    packets = deserializer.feed(b"\x00\x13" + frame_1 + b"\xaa" + frame_2 + b"\xff")
+
+    assert [p.servo_id for p in packets] == [1, 2]
+    assert deserializer.feed(b"\xff\x03\x02\x00\xfa")[0].servo_id == 3
+
+
+def test_bad_checksum_frame_is_dropped():
+    deserializer = PacketDeserializer()
+
+    assert deserializer.feed(b"\xff\xff\x01\x02\x00\x00") == []
+    assert len(deserializer.feed(b"\xff\xff\x01\x02\x00\xfc")) == 1
+
+
+def test_resync_finds_frame_inside_bad_length_candidate():
+    deserializer = PacketDeserializer()
+
+    # The leading 0xFF is noise: "FF FF FF" first looks like id 0xFF with length 0xFF.
+    packets = deserializer.feed(b"\xff\xff\xff\xff\x01\x02\x00\xfc")
+
+    assert [p.servo_id for p in packets] == [1]
+    assert deserializer.stats.bad_lengths == 2
+    assert deserializer.stats.dropped_bytes == 2
+
+
+def test_resync_finds_frame_inside_bad_checksum_candidate():
+    good = b"\xff\xff\x01\x02\x00\xfc"
+    deserializer = PacketDeserializer()
+
+    # A stray header whose claimed length swallows the genuine frame.
+    packets = deserializer.feed(b"\xff\xff\x07\x06" + good)
+
+    assert [p.servo_id for p in packets] == [1]
+    assert deserializer.stats.bad_checksums == 1
+    assert deserializer.stats.dropped_bytes == 4
+
+
+def test_noise_header_claiming_long_frame_does_not_block_reply():
+    good = b"\xff\xff\x01\x02\x00\xfc"
+    deserializer = PacketDeserializer()
+
+    # The stray header claims 0x30 bytes; only the genuine reply follows.
+    packets = deserializer.feed(b"\xff\xff\x07\x30" + good)
+
+    assert [p.servo_id for p in packets] == [1]
+    assert deserializer.stats.bad_lengths == 1
+    assert deserializer.pending == 0
+
+
+def test_long_frame_split_across_feeds_is_not_abandoned():
+    params = bytes(range(40))
+    body = bytes([0x05, len(params) + 2, 0x00]) + params
+    frame = b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])
+    deserializer = PacketDeserializer()
+
+    packets = []
+    for i in range(0, len(frame), 3):
+        packets += deserializer.feed(frame[i : i + 3])
+
+    assert [p.servo_id for p in packets] == [5]
+    assert deserializer.stats.bad_lengths == 0
+
+
+def test_resyncs_count_each_loss_of_alignment():
+    frame_1 = b"\xff\xff\x01\x02\x00\xfc"
+    frame_2 = b"\xff\xff\x02\x04\x00\x00\x08\xf1"
+    deserializer = PacketDeserializer()
+
+    deserializer.feed(frame_1 + frame_2)
+    assert deserializer.stats.resyncs == 0
+
+    deserializer.feed(b"\x00\x13" + frame_1 + b"\xaa" + frame_2)
+    assert deserializer.stats.resyncs == 2
+
+    # Two rejected candidates back to back are a single resync.
+    deserializer.feed(b"\xff\xff\xff\xff\x01\x02\x00\xfc")
+    assert deserializer.stats.resyncs == 3
+
+
+def test_packet_params_are_a_view_of_the_frame():
+    deserializer = PacketDeserializer()
+
+    (packet,) = deserializer.feed(b"\xff\xff\x01\x04\x00\x00\x08\xf2")
+
+    assert isinstance(packet.params, memoryview)
+    assert packet.params.readonly
+    assert not hasattr(packet, "__dict__")
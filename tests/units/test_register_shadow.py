@@ -0,0 +1,133 @@
+import sys
+import threading
+
+import pytest
+
+from bus_servo_driver import ServoBusDriver
+from protocol.protocol import SCSRegister
+from register_shadow import RegisterShadow
+from transport.simulator import SimulatedTransport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sim():
+    return SimulatedTransport([1, 2], realtime=False)
+
+
+def make_driver(sim, shadow):
+    return ServoBusDriver("sim", sim.baudrate, transport=sim, shadow=shadow)
+
+
+def test_identical_goal_writes_are_suppressed(sim, clock):
+    shadow = RegisterShadow(clock=clock)
+    driver = make_driver(sim, shadow)
+
+    driver.go_to_position(1, 1000)
+    driver.go_to_position(1, 1000)
+    driver.go_to_position(1, 1001)
+
+    assert sim.stats.requests == 2
+    assert shadow.stats.writes_suppressed == 1
+    assert shadow.stats.writes_forwarded == 2
+
+
+def test_eeprom_reads_are_served_from_cache(sim, clock):
+    shadow = RegisterShadow(clock=clock)
+    driver = make_driver(sim, shadow)
+
+    first = driver.read_fields(1, ["model", "max_angle_limit"])
+    clock.now += 3600
+    second = driver.read_fields(1, ["model", "max_angle_limit"])
+
+    assert first == second
+    assert sim.stats.requests == 1
+    assert shadow.stats.read_hits == 1
+
+
+def test_sram_reads_respect_ttl(sim, clock):
+    shadow = RegisterShadow(sram_ttl=0.1, clock=clock)
+    driver = make_driver(sim, shadow)
+
+    driver.get_position(1)
+    clock.now += 0.05
+    driver.get_position(1)
+    clock.now += 0.1
+    driver.get_position(1)
+
+    assert sim.stats.requests == 2
+    assert shadow.stats.read_hits == 1
+
+
+def test_static_sram_addresses_never_go_stale(sim, clock):
+    shadow = RegisterShadow(static_addresses=[SCSRegister.GOAL_ACC], clock=clock)
+    driver = make_driver(sim, shadow)
+
+    first = driver.read_fields(1, ["goal_acc"])
+    clock.now += 3600
+    second = driver.read_fields(1, ["goal_acc"])
+    driver.get_position(1)
+    clock.now += 1
+    driver.get_position(1)
+
+    assert first == second
+    assert sim.stats.requests == 3
+    assert shadow.stats.read_hits == 1
+
+
+def test_static_addresses_must_fit_register_file():
+    with pytest.raises(ValueError):
+        RegisterShadow(static_addresses=[256])
+
+
+def test_sync_write_invalidates_shadow(sim, clock):
+    shadow = RegisterShadow(sram_ttl=10, clock=clock)
+    driver = make_driver(sim, shadow)
+
+    driver.go_to_position(1, 1000)
+    driver.go_to_positions({1: (1000, 0, 0)})
+    driver.go_to_position(1, 1000)
+
+    assert shadow.stats.writes_suppressed == 0
+
+
+def test_shadow_survives_concurrent_reader_updates():
+    shadow = RegisterShadow(sram_ttl=10)
+    stop = threading.Event()
+    errors = []
+
+    def reader_thread():
+        # What reader-thread completions do while the caller keeps reading.
+        try:
+            while not stop.is_set():
+                shadow.update(1, 0, bytes(64))
+                shadow.invalidate()
+        except Exception as exc:
+            errors.append(exc)
+
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    worker = threading.Thread(target=reader_thread)
+    worker.start()
+    try:
+        for _ in range(20_000):
+            shadow.read(1, 0, 64)
+            shadow.is_redundant_write(1, 0, bytes(4))
+    finally:
+        stop.set()
+        worker.join()
+        sys.setswitchinterval(switch)
+
+    assert errors == []
@@ -0,0 +1,45 @@
+import pytest
+
+from protocol.registers import REGISTER_TABLE, ReadPlanner
+
+
+def test_adjacent_registers_are_merged():
+    ranges = ReadPlanner().plan(["position", "speed", "load"])
+
+    assert [(r.address, r.size) for r in ranges] == [(56, 6)]
+
+
+def test_small_gaps_are_bridged():
+    ranges = ReadPlanner(max_gap=8).plan(["temperature", "current"])
+
+    assert [(r.address, r.size) for r in ranges] == [(63, 8)]
+
+
+def test_distant_registers_are_split():
+    ranges = ReadPlanner(max_gap=2).plan(["model", "position", "current"])
+
+    assert [(r.address, r.size) for r in ranges] == [(3, 2), (56, 2), (69, 2)]
+
+
+def test_max_size_limits_merging():
+    ranges = ReadPlanner(max_gap=64, max_size=8).plan(["position", "current"])
+
+    assert len(ranges) == 2
+
+
+def test_generic_decode_handles_sign_and_scale():
+    (read_range,) = ReadPlanner().plan(["speed", "voltage", "position"])
+
+    values = read_range.decode(bytes([0x00, 0x08, 0x10, 0x80, 0, 0, 121]))
+
+    assert values == {"position": 2048, "speed": -16, "voltage": 12.1}
+
+
+def test_unknown_register():
+    with pytest.raises(KeyError):
+        ReadPlanner().plan(["nope"])
+
+
+def test_read_only_flags():
+    assert REGISTER_TABLE["model"].read_only
+    assert not REGISTER_TABLE["goal_position"].read_only
@@ -0,0 +1,84 @@
+import socket
+
+import pytest
+
+from transport.serial import SerialTransport
+
+
+class FakeSerial:
+    """Counts read timeout changes; reads return whatever is queued."""
+
+    def __init__(self, timeout, **kwargs):
+        self._timeout = timeout
+        self.reconfigured = 0
+        self.rx = bytearray()
+        self.is_open = True
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self._timeout = value
+        self.reconfigured += 1
+
+    @property
+    def in_waiting(self):
+        return len(self.rx)
+
+    def read(self, size):
+        chunk = bytes(self.rx[:size])
+        del self.rx[:size]
+        return chunk
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    monkeypatch.setattr("transport.serial.serial.Serial", FakeSerial)
+    return SerialTransport("COM14", 1_000_000, timeout=0.01)
+
+
+def test_receive_exact_reuses_port_timeout(transport):
+    port = transport._serial
+
+    for _ in range(100):
+        port.rx += b"\xff" * 8
+        assert transport.receive_exact(8, timeout=0.2) == b"\xff" * 8
+        port.rx += b"\x01"
+        assert transport.receive(64) == b"\x01"
+
+    assert port.reconfigured == 0
+
+
+def test_receive_exact_stops_at_deadline(transport):
+    port = transport._serial
+    port.rx += b"\x01\x02"
+
+    assert transport.receive_exact(8, timeout=0.0) == b"\x01\x02"
+    assert port.reconfigured == 0
+
+
+def test_receive_exact_blocks_with_zero_port_timeout(monkeypatch):
+    monkeypatch.setattr("transport.serial.serial.Serial", FakeSerial)
+    transport = SerialTransport("COM14", 1_000_000, timeout=0)
+    port = transport._serial
+    port.rx += b"\x01\x02\x03"
+
+    assert transport.receive_exact(3, timeout=0.05) == b"\x01\x02\x03"
+    # One blocking read bounded by the deadline, not a non-blocking spin.
+    assert 0.04 <= port.timeout <= 0.05
+
+
+def test_send_nowait_returns_zero_when_tx_buffer_is_full(transport):
+    sock, peer = socket.socketpair()
+    sock.setblocking(False)
+    transport._serial.fileno = sock.fileno
+    try:
+        sent = [transport.send_nowait(b"\x00" * 4096) for _ in range(1000)]
+    finally:
+        sock.close()
+        peer.close()
+
+    assert sent[0] == 4096
+    assert sent[-1] == 0
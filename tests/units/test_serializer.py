@@ -0,0 +1,84 @@
+import pytest
+
+from protocol.protocol import ServoPacket, ServoProtocol
+from protocol.serializer import PacketSerializer, ServoSerializationError
+
+
+def test_ping_frame():
+    frame = PacketSerializer().serialize(ServoProtocol.ping(1))
+
+    assert frame == b"\xff\xff\x01\x02\x01\xfb"
+
+
+def test_trusted_path_matches_validated_path():
+    packet = ServoProtocol().write_absolute_move(3, 2048, speed=1000, acc=50)
+
+    validated = PacketSerializer(cache_size=0).serialize(packet)
+    trusted = PacketSerializer(cache_size=0).serialize(packet, trusted=True)
+
+    assert validated == trusted
+
+
+def test_repeated_packets_hit_the_cache():
+    serializer = PacketSerializer()
+    protocol = ServoProtocol()
+
+    first = serializer.serialize(protocol.read_position(1))
+    second = serializer.serialize(protocol.read_position(1))
+    serializer.serialize(protocol.read_position(2))
+
+    assert first is second
+    assert serializer.stats.cache_hits == 1
+    assert serializer.stats.cache_misses == 2
+
+
+def test_cache_is_bounded_lru():
+    serializer = PacketSerializer(cache_size=2)
+
+    serializer.serialize(ServoProtocol.ping(1))
+    serializer.serialize(ServoProtocol.ping(2))
+    serializer.serialize(ServoProtocol.ping(1))
+    serializer.serialize(ServoProtocol.ping(3))
+    serializer.serialize(ServoProtocol.ping(1))
+    serializer.serialize(ServoProtocol.ping(2))
+
+    assert serializer.stats.cache_hits == 2
+    assert serializer.stats.cache_misses == 4
+
+
+def test_invalid_packets_are_still_rejected():
+    serializer = PacketSerializer()
+
+    with pytest.raises(ServoSerializationError):
+        serializer.serialize(ServoPacket(servo_id=0xFF, instruction=1, params=b""))
+
+    with pytest.raises(ServoSerializationError):
+        serializer.serialize(ServoPacket(servo_id=1, instruction=3, params=[256]))
+
+    with pytest.raises(ServoSerializationError):
+        serializer.serialize(
+            ServoPacket(servo_id=300, instruction=1, params=b""), trusted=True
+        )
+
+
+def test_untrusted_packet_is_validated_on_a_cache_hit():
+    serializer = PacketSerializer()
+    packet = ServoPacket(servo_id=0xFF, instruction=1, params=b"")
+
+    serializer.serialize(packet, trusted=True)
+
+    with pytest.raises(ServoSerializationError):
+        serializer.serialize(packet)
+
+
+def test_sync_frames_are_not_cached():
+    serializer = PacketSerializer()
+    protocol = ServoProtocol()
+
+    serializer.serialize(protocol.read_position(1))
+    for tick in range(10):
+        serializer.serialize(protocol.sync_write_absolute_move({1: (tick, 0, 0)}))
+    serializer.serialize(protocol.read_position(1))
+
+    assert serializer.stats.cache_hits == 1
+    assert serializer.stats.cache_misses == 1
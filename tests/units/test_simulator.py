@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from bus_servo_driver import ServoBusDriver, ServoTimeoutError
+from protocol.protocol import Instruction, SCSRegister, ServoPacket
+from transport.simulator import FaultInjection, SimulatedTransport, VirtualServo
+
+
+def make_driver(transport):
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+def test_read_write_round_trip():
+    driver = make_driver(SimulatedTransport([1, 2], realtime=False))
+
+    driver.go_to_position(2, 1000)
+
+    assert driver.get_position(2) == 1000
+    assert driver.get_position(1) == 2048
+    assert driver.get_voltage(1) == 12.0
+
+
+def test_sync_write_and_sync_read():
+    driver = make_driver(SimulatedTransport([1, 2, 3], realtime=False))
+
+    driver.go_to_positions({1: (10, 0, 0), 2: (20, 0, 0), 3: (30, 0, 0)})
+    result = driver.sync_read([1, 2, 3, 4], SCSRegister.PRESENT_POSITION_L, 2)
+
+    assert result.missing == (4,)
+    assert [driver._decoder.position(result[i]) for i in (1, 2, 3)] == [10, 20, 30]
+
+
+def test_reg_write_applies_on_action():
+    transport = SimulatedTransport([1], realtime=False)
+    driver = make_driver(transport)
+    data = [0x00, 0x02]
+
+    driver.execute(
+        ServoPacket(1, int(Instruction.REG_WRITE), bytes([42] + data)), timeout=0.1
+    )
+    assert driver.get_position(1) == 2048
+
+    driver.execute(ServoPacket(1, int(Instruction.ACTION), b""), timeout=0.1)
+    assert driver.get_position(1) == 512
+
+
+def test_unknown_servo_times_out():
+    driver = make_driver(SimulatedTransport([1], realtime=False))
+
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.ping(9), timeout=0.01)
+
+
+def test_wire_time_is_modelled():
+    transport = SimulatedTransport([1], baudrate=57600, return_delay=0.0)
+    driver = make_driver(transport)
+
+    start = time.monotonic()
+    driver.read_state(1)
+    elapsed = time.monotonic() - start
+
+    # 8-byte request + 21-byte reply at 57600 baud is ~5 ms on the wire.
+    assert elapsed >= 29 * 10 / 57600
+
+
+def test_corrupted_reply_is_rejected():
+    faults = FaultInjection(corrupt_checksum_rate=1.0)
+    transport = SimulatedTransport([VirtualServo(1)], faults=faults, realtime=False)
+    driver = make_driver(transport)
+
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.read_position(1), timeout=0.01)
+
+    assert transport.stats.corrupted_replies == 1
+    assert driver.deserializer.stats.bad_checksums == 1
+
+
+def test_late_reply_times_out_without_realtime():
+    faults = FaultInjection(late_reply_rate=1.0, late_reply_delay=0.05)
+    transport = SimulatedTransport([VirtualServo(1)], faults=faults, realtime=False)
+    driver = make_driver(transport)
+
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.read_position(1), timeout=0.01)
+
+    assert transport.stats.late_replies == 1
+    # The reply is late, not lost.
+    assert len(transport.receive_exact(8, timeout=0.1)) == 8
+
+
+def test_servo_only_hears_its_own_baudrate():
+    sim = SimulatedTransport([1, VirtualServo(2, baudrate=115_200)], realtime=False)
+    driver = make_driver(sim)
+
+    with pytest.raises(ServoTimeoutError):
+        driver.execute(driver.protocol.ping(2), timeout=0.01)
+    driver.execute(driver.protocol.write(1, SCSRegister.BAUD_RATE, b"\x04"), 0.01)
+    sim.set_baudrate(115_200)
+
+    assert driver.execute(driver.protocol.ping(1), timeout=0.01) is not None
+    assert driver.execute(driver.protocol.ping(2), timeout=0.01) is not None
+    assert sim.servos[2].read(SCSRegister.BAUD_RATE, 1) == b"\x04"
+
+
+def test_write_past_register_file_is_truncated():
+    servo = VirtualServo(1)
+    size = VirtualServo.REGISTER_FILE_SIZE
+
+    servo.write(size - 2, b"\x01\x02\x03\x04")
+
+    assert len(servo.registers) == size
+    assert servo.read(size - 2, 4) == b"\x01\x02"
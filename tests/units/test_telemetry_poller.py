@@ -0,0 +1,95 @@
+import threading
+
+import numpy as np
+import pytest
+
+from bus_servo_driver import ServoBusDriver
+from telemetry_poller import TelemetryPoller
+from transport.simulator import SimulatedTransport
+
+
+@pytest.fixture
+def driver():
+    transport = SimulatedTransport([1, 2], realtime=False)
+    return ServoBusDriver("sim", transport.baudrate, transport=transport)
+
+
+@pytest.mark.parametrize("use_sync_read", [True, False])
+def test_poll_once_writes_rows(driver, use_sync_read):
+    poller = TelemetryPoller(
+        driver, [1, 2, 3], ["position", "voltage"], use_sync_read=use_sync_read
+    )
+
+    assert poller.poll_once() == 2
+
+    rows = poller.latest()
+    assert rows["servo_id"].tolist() == [1, 2]
+    assert rows["position"].tolist() == [2048, 2048]
+    assert rows["voltage"] == pytest.approx([12.0, 12.0])
+    assert poller.stats.missing == 1
+
+
+def test_latest_is_a_view_across_wraparound(driver):
+    poller = TelemetryPoller(driver, [1], ["position"], capacity=4, timeout=0.01)
+
+    for position in (10, 20, 30, 40, 50, 60):
+        driver.go_to_position(1, position)
+        poller.poll_once()
+
+    latest = poller.latest(3)
+    assert latest["position"].tolist() == [40, 50, 60]
+    assert np.shares_memory(latest, poller._ring)
+    assert len(poller.latest(100)) == 4
+
+
+def test_background_polling_and_iterator(driver):
+    poller = TelemetryPoller(driver, [1, 2], rate=500.0, capacity=64)
+
+    with poller:
+        batch = next(poller.samples(timeout=1.0))
+
+    assert len(batch) >= 1
+    assert set(batch["servo_id"]) <= {1, 2}
+    assert poller.stats.polls >= 1
+    assert poller.stats.achieved_rate > 0
+
+
+class InterleavedCondition:
+    """Condition that lets the poller append rows exactly when a reader waits
+    and again right after the reader releases the lock."""
+
+    def __init__(self, poller, on_wait, on_release):
+        self._cond = poller._cond
+        self._poller = poller
+        self._pending = [on_wait, on_release]
+        self._depth = 0
+
+    def __enter__(self):
+        self._cond.__enter__()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        self._cond.__exit__(*exc)
+        if self._depth == 0 and len(self._pending) == 1:
+            self._poller._append(self._pending.pop())
+
+    def wait(self, timeout=None):
+        if len(self._pending) == 2:
+            self._poller._append(self._pending.pop(0))
+        return self._cond.wait(0)
+
+    def notify_all(self):
+        self._cond.notify_all()
+
+
+def test_samples_do_not_shift_when_rows_arrive_between_reads(driver):
+    poller = TelemetryPoller(driver, [1], ["position"], capacity=16)
+    first = [(i, 1, i) for i in range(5)]
+    second = [(i, 1, i) for i in range(5, 10)]
+    poller._cond = InterleavedCondition(poller, first, second)
+
+    batches = [batch["timestamp"].tolist() for batch in poller.samples(timeout=0)]
+
+    assert batches == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from bus_servo_driver import ServoBusDriver
+from trajectory_engine import Trajectory, TrajectoryStreamer, sync_write_wire_time
+from transport.simulator import SimulatedTransport
+
+
+@pytest.mark.parametrize("profile", ["trapezoid", "cubic"])
+def test_profile_hits_waypoints_monotonically(profile):
+    trajectory = Trajectory.from_waypoints(
+        [1, 2],
+        [[0, 4000], [1000, 3000], [2000, 1000]],
+        [0.0, 0.5, 1.0],
+        rate=100,
+        profile=profile,
+    )
+
+    assert trajectory.positions.shape == (101, 2)
+    assert trajectory.speeds.shape == (101, 2)
+    assert trajectory.positions[0].tolist() == [0, 4000]
+    assert trajectory.positions[50].tolist() == [1000, 3000]
+    assert trajectory.positions[-1].tolist() == [2000, 1000]
+    assert np.all(np.diff(trajectory.positions[:, 0].astype(int)) >= 0)
+    assert np.all(np.diff(trajectory.positions[:, 1].astype(int)) <= 0)
+
+
+@pytest.mark.parametrize("end, rate", [(0.29, 100), (0.25, 30)])
+def test_last_tick_reaches_final_waypoint(end, rate):
+    trajectory = Trajectory.from_waypoints([1], [[0], [1000]], [0.0, end], rate=rate)
+
+    assert trajectory.positions[-1].tolist() == [1000]
+    assert trajectory.ticks == int(np.ceil(end * rate)) + 1
+
+
+def test_speeds_never_set_the_direction_bit():
+    trajectory = Trajectory.from_waypoints([1], [[0], [4095]], [0.0, 0.01], rate=1000)
+
+    assert trajectory.speeds.max() == 0x7FFF
+
+
+def test_speed_is_for_the_move_into_each_setpoint():
+    trajectory = Trajectory.from_waypoints(
+        [1], [[0], [1000]], [0.0, 1.0], rate=10, profile="cubic"
+    )
+
+    steps = np.abs(np.diff(trajectory.positions[:, 0].astype(int)))
+    speeds = trajectory.speeds[:, 0]
+    assert speeds[1:].tolist() == (steps * 10).tolist()
+    # Never 0 ("maximum speed"), including the start and the final approach.
+    assert speeds.min() >= 1
+    assert 0 < speeds[-1] < speeds.max()
+
+
+@pytest.mark.parametrize(
+    "waypoints, times, kwargs",
+    [
+        ([[0, 0]], [0.0], {}),
+        ([[0], [10]], [0.0, 1.0], {}),
+        ([[0, 0], [10, 10]], [1.0, 1.0], {}),
+        ([[0, 0], [5000, 0]], [0.0, 1.0], {}),
+        ([[0, 0], [10, 10]], [0.0, 1.0], {"profile": "sine"}),
+        ([[0, 0], [10, 10]], [0.0, 1.0], {"ramp": 0.5}),
+    ],
+)
+def test_invalid_waypoints_raise(waypoints, times, kwargs):
+    with pytest.raises(ValueError):
+        Trajectory.from_waypoints([1, 2], waypoints, times, **kwargs)
+
+
+def test_wire_time_scales_with_joints():
+    assert sync_write_wire_time(1, 1_000_000) == pytest.approx(16e-5)
+    assert sync_write_wire_time(12, 1_000_000) == pytest.approx(104e-5)
+
+
+def test_streamer_sends_one_sync_write_per_tick():
+    sim = SimulatedTransport([1, 2], realtime=False)
+    driver = ServoBusDriver("sim", sim.baudrate, transport=sim)
+    trajectory = Trajectory.from_waypoints(
+        [1, 2], [[100, 200], [300, 400]], [0.0, 0.05], rate=200
+    )
+
+    report = TrajectoryStreamer(driver).run(trajectory)
+
+    assert 0 < report.ticks <= trajectory.ticks
+    assert sim.stats.requests == report.ticks
+    assert sim.stats.replies == 0
+    assert sim.servos[1].read_u16(42) == 300
+    assert sim.servos[2].read_u16(42) == 400
+    assert 0 < report.bus_utilisation < 1
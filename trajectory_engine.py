@@ -0,0 +1,221 @@
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from bus_servo_driver import ServoBusDriver
+
+# 1 start bit + 8 data bits + 1 stop bit
+BITS_PER_BYTE = 10
+# SYNC WRITE of an absolute move: servo id + 7 data bytes per joint.
+SYNC_MOVE_BYTES_PER_JOINT = 8
+# header (2) + id + length + instruction + address + data length + checksum
+SYNC_WRITE_OVERHEAD = 8
+
+MAX_POSITION = 4095
+# Bit 15 of GOAL_SPEED is the direction bit (sign-magnitude).
+MAX_SPEED = 0x7FFF
+
+
+def sync_write_wire_time(joints: int, baudrate: int) -> float:
+    """Seconds one SYNC WRITE move frame for ``joints`` servos occupies the bus."""
+    frame = SYNC_WRITE_OVERHEAD + SYNC_MOVE_BYTES_PER_JOINT * joints
+    return frame * BITS_PER_BYTE / baudrate
+
+
+def _cubic(tau: np.ndarray) -> np.ndarray:
+    # Smoothstep: zero velocity at both ends of every segment.
+    return tau * tau * (3.0 - 2.0 * tau)
+
+
+def _trapezoid(tau: np.ndarray, ramp: float) -> np.ndarray:
+    # Constant acceleration for `ramp`, cruise, then constant deceleration.
+    v_max = 1.0 / (1.0 - ramp)
+    accel = v_max * tau * tau / (2.0 * ramp)
+    cruise = v_max * (tau - ramp / 2.0)
+    decel = 1.0 - v_max * (1.0 - tau) ** 2 / (2.0 * ramp)
+    return np.where(tau < ramp, accel, np.where(tau > 1.0 - ramp, decel, cruise))
+
+
+@dataclass(frozen=True)
+class Trajectory:
+    """
+    Precomputed multi-joint setpoints, one row per tick.
+
+    ``positions`` and ``speeds`` have shape ``(ticks, joints)``; ``speeds[k]``
+    is the steps/s needed to move from setpoint ``k - 1`` to ``k`` within one
+    tick, and never 0, which STS servos take as "maximum speed".
+    """
+
+    servo_ids: tuple
+    rate: float
+    positions: np.ndarray
+    speeds: np.ndarray
+
+    @property
+    def ticks(self) -> int:
+        return len(self.positions)
+
+    @property
+    def duration(self) -> float:
+        return self.ticks / self.rate
+
+    @classmethod
+    def from_waypoints(
+        cls,
+        servo_ids: Sequence[int],
+        waypoints: Sequence[Sequence[int]],
+        times: Sequence[float],
+        *,
+        rate: float = 100.0,
+        profile: str = "trapezoid",
+        ramp: float = 0.25,
+    ) -> "Trajectory":
+        """
+        Interpolate ``waypoints`` (shape ``(n, joints)``) reached at ``times``.
+
+        ``profile`` is ``"trapezoid"`` (``ramp`` is the accelerating fraction
+        of each segment, < 0.5) or ``"cubic"``. All ticks are computed in one
+        vectorised pass.
+        """
+        points = np.asarray(waypoints, dtype=np.float64)
+        stamps = np.asarray(times, dtype=np.float64)
+
+        if points.ndim != 2 or points.shape[1] != len(servo_ids):
+            raise ValueError("waypoints must have shape (n, len(servo_ids))")
+        if len(stamps) != len(points) or len(points) < 2:
+            raise ValueError("need at least two waypoints with one time each")
+        if np.any(np.diff(stamps) <= 0):
+            raise ValueError("times must be strictly increasing")
+        if np.any(points < 0) or np.any(points > MAX_POSITION):
+            raise ValueError(f"positions must be in range 0..{MAX_POSITION}")
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if profile == "trapezoid" and not (0.0 < ramp < 0.5):
+            raise ValueError("ramp must be in (0, 0.5)")
+
+        # Round up so the last tick lands on the final waypoint even when the
+        # duration is not a whole number of periods; the epsilon keeps exact
+        # multiples from gaining a duplicate tick to float error.
+        ticks = int(np.ceil((stamps[-1] - stamps[0]) * rate - 1e-9)) + 1
+        t = np.minimum(stamps[0] + np.arange(ticks) / rate, stamps[-1])
+        segment = np.searchsorted(stamps, t, side="right") - 1
+        segment = np.clip(segment, 0, len(stamps) - 2)
+        t0 = stamps[segment]
+        tau = np.clip((t - t0) / (stamps[segment + 1] - t0), 0.0, 1.0)
+
+        if profile == "cubic":
+            blend = _cubic(tau)
+        elif profile == "trapezoid":
+            blend = _trapezoid(tau, ramp)
+        else:
+            raise ValueError(f"Unknown profile: {profile}")
+
+        start = points[segment]
+        positions = start + (points[segment + 1] - start) * blend[:, None]
+        positions = np.rint(positions).astype(np.uint16)
+
+        signed = positions.astype(np.int32)
+        # Backward difference: the speed sent with a setpoint is for the move
+        # the servo is about to make towards it.
+        step = np.abs(np.diff(signed, axis=0, prepend=signed[:1]))
+        speeds = np.clip(step * rate, 1, MAX_SPEED).astype(np.uint16)
+
+        return cls(tuple(servo_ids), float(rate), positions, speeds)
+
+
+@dataclass(frozen=True)
+class StreamReport:
+    ticks: int
+    period: float
+    missed_deadlines: int
+    jitter_mean: float
+    jitter_p99: float
+    jitter_max: float
+    wire_time_per_tick: float
+
+    @property
+    def bus_utilisation(self) -> float:
+        """Fraction of each tick the SYNC WRITE frame occupies on the wire."""
+        return self.wire_time_per_tick / self.period
+
+
+class TrajectoryStreamer:
+    """
+    Stream a ``Trajectory`` with one SYNC WRITE per tick on a deadline schedule.
+
+    Tick ``k`` is due at ``start + k / rate``. The streamer sleeps until
+    ``spin`` seconds before the deadline and busy-waits the rest for accuracy.
+    A tick sent more than ``tolerance`` after its deadline counts as missed;
+    when the loop falls a whole tick behind it skips ahead to the setpoint for
+    the current time rather than replaying stale ones.
+    """
+
+    def __init__(
+        self,
+        driver: ServoBusDriver,
+        *,
+        acc: int = 0,
+        spin: float = 0.0005,
+        tolerance: Optional[float] = None,
+    ):
+        self.driver = driver
+        self.acc = acc
+        self.spin = spin
+        self.tolerance = tolerance
+
+    def run(self, trajectory: Trajectory) -> StreamReport:
+        period = 1.0 / trajectory.rate
+        tolerance = period / 2 if self.tolerance is None else self.tolerance
+        baudrate = getattr(self.driver.transport, "baudrate", None)
+
+        ids = trajectory.servo_ids
+        positions = trajectory.positions.tolist()
+        speeds = trajectory.speeds.tolist()
+        jitter = np.zeros(trajectory.ticks)
+        sent = 0
+        missed = 0
+
+        start = time.monotonic()
+        k = 0
+        while k < trajectory.ticks:
+            deadline = start + k * period
+            self._wait_until(deadline)
+
+            now = time.monotonic()
+            lateness = now - deadline
+            if lateness > tolerance:
+                missed += 1
+            if lateness >= period:
+                # Skip stale setpoints: jump to the one due now.
+                k = min(int((now - start) / period), trajectory.ticks - 1)
+
+            self.driver.go_to_positions(
+                {
+                    servo_id: (position, speed, self.acc)
+                    for servo_id, position, speed in zip(ids, positions[k], speeds[k])
+                }
+            )
+            jitter[sent] = lateness
+            sent += 1
+            k += 1
+
+        jitter = jitter[:sent]
+        wire = sync_write_wire_time(len(ids), baudrate) if baudrate else 0.0
+        return StreamReport(
+            ticks=sent,
+            period=period,
+            missed_deadlines=missed,
+            jitter_mean=float(jitter.mean()) if sent else 0.0,
+            jitter_p99=float(np.percentile(jitter, 99)) if sent else 0.0,
+            jitter_max=float(jitter.max()) if sent else 0.0,
+            wire_time_per_tick=wire,
+        )
+
+    def _wait_until(self, deadline: float):
+        remaining = deadline - time.monotonic()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.monotonic() < deadline:
+            pass
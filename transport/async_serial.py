@@ -0,0 +1,83 @@
+import asyncio
+from typing import Callable, Optional
+
+from .serial import SerialConfiguration, SerialTransport
+
+
+class AsyncSerialTransport:
+    """
+    asyncio front-end for ``SerialTransport``.
+
+    The port's file descriptor is registered with ``loop.add_reader`` so
+    incoming bytes are pushed to the receiver callback from the event loop
+    itself, without a helper thread. ``send`` never blocks the loop either:
+    bytes the OS TX buffer cannot take yet are queued and flushed from a
+    ``loop.add_writer`` callback, in order. Requires a selector-based event
+    loop (POSIX); the Windows proactor loop cannot watch serial handles.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = SerialConfiguration.BAUD_1_000_000,
+        *,
+        transport: Optional[SerialTransport] = None,
+    ):
+        self._transport = transport or SerialTransport(port=port, baudrate=baudrate)
+        self._receiver: Optional[Callable[[bytes], None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._fd: Optional[int] = None
+        self._outbox = bytearray()
+
+    def set_receiver(self, receiver: Optional[Callable[[bytes], None]]):
+        self._receiver = receiver
+
+    async def open(self):
+        if self._fd is not None:
+            return
+
+        self._transport.open()
+        self._loop = asyncio.get_running_loop()
+        self._fd = self._transport.fileno()
+        self._loop.add_reader(self._fd, self._on_readable)
+
+    async def close(self):
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            if self._outbox:
+                self._loop.remove_writer(self._fd)
+                self._outbox.clear()
+            self._fd = None
+        self._transport.close()
+
+    @property
+    def pending_output(self) -> int:
+        """Bytes accepted by ``send`` but not yet handed to the OS."""
+        return len(self._outbox)
+
+    def send(self, data: bytes):
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError("Data must be bytes")
+        if self._fd is None:
+            raise RuntimeError("Transport is not open")
+
+        if self._outbox:
+            # Keep frames in order behind bytes still waiting for the port.
+            self._outbox += data
+            return
+
+        sent = self._transport.send_nowait(data)
+        if sent < len(data):
+            self._outbox += data[sent:]
+            self._loop.add_writer(self._fd, self._on_writable)
+
+    def _on_writable(self):
+        sent = self._transport.send_nowait(self._outbox)
+        del self._outbox[:sent]
+        if not self._outbox:
+            self._loop.remove_writer(self._fd)
+
+    def _on_readable(self):
+        data = self._transport.receive_nowait()
+        if data and self._receiver is not None:
+            self._receiver(data)
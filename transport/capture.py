@@ -0,0 +1,245 @@
+import enum
+import mmap
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from protocol.deserializer import PacketDeserializer
+from protocol.protocol import ServoPacket
+
+# File header: magic, wall-clock start (time_ns).
+MAGIC = b"SCSCAP\x01\x00"
+FILE_HEADER = struct.Struct("<8sQ")
+# Record header: ns since capture start, direction, payload length.
+RECORD_HEADER = struct.Struct("<QBH")
+MAX_CHUNK = 0xFFFF
+# Replay accepts any length the one-byte LENGTH field can hold: captured
+# SYNC WRITE / SYNC READ requests easily exceed the driver's reply limit.
+REPLAY_MAX_FRAME_LENGTH = 0xFF
+
+
+class CaptureFormatError(Exception):
+    pass
+
+
+class Direction(enum.IntEnum):
+    TX = 0  # host -> bus
+    RX = 1  # bus -> host
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRecord:
+    timestamp_ns: int
+    direction: Direction
+    data: memoryview
+
+
+class CaptureWriter:
+    """
+    Append-only binary log of raw bus chunks.
+
+    Each record is an 11-byte header (``RECORD_HEADER``) followed by the
+    bytes exactly as they were written to or read from the port. Timestamps
+    are ``time.monotonic_ns()`` offsets from the start of the capture; the
+    wall-clock start is kept in the file header.
+    """
+
+    def __init__(self, path: str, *, buffering: int = 1 << 16):
+        self._file: BinaryIO = open(path, "wb", buffering=buffering)
+        self._start_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+        self._file.write(FILE_HEADER.pack(MAGIC, time.time_ns()))
+
+    def write(self, direction: Direction, data: bytes):
+        offset = time.monotonic_ns() - self._start_ns
+        with self._lock:
+            for pos in range(0, len(data), MAX_CHUNK):
+                chunk = data[pos : pos + MAX_CHUNK]
+                self._file.write(RECORD_HEADER.pack(offset, direction, len(chunk)))
+                self._file.write(chunk)
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class CaptureTransport:
+    """
+    Transport wrapper that logs every chunk sent or received to a capture.
+
+    Wraps ``SerialTransport`` (or anything with the same interface); other
+    attributes are forwarded to the wrapped transport. Empty reads are not
+    logged.
+    """
+
+    def __init__(self, transport, writer: Union[CaptureWriter, str]):
+        self.transport = transport
+        self.writer = CaptureWriter(writer) if isinstance(writer, str) else writer
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        self.transport.open()
+
+    def close(self):
+        self.transport.close()
+        self.writer.close()
+
+    def send(self, data: bytes):
+        self.transport.send(data)
+        self.writer.write(Direction.TX, data)
+
+    def send_nowait(self, data: bytes) -> int:
+        # Only the bytes the port accepted; the caller resends the rest.
+        sent = self.transport.send_nowait(data)
+        if sent:
+            self.writer.write(Direction.TX, bytes(data[:sent]))
+        return sent
+
+    def receive(self, max_bytes: int = 64) -> bytes:
+        return self._logged(self.transport.receive(max_bytes))
+
+    def receive_exact(self, size: int, timeout: float) -> bytes:
+        return self._logged(self.transport.receive_exact(size, timeout))
+
+    def receive_nowait(self, max_bytes: int = 4096) -> bytes:
+        return self._logged(self.transport.receive_nowait(max_bytes))
+
+    def _logged(self, data: bytes) -> bytes:
+        if data:
+            self.writer.write(Direction.RX, data)
+        return data
+
+
+class CaptureReader:
+    """
+    Memory-mapped reader for ``CaptureWriter`` logs.
+
+    Records are parsed straight out of the mapping, so nothing is copied
+    until a chunk is handed to the deserializer; ``CaptureRecord.data`` is a
+    view into the map and must be released before ``close()``.
+
+    ``packets()`` replays one direction through a ``PacketDeserializer`` as
+    fast as possible, or at the recorded pace when ``pace`` is given (2.0 =
+    twice real time). ``packet_batches()`` trades timestamps for throughput.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise CaptureFormatError(f"Empty capture file: {path}") from None
+
+        if len(self._map) < FILE_HEADER.size:
+            self.close()
+            raise CaptureFormatError(f"Truncated capture header: {path}")
+        magic, self.start_time_ns = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise CaptureFormatError(f"Not a capture file: {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        # Raises BufferError while record views are still alive.
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def records(self) -> Iterator[CaptureRecord]:
+        """All records in order. A record cut short at the end is ignored."""
+        view = memoryview(self._map)
+        for offset, direction, start, end in self._scan():
+            yield CaptureRecord(offset, Direction(direction), view[start:end])
+
+    def packets(
+        self,
+        direction: Direction = Direction.RX,
+        *,
+        pace: Optional[float] = None,
+        deserializer: Optional[PacketDeserializer] = None,
+    ) -> Iterator[Tuple[int, ServoPacket]]:
+        """
+        Yield ``(timestamp_ns, packet)`` for every frame sent in ``direction``.
+
+        The timestamp is that of the chunk that completed the frame.
+        """
+        deserializer = deserializer or PacketDeserializer(
+            max_frame_length=REPLAY_MAX_FRAME_LENGTH
+        )
+        view = memoryview(self._map)
+        wall_start = time.monotonic_ns()
+
+        for offset, record_direction, start, end in self._scan():
+            if record_direction != direction:
+                continue
+            if pace is not None:
+                delay = offset / pace - (time.monotonic_ns() - wall_start)
+                if delay > 0:
+                    time.sleep(delay / 1e9)
+            for packet in deserializer.feed(view[start:end]):
+                yield offset, packet
+
+    def packet_batches(
+        self,
+        direction: Direction = Direction.RX,
+        *,
+        block_size: int = 1 << 20,
+    ) -> Iterator[List[ServoPacket]]:
+        """
+        Bulk replay without timestamps: frames in ``direction``, in batches.
+
+        Chunks are joined into ``block_size`` blocks before scanning, so the
+        per-chunk cost is a slice and a memcpy rather than a deserializer call.
+        """
+        deserializer = PacketDeserializer(max_frame_length=REPLAY_MAX_FRAME_LENGTH)
+        view = memoryview(self._map)
+        block = bytearray()
+
+        for _, record_direction, start, end in self._scan():
+            if record_direction != direction:
+                continue
+            block += view[start:end]
+            if len(block) >= block_size:
+                yield deserializer.feed(block)
+                block = bytearray()
+
+        if block:
+            yield deserializer.feed(block)
+
+    def _scan(self) -> Iterator[Tuple[int, int, int, int]]:
+        data = self._map
+        size = len(data)
+        unpack = RECORD_HEADER.unpack_from
+        header = RECORD_HEADER.size
+        pos = FILE_HEADER.size
+
+        while pos + header <= size:
+            offset, direction, length = unpack(data, pos)
+            start = pos + header
+            end = start + length
+            if end > size:
+                return
+            yield offset, direction, start, end
+            pos = end
@@ -1,5 +1,7 @@
 import serial
 import enum
+import os
+import time
 
 
 class SerialConfigurationError(Exception):
@@ -16,6 +18,19 @@ class SerialConfiguration(enum.IntEnum):
     BAUD_2_000_000 = 2000000
 
 
+# Auto-baud probe order: the factory default, the usual compatibility rate,
+# then the remaining rates from the cheapest (fastest) probe to the slowest.
+AUTOBAUD_ORDER = (
+    SerialConfiguration.BAUD_1_000_000,
+    SerialConfiguration.BAUD_115200,
+    SerialConfiguration.BAUD_2_000_000,
+    SerialConfiguration.BAUD_500_000,
+    SerialConfiguration.BAUD_250_000,
+    SerialConfiguration.BAUD_57600,
+    SerialConfiguration.BAUD_9600,
+)
+
+
 class SerialTransport:
     def __init__(
         self,
@@ -28,6 +43,7 @@ class SerialTransport:
         stopbits=serial.STOPBITS_ONE,
     ):
         self._validate_config(port, baudrate, timeout)
+        self._timeout = timeout
 
         try:
             self._serial = serial.Serial(
@@ -50,6 +66,23 @@ class SerialTransport:
     def __exit__(self, exc_type, exc, tb):
         self.close()
 
+    @property
+    def baudrate(self) -> int:
+        return self._serial.baudrate
+
+    def set_baudrate(self, baudrate: int):
+        """
+        Switch the line rate of the open port in place.
+
+        pyserial reconfigures the device without closing it. Bytes received
+        at the old rate are discarded.
+        """
+        self._validate_baudrate(baudrate)
+        if self._serial.baudrate != baudrate:
+            self._serial.baudrate = baudrate
+        if self._serial.is_open:
+            self._serial.reset_input_buffer()
+
     def open(self):
         if not self._serial.is_open:
             self._serial.open()
@@ -65,19 +98,76 @@ class SerialTransport:
         self._serial.write(data)
 
     def receive(self, max_bytes: int = 64) -> bytes:
+        self._set_read_timeout(self._timeout)
         waiting = self._serial.in_waiting
         size = min(waiting, max_bytes) if waiting else 1
         return self._serial.read(size)
 
+    def receive_exact(self, size: int, timeout: float) -> bytes:
+        """
+        Block until ``size`` bytes arrived or ``timeout`` seconds elapsed.
+
+        The wait happens inside the serial driver, so no CPU is spent polling.
+        Returns fewer than ``size`` bytes on timeout.
+
+        Each blocking read waits at most the port timeout (no cap when it is
+        0), cut to whole milliseconds of the time left, so calls with similar
+        deadlines reuse the port setting instead of reconfiguring the port
+        every time.
+        """
+        deadline = time.monotonic() + max(timeout, 0.0)
+        data = b""
+        while len(data) < size:
+            remaining = int((deadline - time.monotonic()) * 1000) / 1000
+            step = min(self._timeout, remaining) if self._timeout else remaining
+            if step <= 0:
+                # Under a millisecond left: take what is buffered, don't block.
+                return data + self.receive_nowait(size - len(data))
+            self._set_read_timeout(step)
+            data += self._serial.read(size - len(data))
+        return data
+
+    def receive_nowait(self, max_bytes: int = 4096) -> bytes:
+        """Return whatever is already buffered by the driver without blocking."""
+        waiting = self._serial.in_waiting
+        if not waiting:
+            return b""
+        return self._serial.read(min(waiting, max_bytes))
+
+    def send_nowait(self, data: bytes) -> int:
+        """
+        Write as much of ``data`` as the OS accepts without blocking (POSIX).
+
+        Returns the number of bytes written, 0 when the TX buffer is full.
+        pyserial opens the port non-blocking, so this is a plain ``os.write``.
+        """
+        try:
+            return os.write(self._serial.fileno(), data)
+        except BlockingIOError:
+            return 0
+
+    def fileno(self) -> int:
+        """OS file descriptor of the open port (POSIX only)."""
+        return self._serial.fileno()
+
+    def _set_read_timeout(self, timeout: float):
+        # Reconfiguring the port is a syscall; skip it when nothing changes.
+        if self._serial.timeout != timeout:
+            self._serial.timeout = timeout
+
     @staticmethod
     def _validate_config(port, baudrate, timeout):
         if not isinstance(port, str):
             raise SerialConfigurationError("port must be a string")
 
+        SerialTransport._validate_baudrate(baudrate)
+
+        if timeout is None or timeout < 0:
+            raise SerialConfigurationError("timeout must be >= 0")
+
+    @staticmethod
+    def _validate_baudrate(baudrate):
         try:
             SerialConfiguration(baudrate)
         except Exception as exc:
             raise SerialConfigurationError(f"Unsupported baudrate: {baudrate}") from exc
-
-        if timeout is None or timeout < 0:
-            raise SerialConfigurationError("timeout must be >= 0")
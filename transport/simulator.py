@@ -0,0 +1,346 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from protocol.deserializer import PacketDeserializer
+from protocol.protocol import (
+    BAUD_RATE_CODES,
+    DeviceID,
+    Instruction,
+    SCSRegister,
+    ServoPacket,
+)
+
+from .serial import SerialConfiguration
+
+# 1 start bit + 8 data bits + 1 stop bit
+BITS_PER_BYTE = 10
+
+
+@dataclass
+class FaultInjection:
+    """
+    Per-reply fault probabilities, drawn from a seeded RNG for repeatability.
+
+    ``drop_byte_rate`` applies to every reply byte, the other rates to whole
+    replies. Late replies are delayed by an extra ``late_reply_delay`` seconds.
+    """
+
+    drop_byte_rate: float = 0.0
+    corrupt_checksum_rate: float = 0.0
+    late_reply_rate: float = 0.0
+    late_reply_delay: float = 0.05
+    seed: int = 0
+
+
+@dataclass
+class SimulatorStats:
+    tx_bytes: int = 0
+    rx_bytes: int = 0
+    requests: int = 0
+    replies: int = 0
+    dropped_bytes: int = 0
+    corrupted_replies: int = 0
+    late_replies: int = 0
+
+
+class VirtualServo:
+    """
+    A servo with a full 256-byte register file laid out per ``SCSRegister``.
+
+    ``baudrate`` is the line rate the servo listens on; ``None`` adopts the
+    transport's rate. Writing a known code to BAUD_RATE switches it.
+    """
+
+    REGISTER_FILE_SIZE = 256
+
+    def __init__(
+        self,
+        servo_id: int,
+        *,
+        model: int = 0,
+        position: int = 2048,
+        voltage: float = 12.0,
+        temperature: int = 30,
+        baudrate: Optional[int] = None,
+    ):
+        self.registers = bytearray(self.REGISTER_FILE_SIZE)
+        self.pending_write: Optional[Tuple[int, bytes]] = None
+        self.baudrate: Optional[int] = None
+        if baudrate is not None:
+            self.set_baudrate(baudrate)
+
+        self.write_u16(SCSRegister.MODEL_L, model)
+        self.registers[SCSRegister.ID] = servo_id
+        self.write_u16(SCSRegister.MAX_ANGLE_LIMIT_L, 4095)
+        self.write_u16(SCSRegister.GOAL_POSITION_L, position)
+        self.write_u16(SCSRegister.PRESENT_POSITION_L, position)
+        self.registers[SCSRegister.PRESENT_VOLTAGE] = round(voltage * 10)
+        self.registers[SCSRegister.PRESENT_TEMPERATURE] = temperature
+
+    @property
+    def servo_id(self) -> int:
+        return self.registers[SCSRegister.ID]
+
+    def set_baudrate(self, baudrate: int):
+        """Listen on ``baudrate``, keeping the BAUD_RATE register in step."""
+        self.baudrate = baudrate
+        for code, rate in BAUD_RATE_CODES.items():
+            if rate == baudrate:
+                self.registers[SCSRegister.BAUD_RATE] = code
+
+    def write_u16(self, address: int, value: int):
+        self.registers[address : address + 2] = (value & 0xFFFF).to_bytes(2, "little")
+
+    def read(self, address: int, size: int) -> bytes:
+        return bytes(self.registers[address : address + size])
+
+    def write(self, address: int, data: bytes):
+        # Bytes past the end of the register file are dropped, as on a servo.
+        data = data[: max(self.REGISTER_FILE_SIZE - address, 0)]
+        self.registers[address : address + len(data)] = data
+        goal = SCSRegister.GOAL_POSITION_L
+        if address <= goal + 1 and address + len(data) > goal:
+            # Motion is not modelled: the servo arrives instantly.
+            self.write_u16(SCSRegister.PRESENT_POSITION_L, self.read_u16(goal))
+        baud = SCSRegister.BAUD_RATE
+        if address <= baud < address + len(data):
+            self.baudrate = BAUD_RATE_CODES.get(self.registers[baud], self.baudrate)
+
+    def read_u16(self, address: int) -> int:
+        return int.from_bytes(self.registers[address : address + 2], "little")
+
+
+class SimulatedTransport:
+    """
+    Drop-in replacement for ``SerialTransport`` hosting virtual servos.
+
+    Requests are parsed with ``PacketDeserializer`` and answered with correctly
+    checksummed status frames. With ``realtime=True`` every frame occupies the
+    half-duplex wire for ``len * 10 / baudrate`` seconds and each servo waits
+    ``return_delay`` seconds before answering, so reads block like a real port.
+    With ``realtime=False`` replies are available immediately, except late
+    replies (``FaultInjection.late_reply_rate``), which still arrive
+    ``late_reply_delay`` seconds after the request.
+
+    ``host_latency`` delays every reply by that much after it leaves the
+    wire, like a USB-serial adapter's latency timer.
+
+    Servos only hear requests sent at their own ``baudrate``.
+    """
+
+    def __init__(
+        self,
+        servos: Iterable[Union[int, VirtualServo]] = (1,),
+        *,
+        baudrate: int = SerialConfiguration.BAUD_1_000_000,
+        return_delay: float = 20e-6,
+        host_latency: float = 0.0,
+        timeout: float = 0.01,
+        faults: Optional[FaultInjection] = None,
+        realtime: bool = True,
+    ):
+        self.baudrate = baudrate
+        self.servos: Dict[int, VirtualServo] = {}
+        for servo in servos:
+            if not isinstance(servo, VirtualServo):
+                servo = VirtualServo(servo)
+            if servo.baudrate is None:
+                servo.set_baudrate(baudrate)
+            self.servos[servo.servo_id] = servo
+
+        self.return_delay = return_delay
+        self.host_latency = host_latency
+        self.faults = faults
+        self.realtime = realtime
+        self.stats = SimulatorStats()
+
+        self._timeout = timeout
+        self._rng = random.Random(faults.seed if faults else 0)
+        self._parser = PacketDeserializer(max_frame_length=0xFF)
+        # (arrival time, bytes) of replies still travelling on the wire
+        self._inbound: Deque[Tuple[float, bytes]] = deque()
+        self._buffer = bytearray()
+        self._wire_free_at = 0.0
+        self._cond = threading.Condition()
+        self._is_open = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def open(self):
+        self._is_open = True
+
+    def close(self):
+        self._is_open = False
+
+    def byte_time(self) -> float:
+        return BITS_PER_BYTE / self.baudrate
+
+    def set_baudrate(self, baudrate: int):
+        """Switch the host side line rate; replies still in flight are lost."""
+        with self._cond:
+            self.baudrate = baudrate
+            self._inbound.clear()
+            self._buffer.clear()
+            self._parser.reset()
+
+    def send(self, data: bytes):
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError("Data must be bytes")
+
+        with self._cond:
+            self.stats.tx_bytes += len(data)
+            now = time.monotonic()
+            tx_end = max(now, self._wire_free_at) + len(data) * self.byte_time()
+            self._wire_free_at = tx_end
+
+            for request in self._parser.feed(bytes(data)):
+                self.stats.requests += 1
+                for reply in self._handle(request):
+                    self._schedule_reply(reply)
+
+            self._cond.notify_all()
+
+    def receive(self, max_bytes: int = 64) -> bytes:
+        with self._cond:
+            self._wait_for(1, self._timeout)
+            return self._take(max_bytes)
+
+    def receive_exact(self, size: int, timeout: float) -> bytes:
+        with self._cond:
+            self._wait_for(size, timeout)
+            return self._take(size)
+
+    def receive_nowait(self, max_bytes: int = 4096) -> bytes:
+        with self._cond:
+            self._collect(time.monotonic())
+            return self._take(max_bytes)
+
+    def _wait_for(self, size: int, timeout: float):
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while True:
+            now = time.monotonic()
+            self._collect(now)
+            if len(self._buffer) >= size or now >= deadline:
+                return
+
+            wake = deadline
+            if self._inbound:
+                wake = min(wake, self._inbound[0][0])
+            self._cond.wait(max(wake - now, 0.0))
+
+    def _collect(self, now: float):
+        while self._inbound and self._inbound[0][0] <= now:
+            _, chunk = self._inbound.popleft()
+            self._buffer += chunk
+
+    def _take(self, size: int) -> bytes:
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.stats.rx_bytes += len(chunk)
+        return chunk
+
+    def _schedule_reply(self, frame: bytes):
+        self.stats.replies += 1
+        delay = self.return_delay
+        late = 0.0
+        faults = self.faults
+
+        if faults is not None:
+            if self._rng.random() < faults.corrupt_checksum_rate:
+                frame = frame[:-1] + bytes([frame[-1] ^ 0xFF])
+                self.stats.corrupted_replies += 1
+            if self._rng.random() < faults.late_reply_rate:
+                late = faults.late_reply_delay
+                self.stats.late_replies += 1
+            if faults.drop_byte_rate:
+                kept = bytes(
+                    b for b in frame if self._rng.random() >= faults.drop_byte_rate
+                )
+                self.stats.dropped_bytes += len(frame) - len(kept)
+                frame = kept
+
+        if not self.realtime:
+            # Replies leave in order: one queued behind a late reply waits too.
+            lag = late + self.host_latency
+            arrival = time.monotonic() + lag if lag else 0.0
+            self._inbound.append((arrival, frame))
+            return
+
+        start = self._wire_free_at + delay + late
+        end = start + len(frame) * self.byte_time()
+        self._wire_free_at = end
+        self._inbound.append((end + self.host_latency, frame))
+
+    def _handle(self, request: ServoPacket) -> List[bytes]:
+        params = bytes(request.params)
+        instruction = request.instruction
+        broadcast = request.servo_id == DeviceID.BROADCAST
+        # Servos at another rate only see line noise.
+        listening = {
+            servo_id: servo
+            for servo_id, servo in self.servos.items()
+            if servo.baudrate == self.baudrate
+        }
+
+        if instruction == Instruction.SYNC_WRITE:
+            address, size = params[0], params[1]
+            for i in range(2, len(params), size + 1):
+                servo = listening.get(params[i])
+                if servo is not None:
+                    servo.write(address, params[i + 1 : i + 1 + size])
+            return []
+
+        if instruction == Instruction.SYNC_READ:
+            address, size = params[0], params[1]
+            servos = [listening[i] for i in params[2:] if i in listening]
+            return [self._status(servo, servo.read(address, size)) for servo in servos]
+
+        targets = list(listening.values()) if broadcast else []
+        if not broadcast and request.servo_id in listening:
+            targets = [listening[request.servo_id]]
+
+        replies = []
+        for servo in targets:
+            payload = self._execute(servo, instruction, params)
+            if payload is not None and not broadcast:
+                replies.append(self._status(servo, payload))
+        return replies
+
+    @staticmethod
+    def _execute(
+        servo: VirtualServo, instruction: int, params: bytes
+    ) -> Optional[bytes]:
+        if instruction == Instruction.PING:
+            return b""
+        if instruction == Instruction.READ:
+            return servo.read(params[0], params[1])
+        if instruction == Instruction.WRITE:
+            servo.write(params[0], params[1:])
+            return b""
+        if instruction == Instruction.REG_WRITE:
+            servo.pending_write = (params[0], params[1:])
+            return b""
+        if instruction == Instruction.ACTION:
+            if servo.pending_write is not None:
+                servo.write(*servo.pending_write)
+                servo.pending_write = None
+            return b""
+        return None
+
+    @staticmethod
+    def _status(servo: VirtualServo, payload: bytes, error: int = 0) -> bytes:
+        body = bytes([servo.servo_id, len(payload) + 2, error]) + payload
+        return b"\xff\xff" + body + bytes([(~sum(body)) & 0xFF])